@@ -1,6 +1,7 @@
 # pylint: disable=line-too-long
 
-from responsibly import fairness, we
+import importlib
+import sys
 
 
 __project__ = 'responsibly'
@@ -13,3 +14,28 @@ __license__ = 'MIT'
 __copyright__ = 'Copyright 2018 Shlomi Hod'
 
 VERSION = "{0} v{1}".format(__project__, __version__)
+
+_LAZY_SUBPACKAGES = ['fairness', 'we']
+
+
+def __getattr__(name):
+    """Import the subpackages lazily on their first access (PEP 562).
+
+    The subpackages depend on heavy libraries (e.g., gensim and sklearn),
+    so ``import responsibly`` stays fast for using only one of them.
+    """
+
+    if name in _LAZY_SUBPACKAGES:
+        return importlib.import_module('.' + name, __name__)
+
+    raise AttributeError('module {!r} has no attribute {!r}'
+                         .format(__name__, name))
+
+
+def __dir__():
+    return sorted(list(globals()) + _LAZY_SUBPACKAGES)
+
+
+# a module __getattr__ (PEP 562) is supported only since Python 3.7
+if sys.version_info < (3, 7):
+    from responsibly import fairness, we  # pylint: disable=wrong-import-position
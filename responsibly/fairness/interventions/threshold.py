@@ -32,11 +32,8 @@ References:
 
 from collections import Counter
 
-import matplotlib.pylab as plt
 import numpy as np
 import pandas as pd
-import seaborn as sns
-from matplotlib.ticker import AutoMinorLocator
 from scipy.spatial import Delaunay
 
 from responsibly.fairness.metrics.score import roc_curve_by_attr
@@ -625,6 +622,9 @@ def plot_roc_curves_thresholds(roc_curves, thresholds_data,
 
     """
 
+    # pylint: disable=import-outside-toplevel
+    import matplotlib.pylab as plt
+
     ax = plot_roc_curves(roc_curves, aucs,
                          title, ax, figsize, title_fontsize, text_fontsize)
 
@@ -668,6 +668,9 @@ def plot_fpt_tpr(roc_curves,
 
     """
 
+    # pylint: disable=import-outside-toplevel
+    import matplotlib.pylab as plt
+
     if ax is None:
         fig, ax = plt.subplots(1, 1, figsize=figsize)  # pylint: disable=unused-variable
 
@@ -722,6 +725,9 @@ def plot_costs(thresholds_data,
     :rtype: :class:`matplotlib.axes.Axes`
     """
 
+    # pylint: disable=import-outside-toplevel
+    import matplotlib.pylab as plt
+
     if ax is None:
         fig, ax = plt.subplots(1, 1, figsize=figsize)  # pylint: disable=unused-variable
 
@@ -773,6 +779,11 @@ def plot_thresholds(thresholds_data,
     :rtype: :class:`matplotlib.axes.Axes`
     """
 
+    # pylint: disable=import-outside-toplevel
+    import matplotlib.pylab as plt
+    import seaborn as sns
+    from matplotlib.ticker import AutoMinorLocator
+
     if ax is None:
         fig, ax = plt.subplots(1, 1, figsize=figsize)  # pylint: disable=unused-variable
 
@@ -1,8 +1,5 @@
 from collections import defaultdict
 
-import seaborn as sns
-from matplotlib import pylab as plt
-
 from responsibly.fairness.metrics.score import (
     roc_auc_score_by_attr, roc_curve_by_attr,
 )
@@ -20,6 +17,10 @@ def distplot_by(a, by, bins=None, hist=True, kde=True, rug=False,
                 fit_kws=None, vertical=False, norm_hist=False,
                 ax=None):
 
+    # pylint: disable=import-outside-toplevel,too-many-locals
+    import seaborn as sns
+    from matplotlib import pylab as plt
+
     axes = [sns.distplot(a_group,
                          bins=bins, hist=hist, kde=kde, rug=rug,
                          fit=fit, hist_kws=hist_kws, kde_kws=kde_kws,
@@ -61,6 +62,9 @@ def plot_roc_curves(roc_curves, aucs=None,
 
     """
 
+    # pylint: disable=import-outside-toplevel
+    from matplotlib import pylab as plt
+
     if ax is None:
         fig, ax = plt.subplots(1, 1, figsize=figsize)  # pylint: disable=unused-variable
 
@@ -1,23 +1,43 @@
 """Unit test module for responsibly.we"""
-# pylint: disable=redefined-outer-name,unused-variable,expression-not-assigned,singleton-comparison,protected-access
+# pylint: disable=redefined-outer-name,unused-variable,expression-not-assigned,singleton-comparison,protected-access,no-name-in-module,too-many-lines
 
 import copy
 from math import isclose
 
 import numpy as np
 import pytest
+from scipy.stats import pearsonr, rankdata, spearmanr
+from sklearn.decomposition import PCA
+from sklearn.metrics.pairwise import euclidean_distances
 
 from responsibly.consts import RANDOM_STATE
 from responsibly.tests.data import TOLGA_GENDER_ANALOGIES
 from responsibly.tests.utils import assert_deep_almost_equal
 from responsibly.we import (
-    GenderBiasWE, calc_all_weat, calc_weat_pleasant_unpleasant_attribute,
+    GenderBiasWE, IVFIndexer, NeutralizedKeyedVectors, audit_word_embeddings,
+    bias as bias_module, calc_all_weat, calc_all_weat_models,
+    calc_weat_pleasant_unpleasant_attribute,
+)
+from responsibly.we.benchmark import (
+    PAIR_WORDS_BOOTSTRAP_FIELDS, PAIR_WORDS_EVALUATION_FIELDS,
+    WORD_PAIRS_TASKS, _bootstrap_correlations, _evaluate_word_analogies_task,
+    _get_data_resource_path, _get_vocabulary_cache, _rank_rows,
+    evaluate_word_analogies, evaluate_word_pairs,
+)
+from responsibly.we.bias import (
+    _DIRECTIONS_CACHE, BiasWordEmbedding, _batch_disjoint_sets,
+    _generate_analogies_candidates,
+)
+from responsibly.we.data import (
+    WEAT_DATA, _load_w2v_small_cache, _parse_w2v_small, get_bolukbasi_data,
+    load_w2v_small,
 )
-from responsibly.we.data import WEAT_DATA, load_w2v_small
 from responsibly.we.utils import (
-    most_similar, normalize, project_params, project_reject_vector,
-    project_vector,
+    bump_model_version, copy_model_vectors, most_similar, most_similar_batch,
+    normalize, normalize_model_vectors, project_params, project_reject_vector,
+    project_vector, update_word_vector,
 )
+from responsibly.we.weat import _calc_weat_pvalue
 
 
 ATOL = 1e-6
@@ -52,6 +72,103 @@ def test_identify_direction_sum(w2v_small):
                       identify_direction='sum')
 
 
+def test_identify_subspace_by_pca(gender_biased_w2v_small):
+    definitional_pairs = gender_biased_w2v_small._data['definitional_pairs']
+
+    matrix = []
+    for word1, word2 in definitional_pairs:
+        vector1 = normalize(gender_biased_w2v_small[word1])
+        vector2 = normalize(gender_biased_w2v_small[word2])
+        center = (vector1 + vector2) / 2
+        matrix.extend([vector1 - center, vector2 - center])
+
+    pca = PCA(n_components=10).fit(matrix)
+
+    subspace = gender_biased_w2v_small._identify_subspace_by_pca(definitional_pairs,  # pylint: disable=C0301
+                                                                 10)
+
+    np.testing.assert_allclose(subspace.explained_variance_ratio_,
+                               pca.explained_variance_ratio_, atol=ATOL)
+    np.testing.assert_allclose(np.abs(subspace.components_[0]
+                                      @ pca.components_[0]),
+                               1, atol=ATOL)
+
+
+def test_identify_direction_cache(w2v_small):
+    gb = GenderBiasWE(w2v_small, only_lower=True)
+    (cached_vectors, cached_direction), = _DIRECTIONS_CACHE[w2v_small].values()
+    np.testing.assert_array_equal(cached_direction, gb.direction)
+
+    gb_cached = GenderBiasWE(w2v_small, only_lower=True)
+    np.testing.assert_array_equal(gb_cached.direction, gb.direction)
+    (vectors, _), = _DIRECTIONS_CACHE[w2v_small].values()
+    assert vectors is cached_vectors
+
+    # the cached direction is invalidated after the model is changed,
+    # even directly, without the update functions of `utils`
+    w2v_small.vectors[w2v_small.vocab['she'].index] = w2v_small['queen']
+
+    gb_changed = GenderBiasWE(w2v_small, only_lower=True)
+    (vectors, direction), = _DIRECTIONS_CACHE[w2v_small].values()
+    assert vectors is not cached_vectors
+    np.testing.assert_array_equal(direction, gb_changed.direction)
+    assert not np.allclose(gb_changed.direction, gb.direction)
+
+
+def test_normalized_vectors_cache(w2v_small):
+    bwe = BiasWordEmbedding(w2v_small, to_normalize=False)
+    assert w2v_small.vectors_norm is None
+
+    # only the requested prefix of the vocabulary is normalized
+    prefix_vectors = bwe._get_normalized_matrix(100)
+    assert len(prefix_vectors) == 100
+    assert len(bwe._normalized_vectors_cache[3]) == 100
+    np.testing.assert_array_equal(bwe._get_normalized_matrix(10),
+                                  prefix_vectors[:10])
+
+    bwe.clear_normalized_vectors_cache()
+    assert bwe._normalized_vectors_cache is None
+
+    normalized_vectors = bwe._get_normalized_matrix()
+    assert bwe._get_normalized_matrix() is normalized_vectors
+    assert w2v_small.vectors_norm is None
+
+    index = w2v_small.vocab['nurse'].index
+    np.testing.assert_allclose(normalized_vectors[index],
+                               normalize(w2v_small['nurse']),
+                               rtol=1e-5)
+    np.testing.assert_array_equal(bwe._get_normalized_vectors([index]),
+                                  normalized_vectors[[index]])
+
+    # the cache is invalidated after the model is changed
+    update_word_vector(w2v_small, 'nurse', w2v_small['doctor'])
+    np.testing.assert_allclose(bwe._get_normalized_vectors([index])[0],
+                               normalize(w2v_small['doctor']),
+                               rtol=1e-5)
+    assert bwe._get_normalized_matrix() is not normalized_vectors
+
+    # the cache is invalidated after the vectors array is replaced
+    normalized_vectors = bwe._get_normalized_matrix()
+    w2v_small.vectors = w2v_small.vectors.copy()
+    w2v_small.vectors[index] = w2v_small['teacher']
+    np.testing.assert_allclose(bwe._get_normalized_matrix()[index],
+                               normalize(w2v_small['teacher']),
+                               rtol=1e-5)
+
+    # a direct write is detected only after the version is bumped
+    normalized_vectors = bwe._get_normalized_matrix()
+    w2v_small.vectors[index] = w2v_small['doctor']
+    assert bwe._get_normalized_matrix() is normalized_vectors
+    bump_model_version(w2v_small)
+    np.testing.assert_allclose(bwe._get_normalized_matrix()[index],
+                               normalize(w2v_small['doctor']),
+                               rtol=1e-5)
+
+    # after the model is normalized in place, its vectors are used
+    normalize_model_vectors(w2v_small)
+    assert bwe._get_normalized_matrix() is w2v_small.vectors
+
+
 def test_assert_gensim_keyed_vectors():
     with pytest.raises(TypeError):
         GenderBiasWE(['one', 'two'], only_lower=True, verbose=True)
@@ -91,6 +208,9 @@ def test_data_is_sorted_list(gender_biased_w2v_small):
         assert all(word_list[i] <= word_list[i + 1]
                    for i in range(len(word_list) - 1))
 
+    neutral_words = gender_biased_w2v_small._neutral_words
+    assert neutral_words == sorted(neutral_words)
+
 
 def test_calc_direct_bias(gender_biased_w2v_small):
     """
@@ -110,6 +230,23 @@ def test_calc_direct_bias(gender_biased_w2v_small):
                    0.08, abs_tol=1e-2)
 
 
+def test_calc_projections(gender_biased_w2v_small):
+    """Test the batched projections against word-by-word projections."""
+    words = gender_biased_w2v_small._data['profession_names']
+
+    projections = gender_biased_w2v_small._calc_projections(words)
+
+    expected = [(gender_biased_w2v_small.model
+                 .cosine_similarities(gender_biased_w2v_small.direction,
+                                      [gender_biased_w2v_small[word]])[0])
+                for word in words]
+
+    np.testing.assert_allclose(projections, expected, atol=ATOL)
+
+    with pytest.raises(KeyError):
+        gender_biased_w2v_small._calc_projections(['home', 'HOME'])
+
+
 # TODO: iterate over a dictionary
 def test_calc_indirect_bias(gender_biased_w2v_small, all_zero=False):
     """
@@ -159,6 +296,23 @@ def test_calc_indirect_bias(gender_biased_w2v_small, all_zero=False):
                    0 if all_zero else 0.02, abs_tol=1e-2)
 
 
+def test_calc_indirect_bias_batch(gender_biased_w2v_small):
+    """Test calc_indirect_bias with arrays of words."""
+    words1 = ['softball', 'softball', 'football', 'football']
+    words2 = ['pitcher', 'receptionist', 'footballer', 'maestro']
+
+    indirect_biases = gender_biased_w2v_small.calc_indirect_bias(words1,
+                                                                 words2)
+
+    expected = [gender_biased_w2v_small.calc_indirect_bias(word1, word2)
+                for word1, word2 in zip(words1, words2)]
+
+    np.testing.assert_allclose(indirect_biases, expected, atol=ATOL)
+
+    with pytest.raises(ValueError):
+        gender_biased_w2v_small.calc_indirect_bias(words1, words2[:2])
+
+
 def test_generate_closest_words_indirect_bias(gender_biased_w2v_small):
     """Test generate_closest_words_indirect_bias in GenderBiasWE."""
     result = {'indirect_bias': {('football', 'businessman'): 0.17,
@@ -199,7 +353,7 @@ def check_all_vectors_unit_length(bias_we):
 
 def test_neutralize(gender_biased_w2v_small, is_preforming=True):
     """Test _neutralize method in GenderBiasWE."""
-    neutral_words = gender_biased_w2v_small._data['neutral_words']
+    neutral_words = gender_biased_w2v_small._neutral_words
 
     if is_preforming:
         gender_biased_w2v_small._neutralize(neutral_words)
@@ -217,6 +371,64 @@ def test_neutralize(gender_biased_w2v_small, is_preforming=True):
     test_calc_indirect_bias(gender_biased_w2v_small, all_zero=True)
 
 
+def test_neutral_indices(gender_biased_w2v_small):
+    """Test the neutral words indices are aligned with the neutral words."""
+    neutral_words = gender_biased_w2v_small._neutral_words
+    neutral_indices = gender_biased_w2v_small._neutral_indices
+
+    assert neutral_words == sorted(neutral_words)
+    assert neutral_words == [gender_biased_w2v_small.model.index2word[index]
+                             for index in neutral_indices]
+    assert (neutral_words
+            == sorted(gender_biased_w2v_small._extract_neutral_words(
+                gender_biased_w2v_small
+                ._data['specific_full_with_definitional_equalize'])))
+
+
+def test_neutralize_by_indices(gender_biased_w2v_small):
+    """Test _neutralize method in GenderBiasWE with vocabulary indices."""
+    gender_biased_w2v_small._neutralize(gender_biased_w2v_small
+                                        ._neutral_indices)
+    test_neutralize(gender_biased_w2v_small, is_preforming=False)
+
+
+def test_identify_subspace(gender_biased_w2v_small):
+    """Test the debiasing of a 3-dimensional subspace."""
+    # pylint: disable=line-too-long
+    definitional_sets = (gender_biased_w2v_small._data['definitional_pairs']
+                         + [['he', 'she', 'they']])
+
+    gender_biased_w2v_small._identify_subspace(definitional_sets, 3)
+
+    basis = gender_biased_w2v_small.subspace
+    assert gender_biased_w2v_small.direction is None
+    np.testing.assert_allclose(basis @ basis.T, np.eye(3), atol=ATOL)
+
+    with pytest.raises(RuntimeError):
+        gender_biased_w2v_small.project_on_direction('nurse')
+
+    assert gender_biased_w2v_small.calc_direct_bias() > 0
+
+    gender_biased_w2v_small._neutralize(gender_biased_w2v_small._neutral_indices)
+    np.testing.assert_allclose(gender_biased_w2v_small.calc_direct_bias(), 0,
+                               atol=ATOL)
+
+    equality_sets = {tuple(w) for w in gender_biased_w2v_small._data['equalize_pairs']}
+    equality_sets = gender_biased_w2v_small._generate_pair_candidates(equality_sets)
+
+    gender_biased_w2v_small._equalize(equality_sets)
+
+    for word1, word2 in equality_sets:
+        vector1 = gender_biased_w2v_small[word1]
+        vector2 = gender_biased_w2v_small[word2]
+
+        np.testing.assert_allclose(np.linalg.norm(vector1), 1, atol=ATOL)
+        np.testing.assert_allclose(np.linalg.norm(vector2), 1, atol=ATOL)
+        np.testing.assert_allclose(vector1 - (vector1 @ basis.T) @ basis,
+                                   vector2 - (vector2 @ basis.T) @ basis,
+                                   atol=ATOL)
+
+
 def test_equalize(gender_biased_w2v_small, is_preforming=True):
     """Test _equalize method in GenderBiasWE."""
     # pylint: disable=line-too-long
@@ -258,6 +470,17 @@ def test_equalize(gender_biased_w2v_small, is_preforming=True):
     check_all_vectors_unit_length(gender_biased_w2v_small)
 
 
+def test_batch_disjoint_sets():
+    sets = [('a', 'b'), ('c', 'd'), ('b', 'e'), ('f', 'g', 'h'), ('e', 'a')]
+
+    batches = _batch_disjoint_sets(sets)
+
+    assert batches == [[('a', 'b'), ('c', 'd')],
+                       [('f', 'g', 'h')],
+                       [('b', 'e')],
+                       [('e', 'a')]]
+
+
 def test_hard_debias_inplace(gender_biased_w2v_small, is_preforming=True):
     """Test hard_debias method in GenderBiasWE."""
     # pylint: disable=C0301
@@ -271,7 +494,7 @@ def test_hard_debias_inplace(gender_biased_w2v_small, is_preforming=True):
     equality_sets = gender_biased_w2v_small._data['definitional_pairs']
 
     np.random.seed(RANDOM_STATE)
-    neutral_words = np.random.choice(gender_biased_w2v_small._data['neutral_words'],
+    neutral_words = np.random.choice(gender_biased_w2v_small._neutral_words,
                                      N_RANDOM_NEUTRAL_WORDS_DEBIAS_TO_TEST,
                                      replace=False)
 
@@ -300,6 +523,59 @@ def test_hard_debias_not_inplace(gender_biased_w2v_small):
     test_calc_direct_bias(gender_biased_w2v_small)
     test_hard_debias_inplace(gender_debiased_we, is_preforming=False)
 
+    # only the vectors are copied
+    assert (gender_debiased_we.model.vocab
+            is gender_biased_w2v_small.model.vocab)
+    assert not np.shares_memory(gender_debiased_we.model.vectors,
+                                gender_biased_w2v_small.model.vectors)
+    assert (gender_debiased_we.model.vectors_norm
+            is gender_debiased_we.model.vectors)
+
+
+def test_neutralized_keyed_vectors(gender_biased_w2v_small):
+    """Test the neutralized view against neutralizing in place."""
+    neutralized = (NeutralizedKeyedVectors
+                   .from_bias_word_embedding(gender_biased_w2v_small))
+
+    gender_debiased_we = gender_biased_w2v_small.debias(method='neutralize',
+                                                        inplace=False)
+    debiased_model = gender_debiased_we.model
+
+    np.random.seed(RANDOM_STATE)
+    words = np.random.choice(debiased_model.index2word, 1000)
+
+    for word in words:
+        np.testing.assert_allclose(neutralized[word], debiased_model[word],
+                                   atol=ATOL)
+
+    np.testing.assert_allclose(neutralized.similarity('nurse', 'doctor'),
+                               debiased_model.similarity('nurse', 'doctor'),
+                               atol=ATOL)
+
+    neutralized_most_similar = neutralized.most_similar(positive=['she',
+                                                                  'doctor'],
+                                                        negative=['he'],
+                                                        unrestricted=False)
+    debiased_most_similar = most_similar(debiased_model,
+                                         positive=['she', 'doctor'],
+                                         negative=['he'],
+                                         unrestricted=False)
+    assert_deep_almost_equal(neutralized_most_similar,
+                             debiased_most_similar,
+                             atol=ATOL)
+
+
+def test_neutralized_keyed_vectors_neutral_words(w2v_small):
+    bwe = BiasWordEmbedding(w2v_small)
+    bwe._identify_direction('she', 'he', ['she', 'he'], 'single')
+
+    with pytest.raises(ValueError):
+        NeutralizedKeyedVectors.from_bias_word_embedding(bwe)
+
+    neutralized = NeutralizedKeyedVectors.from_bias_word_embedding(
+        bwe, neutral_words=['nurse'])
+    assert isclose(neutralized['nurse'] @ bwe.direction, 0, abs_tol=ATOL)
+
 
 def test_copy(gender_biased_w2v_small):
     gender_biased_w2v_small_copy = copy.copy(gender_biased_w2v_small)
@@ -333,6 +609,149 @@ def test_evaluate_word_embedding(gender_biased_w2v_small):
             == {'score': {'MSR-syntax': 0.75, 'Google': 0.729}})
 
 
+@pytest.mark.parametrize('kwargs_word_pairs',
+                         [{}, {'case_insensitive': False,
+                               'dummy4unknown': True},
+                          {'restrict_vocab': 10000}])
+def test_evaluate_word_pairs_gensim(w2v_small, kwargs_word_pairs):
+    """Test the word pairs evaluation against gensim's one."""
+    results_df = evaluate_word_pairs(w2v_small, kwargs_word_pairs)
+
+    for name, filename in WORD_PAIRS_TASKS.items():
+        (pearson,
+         spearman,
+         ratio_unknown_words) = w2v_small.evaluate_word_pairs(_get_data_resource_path(filename),  # pylint: disable=C0301
+                                                              **kwargs_word_pairs)  # pylint: disable=C0301
+
+        assert_deep_almost_equal(results_df.loc[name].to_dict(),
+                                 {'pearson_r': pearson[0],
+                                  'pearson_pvalue': pearson[1],
+                                  'spearman_r': spearman.correlation,
+                                  'spearman_pvalue': spearman.pvalue,
+                                  'ratio_unkonwn_words': ratio_unknown_words},
+                                 atol=1e-3)
+
+
+def test_evaluate_word_pairs_zero_vector(w2v_small):
+    """Test a zero vector has zero similarity to any other vector."""
+    model = copy_model_vectors(w2v_small)
+    model.vectors[model.vocab['tiger'].index] = 0
+
+    results_df = evaluate_word_pairs(model)
+
+    assert not results_df.isnull().values.any()
+
+
+def test_evaluate_word_pairs_bootstrap(w2v_small):
+    """Test the bootstrap confidence intervals of the word pairs evaluation."""
+    results_df = evaluate_word_pairs(w2v_small)
+    bootstrap_df = evaluate_word_pairs(w2v_small, n_bootstrap=200, seed=42)
+
+    assert list(results_df.columns) == PAIR_WORDS_EVALUATION_FIELDS
+    assert (list(bootstrap_df.columns)
+            == PAIR_WORDS_EVALUATION_FIELDS + PAIR_WORDS_BOOTSTRAP_FIELDS)
+    assert bootstrap_df[PAIR_WORDS_EVALUATION_FIELDS].equals(results_df)
+
+    assert bootstrap_df.equals(evaluate_word_pairs(w2v_small,
+                                                   n_bootstrap=200, seed=42))
+
+    for correlation in ['pearson_r', 'spearman_r']:
+        assert (bootstrap_df[correlation + '_ci_low']
+                < bootstrap_df[correlation + '_ci_high']).all()
+
+
+def test_rank_rows():
+    """Test the vectorized ranks with ties against scipy's rankdata."""
+    rng = np.random.RandomState(42)  # pylint: disable=no-member
+    x = rng.randint(10, size=(20, 30)).astype(float)
+
+    np.testing.assert_array_equal(_rank_rows(x),
+                                  [rankdata(row) for row in x])
+
+
+def test_bootstrap_correlations():
+    """Test the vectorized bootstrap against the scipy correlations."""
+    rng = np.random.RandomState(42)  # pylint: disable=no-member
+    scores = rng.rand(50)
+    model_scores = scores + rng.rand(50)
+
+    (pearson_ci,
+     spearman_ci) = _bootstrap_correlations(scores, model_scores,
+                                            n_bootstrap=500, seed=1,
+                                            block_elements=1000)
+
+    resamples = (np.random.RandomState(1)  # pylint: disable=no-member
+                 .randint(50, size=(500, 50)))
+    pearsons = [pearsonr(scores[resample], model_scores[resample])[0]
+                for resample in resamples]
+    spearmans = [spearmanr(scores[resample], model_scores[resample])[0]
+                 for resample in resamples]
+
+    assert_deep_almost_equal(pearson_ci,
+                             tuple(np.percentile(pearsons, [2.5, 97.5])))
+    assert_deep_almost_equal(spearman_ci,
+                             tuple(np.percentile(spearmans, [2.5, 97.5])))
+
+
+@pytest.mark.parametrize('case_insensitive', [True, False])
+def test_evaluate_word_analogies_gensim(w2v_small, case_insensitive):
+    """Test the batched word analogies evaluation against gensim's one."""
+    filename = 'MSR-syntax.txt'
+    score = _evaluate_word_analogies_task(w2v_small, filename,
+                                          restrict_vocab=5000,
+                                          case_insensitive=case_insensitive)
+
+    gensim_score, _ = w2v_small.evaluate_word_analogies(_get_data_resource_path(filename),  # pylint: disable=C0301
+                                                        restrict_vocab=5000,
+                                                        case_insensitive=case_insensitive)  # pylint: disable=C0301
+
+    assert score == gensim_score
+
+
+@pytest.mark.parametrize('executor', ['thread', 'process'])
+def test_evaluate_benchmarks_parallel(w2v_small, executor):
+    """Test the parallel evaluation is the same as the serial one."""
+    kwargs_word_analogies = {'restrict_vocab': 5000}
+
+    word_pairs_df = evaluate_word_pairs(w2v_small)
+    word_analogies_df = evaluate_word_analogies(w2v_small,
+                                                kwargs_word_analogies)
+
+    parallel_word_pairs_df = evaluate_word_pairs(w2v_small,
+                                                 n_jobs=2,
+                                                 executor=executor,
+                                                 with_timing=True)
+    parallel_word_analogies_df = evaluate_word_analogies(w2v_small,
+                                                         kwargs_word_analogies,
+                                                         n_jobs=-1,
+                                                         executor=executor,
+                                                         with_timing=True)
+
+    for df, parallel_df in [(word_pairs_df, parallel_word_pairs_df),
+                            (word_analogies_df, parallel_word_analogies_df)]:
+        assert list(parallel_df.columns) == list(df.columns) + ['seconds']
+        assert parallel_df[df.columns].equals(df)
+        assert (parallel_df['seconds'] >= 0).all()
+
+
+def test_evaluate_benchmarks_executor_exception(w2v_small):
+    """Test evaluate_word_pairs with an invalid executor."""
+    with pytest.raises(ValueError):
+        evaluate_word_pairs(w2v_small, n_jobs=2, executor='gpu')
+
+
+def test_benchmark_vocabulary_cache(w2v_small):
+    """Test the index arrays are shared by models with the same vocabulary."""
+    evaluate_word_pairs(w2v_small)
+
+    w2v_small_copy = copy_model_vectors(w2v_small)
+    assert (_get_vocabulary_cache(w2v_small_copy)
+            is _get_vocabulary_cache(w2v_small))
+
+    assert (_get_vocabulary_cache(load_w2v_small())
+            is not _get_vocabulary_cache(w2v_small))
+
+
 def test_generate_analogies(gender_biased_w2v_small):
     """Test generate_analogies method in GenderBiasWE.
 
@@ -346,6 +765,99 @@ def test_generate_analogies(gender_biased_w2v_small):
     assert_deep_almost_equal(analogies_df.values, TOLGA_GENDER_ANALOGIES)
 
 
+def _generate_analogies_brute_force(model, seed_vector, n_analogies,
+                                    multiple, delta, restrict_vocab):
+    """Generate analogies with all the pairwise distances at once."""
+    # pylint: disable=too-many-arguments,too-many-locals
+
+    restrict_vocab_vectors = model.vectors[:restrict_vocab]
+    normalized_vectors = (restrict_vocab_vectors
+                          / np.linalg.norm(restrict_vocab_vectors,
+                                           axis=1)[:, None])
+
+    pairs_distances = euclidean_distances(normalized_vectors,
+                                          normalized_vectors)
+    pairs_mask = (pairs_distances < delta) & (pairs_distances != 0)
+
+    pairs_indices = np.array(np.nonzero(pairs_mask)).T
+    x_minus_y_vectors = (normalized_vectors[pairs_indices[:, 0]]
+                         - normalized_vectors[pairs_indices[:, 1]])
+    x_minus_y_vectors /= np.linalg.norm(x_minus_y_vectors, axis=1)[:, None]
+    cos_distances = x_minus_y_vectors @ seed_vector
+
+    analogies = []
+    generated_words_x, generated_words_y = set(), set()
+
+    for index in np.argsort(cos_distances)[::-1]:
+        if len(analogies) == n_analogies:
+            break
+
+        word_x, word_y = [model.index2word[word_index]
+                          for word_index in pairs_indices[index]]
+
+        if multiple or (word_x not in generated_words_x
+                        and word_y not in generated_words_y):
+            analogies.append((word_x, word_y))
+            generated_words_x.add(word_x)
+            generated_words_y.add(word_y)
+
+    return analogies
+
+
+@pytest.mark.parametrize('multiple', [True, False])
+def test_generate_analogies_brute_force(gender_biased_w2v_small,
+                                        monkeypatch, multiple):
+    """Test the streaming generation of analogies against the brute force.
+
+    With one candidate per analogy, the candidates run out
+    when the words should not repeat, and they are generated again.
+    """
+    monkeypatch.setattr(bias_module, 'ANALOGIES_CANDIDATES_FACTOR', 1)
+
+    restrict_vocab = 700
+    seed_vector = gender_biased_w2v_small.direction
+
+    analogies_df = gender_biased_w2v_small.generate_analogies(
+        50, seed='direction', multiple=multiple,
+        restrict_vocab=restrict_vocab)
+
+    assert (list(analogies_df[['she', 'he']].itertuples(index=False,
+                                                        name=None))
+            == _generate_analogies_brute_force(
+                gender_biased_w2v_small.model, seed_vector, 50,
+                multiple, 1., restrict_vocab))
+
+
+def test_generate_analogies_candidates_blocks(gender_biased_w2v_small):
+    """Test the candidates do not depend on the block size."""
+    normalized_vectors = gender_biased_w2v_small.model.vectors[:700]
+    seed_vector = gender_biased_w2v_small.direction
+
+    (pairs_indices,
+     pairs_distances,
+     cos_distances,
+     n_pairs) = _generate_analogies_candidates(normalized_vectors,
+                                               seed_vector, 1., 100)
+
+    (block_pairs_indices,
+     block_pairs_distances,
+     block_cos_distances,
+     block_n_pairs) = _generate_analogies_candidates(normalized_vectors,
+                                                     seed_vector, 1., 100,
+                                                     block_size=64)
+
+    np.testing.assert_array_equal(block_pairs_indices, pairs_indices)
+    np.testing.assert_allclose(block_pairs_distances, pairs_distances,
+                               rtol=1e-5)
+    np.testing.assert_allclose(block_cos_distances, cos_distances,
+                               rtol=1e-5)
+    assert block_n_pairs == n_pairs
+
+    pairs_distances = euclidean_distances(normalized_vectors,
+                                          normalized_vectors)
+    assert n_pairs == ((pairs_distances < 1) & (pairs_distances != 0)).sum()
+
+
 # TODO deeper testing, this is barely checking it runs
 # TODO not all full_specific_words are lower case - why? maybe just names?
 # TODO maybe it was trained on the whole w2v?
@@ -357,6 +869,35 @@ def test_learn_full_specific_words(gender_biased_w2v_small):
             .issubset(full_specific_words))
 
 
+def test_learn_full_specific_words_sgd(gender_biased_w2v_small):
+    (full_specific_words,
+     full_specific_indices,
+     clf) = gender_biased_w2v_small.learn_full_specific_words(classifier='sgd',
+                                                              return_indices=True)  # pylint: disable=C0301
+
+    assert full_specific_words == [(gender_biased_w2v_small
+                                    .model.index2word[index])
+                                   for index in full_specific_indices]
+
+    with pytest.raises(ValueError):
+        gender_biased_w2v_small.learn_full_specific_words(classifier='tree')
+
+
+@pytest.mark.parametrize('classifier', ['svm', 'sgd'])
+def test_learn_full_specific_words_not_normalized(w2v_small, classifier):
+    """Test the vectors of a model that is not normalized are not changed."""
+    vectors = w2v_small.vectors.copy()
+
+    bwe = BiasWordEmbedding(w2v_small, to_normalize=False)
+    bwe.learn_full_specific_words(
+        get_bolukbasi_data()['gender']['specific_seed'],
+        max_non_specific_examples=1000,
+        classifier=classifier)
+
+    np.testing.assert_array_equal(w2v_small.vectors, vectors)
+    assert w2v_small.vectors_norm is None
+
+
 def test_calc_all_weat(w2v_small):
     calc_all_weat(w2v_small, filter_by='model', with_original_finding=True,
                   with_pvalue=True, pvalue_kwargs={'method': 'approximate'})
@@ -414,6 +955,48 @@ def test_calc_all_weat_defaults(w2v_small):
     assert_deep_almost_equal(weat_5_results_default, weat_5_results)
 
 
+@pytest.mark.parametrize('executor', ['thread', 'process'])
+def test_calc_all_weat_parallel(w2v_small, executor):
+    pvalue_kwargs = {'method': 'approximate'}
+
+    serial_weat = calc_all_weat(w2v_small, filter_by='model',
+                                pvalue_kwargs=pvalue_kwargs)
+
+    parallel_weat = calc_all_weat(w2v_small, filter_by='model',
+                                  pvalue_kwargs=pvalue_kwargs,
+                                  n_jobs=2, executor=executor)
+
+    assert_deep_almost_equal(serial_weat.to_dict(),
+                             parallel_weat.to_dict())
+
+
+@pytest.mark.parametrize('executor', ['thread', 'process'])
+def test_calc_all_weat_models(w2v_small, executor):
+    """Test the WEAT of multiple models against each model serially."""
+    # pylint: disable=import-outside-toplevel
+    from gensim.models.keyedvectors import KeyedVectors
+
+    words = w2v_small.index2word[:5000]
+    partial_model = KeyedVectors(w2v_small.vector_size)
+    partial_model.add(words, w2v_small[words])
+
+    models = [w2v_small, partial_model]
+    pvalue_kwargs = {'method': 'approximate'}
+
+    serial_weats = [calc_all_weat(model, filter_by='model',
+                                  pvalue_kwargs=pvalue_kwargs)
+                    for model in models]
+
+    parallel_weats = calc_all_weat_models(models, filter_by='model',
+                                          pvalue_kwargs=pvalue_kwargs,
+                                          n_jobs=2, executor=executor)
+
+    assert len(parallel_weats) == len(models)
+    for serial_weat, parallel_weat in zip(serial_weats, parallel_weats):
+        assert_deep_almost_equal(serial_weat.to_dict(),
+                                 parallel_weat.to_dict())
+
+
 def test_calc_weat_pleasant_attribute(w2v_small):
     # pylint: disable=line-too-long
 
@@ -435,6 +1018,145 @@ def test_calc_weat_pleasant_attribute(w2v_small):
     assert_deep_almost_equal(result_v1, result_v2, atol=0.01)
 
 
+def test_calc_weat_pvalue_approximate():
+    np.random.seed(RANDOM_STATE)
+    first_associations = list(np.random.normal(0.1, 0.1, 8))
+    second_associations = list(np.random.normal(0, 0.1, 8))
+
+    exact_pvalue = _calc_weat_pvalue(first_associations,
+                                     second_associations,
+                                     method='exact')
+
+    approximate_pvalue = _calc_weat_pvalue(first_associations,
+                                           second_associations,
+                                           method='approximate',
+                                           n_permutations=20000)
+
+    assert isclose(approximate_pvalue, exact_pvalue, abs_tol=0.01)
+
+    assert approximate_pvalue == _calc_weat_pvalue(first_associations,
+                                                   second_associations,
+                                                   method='approximate',
+                                                   n_permutations=20000)
+
+    early_stopped_pvalue = _calc_weat_pvalue(first_associations,
+                                             second_associations,
+                                             method='approximate',
+                                             n_permutations=20000,
+                                             batch_size=100,
+                                             tolerance=0.05)
+
+    assert isclose(early_stopped_pvalue, exact_pvalue, abs_tol=0.05)
+
+
+def test_calc_weat_pvalue_subset_sum():
+    np.random.seed(RANDOM_STATE)
+    first_associations = list(np.random.normal(0.1, 0.1, 8))
+    second_associations = list(np.random.normal(0, 0.1, 8))
+
+    exact_pvalue = _calc_weat_pvalue(first_associations,
+                                     second_associations,
+                                     method='exact')
+
+    subset_sum_pvalue = _calc_weat_pvalue(first_associations,
+                                          second_associations,
+                                          method='subset_sum',
+                                          tolerance=1e-4)
+
+    assert isclose(subset_sum_pvalue, exact_pvalue, abs_tol=1e-4)
+
+
+def test_audit_word_embeddings(w2v_small, tmp_path):
+    model_paths = [str(tmp_path / 'first.kv'), str(tmp_path / 'second.kv')]
+    for model_path in model_paths:
+        w2v_small.save(model_path)
+
+    results_path = str(tmp_path / 'audit.csv')
+    measures = ['weat', 'direct_bias', 'word_pairs']
+
+    first_results_df = audit_word_embeddings(model_paths[:1], results_path,
+                                             measures=measures)
+
+    assert set(first_results_df['model']) == {model_paths[0]}
+    assert set(first_results_df['measure']) == set(measures)
+
+    results_df = audit_word_embeddings(model_paths, results_path,
+                                       measures=measures)
+
+    model_values = [results_df[results_df['model'] == model_path]['value']
+                    for model_path in model_paths]
+
+    assert len(model_values[0]) == len(first_results_df)
+    np.testing.assert_allclose(model_values[0].values,
+                               model_values[1].values)
+
+    # the WEAT results are in full precision
+    weat_df = calc_all_weat(w2v_small, with_pvalue=False)
+    weat_df = weat_df[weat_df['s'] != '']
+    first_model_df = results_df[results_df['model'] == model_paths[0]]
+    for metric in ['s', 'd']:
+        weat_values = first_model_df[(first_model_df['measure'] == 'weat')
+                                     & (first_model_df['metric'] == metric)
+                                     ]['value']
+        np.testing.assert_allclose(weat_values.values,
+                                   weat_df[metric].astype(float).values,
+                                   atol=1e-4)
+        assert (weat_values.round(4) != weat_values).any()
+
+    direct_bias = results_df[results_df['measure'] == 'direct_bias']['value']
+    gender_biased_w2v_small = GenderBiasWE(w2v_small)
+    assert isclose(direct_bias.iloc[0],
+                   gender_biased_w2v_small.calc_direct_bias(),
+                   abs_tol=ATOL)
+
+
+def test_audit_word_embeddings_missing_words(w2v_small, tmp_path):
+    """Test a model without the gender words doesn't stop the audit."""
+    # pylint: disable=import-outside-toplevel
+    from gensim.models.keyedvectors import KeyedVectors
+
+    words = [word for word in w2v_small.index2word[:1000]
+             if word not in {'she', 'he'}]
+    partial_model = KeyedVectors(w2v_small.vector_size)
+    partial_model.add(words, w2v_small[words])
+
+    model_paths = [str(tmp_path / 'partial.kv'), str(tmp_path / 'full.kv')]
+    partial_model.save(model_paths[0])
+    w2v_small.save(model_paths[1])
+
+    with pytest.warns(UserWarning):
+        results_df = audit_word_embeddings(model_paths,
+                                           str(tmp_path / 'audit.csv'),
+                                           measures=['direct_bias'])
+
+    direct_bias = results_df.set_index('model')['value']
+    assert np.isnan(direct_bias[model_paths[0]])
+    assert not np.isnan(direct_bias[model_paths[1]])
+
+
+def test_load_w2v_small_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv('RESPONSIBLY_CACHE_DIR', str(tmp_path))
+    _load_w2v_small_cache.cache_clear()
+
+    try:
+        parsed_model = _parse_w2v_small()
+        first_model = load_w2v_small()
+        second_model = load_w2v_small()
+    finally:
+        _load_w2v_small_cache.cache_clear()
+
+    assert len(list(tmp_path.iterdir())) == 2
+
+    for model in [first_model, second_model]:
+        assert model.index2word == parsed_model.index2word
+        assert model.vocab['nurse'].index == parsed_model.vocab['nurse'].index
+        np.testing.assert_array_equal(model.vectors, parsed_model.vectors)
+
+    first_model.init_sims(replace=True)
+    np.testing.assert_array_equal(second_model.vectors,
+                                  parsed_model.vectors)
+
+
 def test_most_similar(w2v_small):
     POSITIVE, NEGATIVE = ('doctor', 'she'), ('he',)
 
@@ -449,6 +1171,89 @@ def test_most_similar(w2v_small):
                              atol=0.01)
 
 
+def test_most_similar_batch(w2v_small):
+    queries = [(('doctor', 'she'), ('he',)),
+               (('king', 'woman'), ('man',)),
+               ('nurse', None)]
+
+    for unrestricted in [True, False]:
+        for restrict_vocab in [None, 5000]:
+            batch_results = most_similar_batch(w2v_small, queries,
+                                               topn=5,
+                                               restrict_vocab=restrict_vocab,
+                                               unrestricted=unrestricted,
+                                               chunk_size=1000)
+
+            for (positive, negative), results in zip(queries, batch_results):
+                expected = most_similar(w2v_small, positive, negative,
+                                        topn=5,
+                                        restrict_vocab=restrict_vocab,
+                                        unrestricted=unrestricted)
+                assert_deep_almost_equal(results, expected, atol=ATOL)
+
+    # all the similarities, computed chunk by chunk
+    all_dists = most_similar_batch(w2v_small, queries, topn=None,
+                                   restrict_vocab=5000, chunk_size=1000)
+    for (positive, negative), dists in zip(queries, all_dists):
+        np.testing.assert_allclose(dists,
+                                   most_similar(w2v_small, positive, negative,
+                                                topn=None,
+                                                restrict_vocab=5000),
+                                   atol=ATOL)
+
+
+def test_most_similar_batch_empty(w2v_small):
+    assert most_similar_batch(w2v_small, []) == []
+    assert most_similar_batch(w2v_small, [], topn=None) == []
+
+
+def test_ivf_indexer(w2v_small, tmp_path):
+    indexer = IVFIndexer(w2v_small, n_lists=100, n_probe=20)
+
+    words = w2v_small.index2word[:1000:10]
+
+    n_hits = 0
+    for word in words:
+        exact = most_similar(w2v_small, word, topn=10)
+        approximate = most_similar(w2v_small, word, topn=10,
+                                   indexer=indexer)
+
+        assert approximate[0][0] == word
+        n_hits += len({w for w, _ in exact} & {w for w, _ in approximate})
+
+    assert n_hits / (10 * len(words)) > 0.9
+
+    # probing all the lists is an exhaustive search
+    assert_deep_almost_equal(indexer.most_similar(w2v_small['nurse'], 10,
+                                                  n_probe=100),
+                             most_similar(w2v_small, 'nurse', topn=10),
+                             atol=ATOL)
+
+    restricted = most_similar(w2v_small, 'nurse', topn=10,
+                              restrict_vocab=1000, indexer=indexer,
+                              unrestricted=False)
+    assert len(restricted) == 10
+    assert all(word != 'nurse' and w2v_small.vocab[word].index < 1000
+               for word, _ in restricted)
+
+    # more lists are probed for a small restricted vocabulary
+    restricted = most_similar(w2v_small, ['king', 'woman'], ['man'],
+                              topn=10, restrict_vocab=200, indexer=indexer)
+    assert len(restricted) == 10
+    assert all(w2v_small.vocab[word].index < 200 for word, _ in restricted)
+
+    with pytest.raises(ValueError):
+        most_similar(w2v_small, 'nurse', topn=None, indexer=indexer)
+
+    fname = str(tmp_path / 'w2v_small.ivf.npz')
+    indexer.save(fname)
+    loaded_indexer = IVFIndexer.load(fname, w2v_small)
+
+    assert loaded_indexer.n_probe == indexer.n_probe
+    assert (loaded_indexer.most_similar(w2v_small['nurse'], 10)
+            == indexer.most_similar(w2v_small['nurse'], 10))
+
+
 def test_compute_association(gender_biased_w2v_small):
     """
     Test compute_association method in GenderBiasWE.
@@ -45,9 +45,13 @@ the impact of debiasing performance.
 
 """
 
+from responsibly.we.audit import audit_word_embeddings
 from responsibly.we.bias import BiasWordEmbedding, GenderBiasWE
 from responsibly.we.data import load_w2v_small
-from responsibly.we.utils import most_similar
+from responsibly.we.indexer import IVFIndexer
+from responsibly.we.neutralized import NeutralizedKeyedVectors
+from responsibly.we.utils import most_similar, most_similar_batch
 from responsibly.we.weat import (
-    calc_all_weat, calc_single_weat, calc_weat_pleasant_unpleasant_attribute,
+    calc_all_weat, calc_all_weat_models, calc_single_weat,
+    calc_weat_pleasant_unpleasant_attribute,
 )
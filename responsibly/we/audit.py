@@ -0,0 +1,285 @@
+"""
+Audit the bias of many word embeddings in a single run.
+
+Each model is loaded only when its turn comes
+(memory-mapped when it is saved in the gensim native format),
+and is measured by WEAT, the direct gender bias
+and the standard benchmarks.
+
+The results are written as a tidy table to a CSV file,
+one row per (model, measure, task, metric),
+and are appended after every model.
+Running the audit again with the same results file
+skips the models that were already audited,
+so a crash halfway through doesn't lose the finished models.
+
+Usage
+~~~~~
+
+.. code:: python
+
+   >>> from responsibly.we.audit import audit_word_embeddings
+   >>> results_df = audit_word_embeddings(['checkpoint-1.kv',
+   ...                                     'checkpoint-2.kv'],
+   ...                                    'audit.csv')
+
+"""
+
+import copy
+import os
+import warnings
+
+import pandas as pd
+
+from responsibly.we.benchmark import (
+    _set_vocabulary_cache, evaluate_word_analogies, evaluate_word_pairs,
+)
+from responsibly.we.bias import GenderBiasWE, _set_word_data_cache
+from responsibly.we.weat import (
+    _calc_weat_tasks, _filter_weat_data, _resolve_weat_data,
+)
+
+
+AUDIT_RESULTS_COLUMNS = ['model', 'measure', 'task', 'metric', 'value']
+AUDIT_MEASURES = ['weat', 'direct_bias', 'word_pairs', 'word_analogies']
+WORD2VEC_BINARY_EXTENSIONS = ['.bin']
+WORD2VEC_TEXT_EXTENSIONS = ['.txt', '.vec']
+
+
+def load_word_embedding(path):
+    """Load a word embedding model from a file.
+
+    Files in the word2vec format (binary `.bin`, or text `.txt`/`.vec`)
+    are parsed. Any other file is loaded as gensim native
+    ``KeyedVectors`` with copy-on-write memory mapping,
+    so only the pages that are used are read, and the model can
+    still be normalized in place without changing the file.
+
+    :param str path: Path to the model file.
+    :return: Word embedding model of ``gensim.model.KeyedVectors``.
+    """
+
+    # pylint: disable=import-outside-toplevel
+    from gensim.models.keyedvectors import KeyedVectors
+
+    extension = os.path.splitext(path)[1].lower()
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', DeprecationWarning)
+
+        if extension in WORD2VEC_BINARY_EXTENSIONS:
+            return KeyedVectors.load_word2vec_format(path, binary=True)
+
+        if extension in WORD2VEC_TEXT_EXTENSIONS:
+            return KeyedVectors.load_word2vec_format(path, binary=False)
+
+        return KeyedVectors.load(path, mmap='c')
+
+
+def _vocabulary_signature(model):
+    return (len(model.index2word),
+            hash(tuple(model.index2word)))
+
+
+def _get_shared_data(shared_data_by_vocabulary, model, weat_data):
+    """Get the data that is shared among the models of a vocabulary.
+
+    The vocabularies with the same signature are compared word by word,
+    so a hash collision doesn't share the data of another vocabulary.
+    """
+
+    entries = shared_data_by_vocabulary.setdefault(
+        _vocabulary_signature(model), [])
+
+    for index2word, shared_data in entries:
+        if index2word == model.index2word:
+            return shared_data
+
+    filtered_weat_data = copy.deepcopy(weat_data)
+    _filter_weat_data(filtered_weat_data, model, 'model')
+    shared_data = (filtered_weat_data, {}, {})
+
+    entries.append((model.index2word, shared_data))
+
+    return shared_data
+
+
+def _calc_weat_rows(model, weat_data, pvalue_kwargs, n_jobs):
+    """Calc the WEAT results of stimuli that are already filtered.
+
+    The results are kept in full precision,
+    without the formatting of :func:`~responsibly.we.weat.calc_all_weat`.
+    """
+
+    # stimuli with a word set that was filtered out are skipped
+    weat_data = [stimuli for stimuli in weat_data
+                 if all(group['words'] for group in stimuli.values()
+                        if 'words' in group)]
+
+    results = _calc_weat_tasks([model],
+                               [(0, stimuli) for stimuli in weat_data],
+                               True, pvalue_kwargs, n_jobs)
+
+    rows = []
+    for result in results:
+        task = '{} / {}'.format(result['Target words'],
+                                result['Attrib. words'])
+        for metric in ['s', 'd', 'p']:
+            rows.append(('weat', task, metric, float(result[metric])))
+    return rows
+
+
+def _benchmark_results_to_rows(measure, benchmark_df):
+    return [(measure, task, metric, value)
+            for task, results in benchmark_df.iterrows()
+            for metric, value in results.items()]
+
+
+def _calc_direct_bias(model):
+    """Calc the direct gender bias of a model, or NaN.
+
+    The direct bias is NaN when the model lacks the words
+    that are needed for the gender direction or the professions,
+    so the audit of the other models goes on.
+    """
+
+    try:
+        return GenderBiasWE(model).calc_direct_bias()
+    except (KeyError, ValueError, RuntimeError) as error:
+        warnings.warn('The direct bias could not be calculated: {!r}'
+                      .format(error))
+        return float('nan')
+
+
+def _audit_model(model, shared_data, measures, pvalue_kwargs, n_jobs):
+    """Audit a single model.
+
+    :param shared_data: Data of the vocabulary of the model:
+                        the filtered WEAT stimuli,
+                        the cache of the benchmark index arrays,
+                        and the cache of the word data of
+                        :class:`~responsibly.we.bias.GenderBiasWE`.
+    """
+
+    weat_data, vocabulary_cache, word_data_cache = shared_data
+
+    _set_vocabulary_cache(model, vocabulary_cache)
+    _set_word_data_cache(model, word_data_cache)
+
+    rows = []
+
+    if 'weat' in measures:
+        rows.extend(_calc_weat_rows(model, weat_data,
+                                    pvalue_kwargs, n_jobs))
+
+    if 'word_pairs' in measures:
+        rows.extend(_benchmark_results_to_rows('word_pairs',
+                                               evaluate_word_pairs(model)))
+
+    if 'word_analogies' in measures:
+        rows.extend(_benchmark_results_to_rows('word_analogies',
+                                               evaluate_word_analogies(model)))
+        # free the normalized copy of the vectors that the analogies keep,
+        # the vectors are normalized in place next
+        if model.vectors_norm is not model.vectors:
+            model.vectors_norm = None
+
+    # the last measure, because the vectors are normalized in place
+    if 'direct_bias' in measures:
+        rows.append(('direct_bias', 'professions', 'direct_bias',
+                     _calc_direct_bias(model)))
+
+    return rows
+
+
+def _read_audited_models(results_path):
+    if not os.path.exists(results_path):
+        return set()
+
+    return set(pd.read_csv(results_path, usecols=['model'])['model']
+               .astype(str))
+
+
+def audit_word_embeddings(model_paths, results_path,
+                          weat_data='caliskan', measures=None,
+                          pvalue_kwargs=None, n_jobs=None,
+                          verbose=False):
+    """
+    Audit the bias and the performance of many word embeddings.
+
+    The filtering of the WEAT stimuli by the vocabulary,
+    the index arrays of the benchmarks and the gender word data
+    are computed once, and shared among the models with the same
+    vocabulary (e.g., the checkpoints of a single training).
+
+    :param list model_paths: Paths to the model files,
+                             see :func:`load_word_embedding`.
+    :param str results_path: Path to the CSV file of the results.
+                             Models that are already in this file
+                             are skipped.
+    :param weat_data: WEAT cases data, see
+                      :func:`~responsibly.we.weat.calc_all_weat`.
+    :param list measures: Measures to run out of
+                          `'weat'`, `'direct_bias'`, `'word_pairs'`
+                          and `'word_analogies'`. By default, all of them.
+    :param dict pvalue_kwargs: Keyword arguments of the WEAT p-value
+                               computation. By default,
+                               ``{'method': 'approximate'}``, unlike
+                               :func:`~responsibly.we.weat.calc_all_weat`,
+                               because the exact p-value is too slow
+                               for many models.
+    :param int n_jobs: Number of WEAT stimuli to calculate in parallel.
+    :param bool verbose: Set verbosity
+    :return: :class:`pandas.DataFrame` of the results of all the models
+             in the results file.
+    """
+    # pylint: disable=too-many-arguments,too-many-locals
+
+    if measures is None:
+        measures = AUDIT_MEASURES
+
+    for measure in measures:
+        if measure not in AUDIT_MEASURES:
+            raise ValueError('measure should be one of {}, {} was given'
+                             .format(AUDIT_MEASURES, measure))
+
+    weat_data = _resolve_weat_data(weat_data)
+
+    if pvalue_kwargs is None:
+        pvalue_kwargs = {'method': 'approximate'}
+
+    audited_models = _read_audited_models(results_path)
+
+    shared_data_by_vocabulary = {}
+
+    for model_path in model_paths:
+        model_path = str(model_path)
+
+        if model_path in audited_models:
+            if verbose:
+                print('Skipping {}, already audited.'.format(model_path))
+            continue
+
+        if verbose:
+            print('Auditing {}...'.format(model_path))
+
+        model = load_word_embedding(model_path)
+
+        shared_data = _get_shared_data(shared_data_by_vocabulary,
+                                       model, weat_data)
+
+        rows = _audit_model(model, shared_data,
+                            measures, pvalue_kwargs, n_jobs)
+
+        model_df = pd.DataFrame([(model_path,) + row for row in rows],
+                                columns=AUDIT_RESULTS_COLUMNS)
+
+        model_df.to_csv(results_path, mode='a', index=False,
+                        header=not os.path.exists(results_path))
+
+        audited_models.add(model_path)
+
+    if not os.path.exists(results_path):
+        return pd.DataFrame(columns=AUDIT_RESULTS_COLUMNS)
+
+    return pd.read_csv(results_path)
@@ -42,9 +42,16 @@ Analogies Tasks
 """
 
 import os
+import time
+import weakref
+from functools import lru_cache
 
+import numpy as np
 import pandas as pd
 from pkg_resources import resource_filename
+from scipy.stats import pearsonr, spearmanr
+
+from responsibly.we.utils import _normalize_rows, _run_tasks
 
 
 WORD_PAIRS_TASKS = {'WS353': 'wordsim353.tsv',
@@ -62,6 +69,25 @@ PAIR_WORDS_EVALUATION_FIELDS = ['pearson_r', 'pearson_pvalue',
                                 'spearman_r', 'spearman_pvalue',
                                 'ratio_unkonwn_words']
 
+PAIR_WORDS_BOOTSTRAP_FIELDS = ['pearson_r_ci_low', 'pearson_r_ci_high',
+                               'spearman_r_ci_low', 'spearman_r_ci_high']
+
+ANALOGIES_EVALUATION_FIELDS = ['score']
+
+TIMING_FIELD = 'seconds'
+
+# the defaults of gensim's evaluate_word_pairs and evaluate_word_analogies
+DEFAULT_RESTRICT_VOCAB = 300000
+ANALOGIES_TOPN = 5
+# about 128MB of float32 similarities
+ANALOGIES_BLOCK_ELEMENTS = 2 ** 25
+# about 32MB per array of resampled float64 scores
+BOOTSTRAP_BLOCK_ELEMENTS = 2 ** 22
+
+# index arrays of the benchmarks by model, shared among models
+# with the same vocabulary (e.g., a debiased copy of a model)
+_VOCABULARY_CACHES = weakref.WeakKeyDictionary()
+
 
 def _get_data_resource_path(filename):
     return resource_filename(__name__, os.path.join('data',
@@ -75,81 +101,630 @@ def _prepare_word_pairs_file(src, dst, delimiter='\t'):
     df.loc[:, :2].to_csv(dst, sep=delimiter, index=False, header=False)
 
 
-def evaluate_word_pairs(model, kwargs_word_pairs=None):
+@lru_cache(maxsize=None)
+def _parse_word_pairs(filename, delimiter='\t'):
+    """Parse a word pairs file, as gensim's ``evaluate_word_pairs``.
+
+    :return: Tuple of the first words, the second words
+             and the similarity scores.
+    """
+
+    first_words, second_words, scores = [], [], []
+
+    with open(_get_data_resource_path(filename), encoding='utf8') as f:
+        for line in f:
+            if line.startswith('#'):
+                continue
+
+            try:
+                first_word, second_word, score = line.split(delimiter)
+                score = float(score)
+            except (ValueError, TypeError):
+                continue
+
+            first_words.append(first_word)
+            second_words.append(second_word)
+            scores.append(score)
+
+    return tuple(first_words), tuple(second_words), np.array(scores)
+
+
+@lru_cache(maxsize=None)
+def _parse_analogies(filename):
+    """Parse a word analogies file, as gensim's ``evaluate_word_analogies``.
+
+    :return: Tuple of sections, each one is a tuple of its name
+             and its questions (a tuple of four words).
+    """
+
+    sections = []
+
+    with open(_get_data_resource_path(filename), encoding='utf8') as f:
+        for line_no, line in enumerate(f):
+            if line.startswith(': '):
+                sections.append((line.lstrip(': ').strip(), []))
+
+            else:
+                if not sections:
+                    raise ValueError('Missing section header before line #{}'
+                                     ' in {}'.format(line_no, filename))
+
+                words = line.split()
+                if len(words) == 4:
+                    sections[-1][1].append(tuple(words))
+
+    return tuple((name, tuple(questions)) for name, questions in sections)
+
+
+def _get_vocabulary_cache(model):
+    """Get the cache of the benchmark index arrays of a model.
+
+    The cache is shared by all the models with the same
+    vocabulary objects.
+    """
+
+    if model not in _VOCABULARY_CACHES:
+        for other_model, cache in list(_VOCABULARY_CACHES.items()):
+            if (other_model.vocab is model.vocab
+                    and other_model.index2word is model.index2word):
+                break
+        else:
+            cache = {}
+
+        _VOCABULARY_CACHES[model] = cache
+
+    return _VOCABULARY_CACHES[model]
+
+
+def _set_vocabulary_cache(model, cache):
+    """Share the cache of the benchmark index arrays with a model.
+
+    The cache should be shared only among models with the same
+    vocabulary (e.g., the checkpoints of a single training),
+    even if their vocabulary objects are different.
+    """
+
+    _VOCABULARY_CACHES[model] = cache
+
+
+def _get_ok_vocab(model, restrict_vocab, case_insensitive):
+    """Map the first words of the vocabulary to their indices.
+
+    If case insensitive, the words are upper-cased,
+    and the first case variant is taken.
+    """
+
+    cache = _get_vocabulary_cache(model)
+    key = ('ok_vocab', restrict_vocab, case_insensitive)
+
+    if key not in cache:
+        ok_vocab = {}
+        for index, word in enumerate(model.index2word[:restrict_vocab]):
+            if case_insensitive:
+                word = word.upper()
+            ok_vocab.setdefault(word, index)
+
+        cache[key] = ok_vocab
+
+    return cache[key]
+
+
+def _lookup_words(ok_vocab, words, case_insensitive):
+    """Look up words in the vocabulary, -1 for unknown words."""
+    if case_insensitive:
+        words = (word.upper() for word in words)
+    return np.array([ok_vocab.get(word, -1) for word in words],
+                    dtype=np.int64)
+
+
+def _get_word_pairs_indices(model, filename, delimiter='\t',
+                            restrict_vocab=DEFAULT_RESTRICT_VOCAB,
+                            case_insensitive=True):
+    """Get the indices of the pairs of a word pairs task.
+
+    :return: Tuple of the indices of the first words,
+             of the second words (-1 for unknown words),
+             and the similarity scores.
+    """
+
+    cache = _get_vocabulary_cache(model)
+    key = ('word_pairs', filename, delimiter,
+           restrict_vocab, case_insensitive)
+
+    if key not in cache:
+        ok_vocab = _get_ok_vocab(model, restrict_vocab, case_insensitive)
+        first_words, second_words, scores = _parse_word_pairs(filename,
+                                                              delimiter)
+
+        cache[key] = (_lookup_words(ok_vocab, first_words, case_insensitive),
+                      _lookup_words(ok_vocab, second_words, case_insensitive),
+                      scores)
+
+    return cache[key]
+
+
+def _get_analogies_indices(model, filename,
+                           restrict_vocab=DEFAULT_RESTRICT_VOCAB,
+                           case_insensitive=True):
+    """Get the indices of the questions of a word analogies task.
+
+    :return: Tuple of the index matrices (n_questions x 4)
+             of the questions of each section (-1 for unknown words).
+    """
+
+    cache = _get_vocabulary_cache(model)
+    key = ('analogies', filename, restrict_vocab, case_insensitive)
+
+    if key not in cache:
+        ok_vocab = _get_ok_vocab(model, restrict_vocab, case_insensitive)
+
+        cache[key] = tuple(_lookup_words(ok_vocab,
+                                         [word
+                                          for question in questions
+                                          for word in question],
+                                         case_insensitive).reshape(-1, 4)
+                           for _, questions in _parse_analogies(filename))
+
+    return cache[key]
+
+
+def _get_canonical_indices(model, restrict_vocab, case_insensitive):
+    """Map each of the first words to the index of its first case variant.
+
+    This is the word that gensim returns when looking up
+    the (upper-cased) prediction.
+    """
+
+    cache = _get_vocabulary_cache(model)
+    key = ('canonical', restrict_vocab, case_insensitive)
+
+    if key not in cache:
+        words = model.index2word[:restrict_vocab]
+        if case_insensitive:
+            ok_vocab = _get_ok_vocab(model, restrict_vocab, case_insensitive)
+            cache[key] = _lookup_words(ok_vocab, words, case_insensitive)
+        else:
+            cache[key] = np.arange(len(words))
+
+    return cache[key]
+
+
+def _get_normalized_vectors(model, indices):
+    vectors = model.vectors[indices].astype(float)
+    _normalize_rows(vectors)
+    return vectors
+
+
+def _calc_word_pairs_similarities(model, filename, delimiter='\t',
+                                  restrict_vocab=DEFAULT_RESTRICT_VOCAB,
+                                  case_insensitive=True, dummy4unknown=False):
+    """Compute the similarities of a word pairs task, as gensim does.
+
+    All the pairs are looked up as two index arrays,
+    and their cosine similarities are computed with one
+    row-wise dot product of the normalized vectors.
+
+    :return: Tuple of the human scores, the model similarities,
+             and the percentage of pairs with unknown words.
+    """
+    # pylint: disable=too-many-arguments
+
+    (first_indices,
+     second_indices,
+     scores) = _get_word_pairs_indices(model, filename, delimiter,
+                                       restrict_vocab, case_insensitive)
+
+    is_known = (first_indices >= 0) & (second_indices >= 0)
+    n_unknown = int((~is_known).sum())
+
+    model_scores = (_get_normalized_vectors(model,
+                                            first_indices[is_known])
+                    * _get_normalized_vectors(model,
+                                              second_indices[is_known])
+                    ).sum(axis=1)
+
+    if dummy4unknown:
+        all_model_scores = np.zeros(len(scores))
+        all_model_scores[is_known] = model_scores
+        model_scores = all_model_scores
+        ratio_unknown_words = n_unknown / len(scores) * 100
+    else:
+        scores = scores[is_known]
+        ratio_unknown_words = n_unknown / (len(scores) + n_unknown) * 100
+
+    return scores, model_scores, ratio_unknown_words
+
+
+def _calc_rowwise_pearson(x, y):
+    x = x - x.mean(axis=1)[:, None]
+    y = y - y.mean(axis=1)[:, None]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return ((x * y).sum(axis=1)
+                / np.sqrt((x ** 2).sum(axis=1) * (y ** 2).sum(axis=1)))
+
+
+def _rank_rows(x):
+    """Rank the values of every row, with the average rank for ties.
+
+    The same as ``scipy.stats.rankdata(x, axis=1)``,
+    which requires scipy 1.4.
+    """
+
+    n_columns = x.shape[1]
+    positions = np.broadcast_to(np.arange(n_columns), x.shape)
+
+    order = np.argsort(x, axis=1, kind='mergesort')
+    sorted_x = np.take_along_axis(x, order, axis=1)
+
+    # the first and the last positions of the ties of every value
+    is_first = np.ones(x.shape, dtype=bool)
+    is_first[:, 1:] = sorted_x[:, 1:] != sorted_x[:, :-1]
+    is_last = np.ones(x.shape, dtype=bool)
+    is_last[:, :-1] = is_first[:, 1:]
+
+    firsts = np.maximum.accumulate(np.where(is_first, positions, 0),
+                                   axis=1)
+    lasts = np.minimum.accumulate(np.where(is_last, positions,
+                                           n_columns - 1)[:, ::-1],
+                                  axis=1)[:, ::-1]
+
+    ranks = np.empty(x.shape)
+    np.put_along_axis(ranks, order, (firsts + lasts) / 2 + 1, axis=1)
+    return ranks
+
+
+def _bootstrap_correlations(scores, model_scores, n_bootstrap,
+                            confidence_level=0.95, seed=None,
+                            block_elements=BOOTSTRAP_BLOCK_ELEMENTS):
+    """Bootstrap confidence intervals of Pearson's r and Spearman's rho.
+
+    The intervals are by the percentile method.
+
+    The pairs are resampled with a matrix of resampling indices
+    (n_bootstrap x n_pairs), and the correlations of all
+    the resamples are computed at once, in blocks of resamples.
+
+    :param scores: Human scores of the pairs.
+    :param model_scores: Model similarities of the pairs.
+    :param int n_bootstrap: Number of bootstrap resamples.
+    :param float confidence_level: Confidence level of the intervals.
+    :param int seed: Seed for the random number generator.
+    :param int block_elements: Maximal number of resampled
+                               pairs to process at once.
+    :return: Tuple of the Pearson's r interval and the Spearman's
+             rho interval, each one as a tuple (low, high).
+    """
+    # pylint: disable=too-many-arguments,too-many-locals
+
+    rng = np.random.RandomState(seed)  # pylint: disable=no-member
+
+    n_pairs = len(scores)
+    block_size = max(1, block_elements // n_pairs)
+
+    pearsons = np.empty(n_bootstrap)
+    spearmans = np.empty(n_bootstrap)
+
+    for start in range(0, n_bootstrap, block_size):
+        n_block = min(block_size, n_bootstrap - start)
+        resamples = rng.randint(n_pairs, size=(n_block, n_pairs))
+
+        x, y = scores[resamples], model_scores[resamples]
+
+        pearsons[start:start + n_block] = _calc_rowwise_pearson(x, y)
+        spearmans[start:start + n_block] = _calc_rowwise_pearson(
+            _rank_rows(x), _rank_rows(y))
+
+    alpha = (1 - confidence_level) / 2
+    quantiles = [100 * alpha, 100 * (1 - alpha)]
+
+    return (tuple(np.nanpercentile(pearsons, quantiles)),
+            tuple(np.nanpercentile(spearmans, quantiles)))
+
+
+def _predict_analogies(vectors, questions, canonical_indices,
+                       block_elements=ANALOGIES_BLOCK_ELEMENTS):
+    """Predict the answers of analogy questions with 3CosAdd, in batches.
+
+    The queries ``b - a + c`` of a block of questions are scored
+    against all the vectors with a single matrix product,
+    the question words are masked out, and the prediction is
+    the first of the top-5 most similar words that is not one of
+    the question words (or their other case variants), as gensim does.
+
+    :param vectors: Normalized vectors (restricted vocabulary).
+    :param questions: Index matrix (n_questions x 4) of the questions.
+    :param canonical_indices: Index of the first case variant
+                              of each word.
+    :param int block_elements: Maximal number of similarities
+                               to compute at once.
+    :return: :class:`numpy.ndarray` of the predicted indices.
+    """
+    # pylint: disable=too-many-locals
+
+    block_size = max(1, block_elements // len(vectors))
+    predicted = np.empty(len(questions), dtype=np.int64)
+
+    for start in range(0, len(questions), block_size):
+        block = questions[start:start + block_size]
+        a, b, c = block[:, 0], block[:, 1], block[:, 2]
+        rows = np.arange(len(block))[:, None]
+
+        # the same order of operations of gensim's most_similar
+        queries = (vectors[b] + vectors[c] - vectors[a]) / 3
+        queries /= np.linalg.norm(queries, axis=1)[:, None]
+
+        similarities = queries @ vectors.T
+        similarities[rows, block[:, :3]] = -np.inf
+
+        best = np.argpartition(-similarities,
+                               ANALOGIES_TOPN - 1,
+                               axis=1)[:, :ANALOGIES_TOPN]
+        best = np.take_along_axis(best,
+                                  np.argsort(-similarities[rows, best],
+                                             axis=1, kind='stable'),
+                                  axis=1)
+
+        candidates = canonical_indices[best]
+        is_ignored = ((candidates == a[:, None])
+                      | (candidates == b[:, None])
+                      | (candidates == c[:, None]))
+
+        # the first candidate which is not ignored,
+        # otherwise the last one
+        positions = np.where(is_ignored.all(axis=1),
+                             ANALOGIES_TOPN - 1,
+                             (~is_ignored).argmax(axis=1))
+
+        predicted[start:start + block_size] = candidates[rows[:, 0],
+                                                         positions]
+
+    return predicted
+
+
+def _evaluate_word_analogies_task(model, filename,
+                                  restrict_vocab=DEFAULT_RESTRICT_VOCAB,
+                                  case_insensitive=True,
+                                  dummy4unknown=False):
+    """Evaluate a word analogies task, as gensim's ``evaluate_word_analogies``.
+
+    3CosAdd, with the first of the top-5 most similar words
+    that is not one of the question words.
+
+    :return: The accuracy on all the questions.
+    """
+
+    sections = _get_analogies_indices(model, filename,
+                                      restrict_vocab, case_insensitive)
+    canonical_indices = _get_canonical_indices(model, restrict_vocab,
+                                               case_insensitive)
+
+    model.init_sims()
+    vectors = model.vectors_norm[:restrict_vocab]
+
+    questions = np.concatenate(sections)
+    is_known = (questions >= 0).all(axis=1)
+
+    n_questions = len(questions) if dummy4unknown else int(is_known.sum())
+    if n_questions == 0:
+        return None
+
+    predicted = _predict_analogies(vectors, questions[is_known],
+                                   canonical_indices)
+    n_correct = int((predicted == questions[is_known, 3]).sum())
+
+    return n_correct / n_questions
+
+
+def _evaluate_word_pairs_results(model, filename,
+                                 n_bootstrap=None, confidence_level=0.95,
+                                 seed=None, **kwargs_word_pairs):
+    # pylint: disable=too-many-arguments
+
+    (scores,
+     model_scores,
+     ratio_unknown_words) = _calc_word_pairs_similarities(model, filename,
+                                                          **kwargs_word_pairs)
+
+    pearson = pearsonr(scores, model_scores)
+    spearman = spearmanr(scores, model_scores)
+
+    results = {'pearson_r': pearson[0],
+               'pearson_pvalue': pearson[1],
+               'spearman_r': spearman.correlation,
+               'spearman_pvalue': spearman.pvalue,
+               'ratio_unkonwn_words': ratio_unknown_words}
+
+    if n_bootstrap is not None:
+        ((results['pearson_r_ci_low'],
+          results['pearson_r_ci_high']),
+         (results['spearman_r_ci_low'],
+          results['spearman_r_ci_high'])) = _bootstrap_correlations(
+              scores, model_scores, n_bootstrap, confidence_level, seed)
+
+    return results
+
+
+def _evaluate_word_analogies_results(model, filename,
+                                     **kwargs_word_analogies):
+    return {'score': _evaluate_word_analogies_task(model, filename,
+                                                   **kwargs_word_analogies)}
+
+
+def _run_benchmark_task(model, task):
+    evaluate, filename, kwargs = task
+
+    start = time.perf_counter()
+    results = evaluate(model, filename, **kwargs)
+    results[TIMING_FIELD] = time.perf_counter() - start
+
+    return results
+
+
+def _run_benchmark_tasks(model, tasks, n_jobs=None, executor='thread'):
+    """Run (evaluate function, filename, kwargs) benchmark tasks.
+
+    The results are in the order of the tasks.
+    The model is shared by the workers without copying it,
+    see :func:`~responsibly.we.utils._run_tasks`.
+
+    The word analogies tasks use the normalized vectors of the model
+    (``vectors_norm``, as gensim's ``evaluate_word_analogies``),
+    so they are computed once before the tasks start,
+    and they are kept on the model.
+    """
+
+    if any(evaluate is _evaluate_word_analogies_results
+           for evaluate, _, _ in tasks):
+        model.init_sims()
+
+    return _run_tasks(_run_benchmark_task, model, tasks, n_jobs, executor)
+
+
+def _get_word_pairs_tasks(kwargs_word_pairs, n_bootstrap=None,
+                          confidence_level=0.95, seed=None):
+    if kwargs_word_pairs is None:
+        kwargs_word_pairs = {}
+
+    kwargs = dict(kwargs_word_pairs,
+                  n_bootstrap=n_bootstrap,
+                  confidence_level=confidence_level,
+                  seed=seed)
+
+    return [(_evaluate_word_pairs_results, filename, kwargs)
+            for filename in WORD_PAIRS_TASKS.values()]
+
+
+def _get_word_analogies_tasks(kwargs_word_analogies):
+    if kwargs_word_analogies is None:
+        kwargs_word_analogies = {}
+
+    return [(_evaluate_word_analogies_results, filename,
+             kwargs_word_analogies)
+            for filename in ANALOGIES_TASKS.values()]
+
+
+def _build_results_df(names, results, fields, with_timing):
+    if with_timing:
+        fields = fields + [TIMING_FIELD]
+
+    return (pd.DataFrame(dict(zip(names, results)))
+            .reindex(fields)
+            .transpose()
+            .round(3))
+
+
+def _build_word_pairs_df(results, n_bootstrap, with_timing):
+    fields = PAIR_WORDS_EVALUATION_FIELDS
+    if n_bootstrap is not None:
+        fields = fields + PAIR_WORDS_BOOTSTRAP_FIELDS
+
+    return _build_results_df(WORD_PAIRS_TASKS, results, fields, with_timing)
+
+
+def _build_word_analogies_df(results, with_timing):
+    return _build_results_df(ANALOGIES_TASKS, results,
+                             ANALOGIES_EVALUATION_FIELDS, with_timing)
+
+
+def evaluate_word_pairs(model, kwargs_word_pairs=None,
+                        n_bootstrap=None, confidence_level=0.95,
+                        seed=None, n_jobs=None, executor='thread',
+                        with_timing=False):
     """
     Evaluate word pairs tasks.
 
+    The datasets are parsed only once, and the lookup of their words
+    in the vocabulary is cached per vocabulary, so evaluating
+    a debiased copy of a model (that shares the vocabulary)
+    skips both.
+
+    With ``n_bootstrap``, percentile bootstrap confidence intervals
+    of Pearson's r and Spearman's rho are added as columns,
+    e.g., to check whether debiasing really changed the quality
+    of the embedding. With the same ``seed``, the pairs of
+    two models with the same vocabulary are resampled the same way.
+
     :param model: Word embedding.
     :param kwargs_word_pairs: Kwargs for
                               evaluate_word_pairs
                               method.
     :type kwargs_word_pairs: dict or None
+    :param int n_bootstrap: Number of bootstrap resamples,
+                            or None to skip the confidence intervals.
+    :param float confidence_level: Confidence level of the intervals.
+    :param int seed: Seed for the bootstrap resampling.
+    :param int n_jobs: Number of tasks to evaluate in parallel.
+                       If `-1`, then the number of CPUs is used.
+                       By default, the evaluation is serial.
+    :param str executor: Parallelize with threads (`'thread'`)
+                         or with forked processes (`'process'`),
+                         which share the model without copying it.
+    :param bool with_timing: Whether to add the running time
+                             of each task (in seconds) as a column.
     :return: :class:`pandas.DataFrame` of evaluation results.
     """
+    # pylint: disable=too-many-arguments
 
-    if kwargs_word_pairs is None:
-        kwargs_word_pairs = {}
-
-    results = {}
+    results = _run_benchmark_tasks(model,
+                                   _get_word_pairs_tasks(kwargs_word_pairs,
+                                                         n_bootstrap,
+                                                         confidence_level,
+                                                         seed),
+                                   n_jobs, executor)
 
-    for name, filename in WORD_PAIRS_TASKS.items():
-        path = _get_data_resource_path(filename)
-        (pearson,
-         spearman,
-         ratio_unknown_words) = model.evaluate_word_pairs(path,
-                                                          **kwargs_word_pairs)  # pylint: disable=C0301
+    return _build_word_pairs_df(results, n_bootstrap, with_timing)
 
-        results[name] = {'pearson_r': pearson[0],
-                         'pearson_pvalue': pearson[1],
-                         'spearman_r': spearman.correlation,
-                         'spearman_pvalue': spearman.pvalue,
-                         'ratio_unkonwn_words': ratio_unknown_words}
 
-    df = (pd.DataFrame(results)
-          .reindex(PAIR_WORDS_EVALUATION_FIELDS)
-          .transpose()
-          .round(3))
-
-    return df
-
-
-def evaluate_word_analogies(model, kwargs_word_analogies=None):
+def evaluate_word_analogies(model, kwargs_word_analogies=None,
+                            n_jobs=None, executor='thread',
+                            with_timing=False):
     """
     Evaluate word analogies tasks.
 
+    The datasets are parsed only once, and the lookup of their words
+    in the vocabulary is cached per vocabulary, so evaluating
+    a debiased copy of a model (that shares the vocabulary)
+    skips both.
+
+    As gensim's ``evaluate_word_analogies``, the normalized vectors
+    of the model (``vectors_norm``) are computed and kept on it.
+
     :param model: Word embedding.
     :param kwargs_word_analogies: Kwargs for
                                   evaluate_word_analogies
                                   method.
     :type evaluate_word_analogies: dict or None
+    :param int n_jobs: Number of tasks to evaluate in parallel.
+                       If `-1`, then the number of CPUs is used.
+                       By default, the evaluation is serial.
+    :param str executor: Parallelize with threads (`'thread'`)
+                         or with forked processes (`'process'`).
+    :param bool with_timing: Whether to add the running time
+                             of each task (in seconds) as a column.
     :return: :class:`pandas.DataFrame` of evaluation results.
     """
 
-    if kwargs_word_analogies is None:
-        kwargs_word_analogies = {}
-
-    results = {}
-
-    for name, filename in ANALOGIES_TASKS.items():
-        path = _get_data_resource_path(filename)
-        overall_score, _ = model.evaluate_word_analogies(path,
-                                                         **kwargs_word_analogies)  # pylint: disable=C0301
-
-        results[name] = {'score': overall_score}
-
-        df = (pd.DataFrame(results)
-              .transpose()
-              .round(3))
+    results = _run_benchmark_tasks(model,
+                                   _get_word_analogies_tasks(kwargs_word_analogies),  # pylint: disable=C0301
+                                   n_jobs, executor)
 
-    return df
+    return _build_word_analogies_df(results, with_timing)
 
 
 def evaluate_word_embedding(model,
                             kwargs_word_pairs=None,
-                            kwargs_word_analogies=None):
+                            kwargs_word_analogies=None,
+                            n_jobs=None, executor='thread',
+                            with_timing=False):
     """
     Evaluate word pairs tasks and word analogies tasks.
 
+    With ``n_jobs``, all the tasks run in one pool,
+    the (longer) word analogies tasks first.
+
+    The normalized vectors of the model (``vectors_norm``)
+    are computed and kept on it, as by :func:`evaluate_word_analogies`.
+
     :param model: Word embedding.
     :param kwargs_word_pairs: Kwargs fo
                               evaluate_word_pairs
@@ -159,7 +734,26 @@ def evaluate_word_embedding(model,
                                   evaluate_word_analogies
                                   method.
     :type evaluate_word_analogies: dict or None
+    :param int n_jobs: Number of tasks to evaluate in parallel.
+                       If `-1`, then the number of CPUs is used.
+                       By default, the evaluation is serial.
+    :param str executor: Parallelize with threads (`'thread'`)
+                         or with forked processes (`'process'`),
+                         which share the model without copying it.
+    :param bool with_timing: Whether to add the running time
+                             of each task (in seconds) as a column.
     :return: Tuple of DataFrame for the evaluation results.
     """
-    return (evaluate_word_pairs(model, kwargs_word_pairs),
-            evaluate_word_analogies(model, kwargs_word_analogies))
+    # pylint: disable=too-many-arguments
+
+    analogies_tasks = _get_word_analogies_tasks(kwargs_word_analogies)
+    pairs_tasks = _get_word_pairs_tasks(kwargs_word_pairs)
+
+    results = _run_benchmark_tasks(model,
+                                   analogies_tasks + pairs_tasks,
+                                   n_jobs, executor)
+
+    return (_build_word_pairs_df(results[len(analogies_tasks):],
+                                 None, with_timing),
+            _build_word_analogies_df(results[:len(analogies_tasks)],
+                                     with_timing))
@@ -24,6 +24,12 @@ References:
       `Fair is Better than Sensational: Man is to Doctor
       as Woman is to Doctor <https://arxiv.org/abs/1905.09866>`_.
 
+    - Manzini, T., Lim, Y. C., Tsvetkov, Y., & Black, A. W. (2019).
+      `Black is to Criminal as Caucasian is to Police:
+      Detecting and Removing Multiclass Bias in Word Embeddings
+      <https://arxiv.org/abs/1904.04047>`_.
+      In Proceedings of NAACL-HLT 2019.
+
 Usage
 ~~~~~
 
@@ -70,18 +76,30 @@ Calculated by
 and
 :meth:`~responsibly.we.bias.GenderBiasWE.generate_closest_words_indirect_bias`.
 
+Bias Subspace
+~~~~~~~~~~~~~
+
+Instead of a single direction, a bias of more than two groups
+(e.g., race) can be captured by a k-dimensional subspace
+(Manzini et al., 2019), which is identified by
+``_identify_subspace`` out of definitional sets of words.
+Then, the direct bias, neutralize and equalize
+operate on the orthonormal basis of the subspace at once.
+The methods that are defined by a direction
+(e.g., projections, analogies and the indirect bias)
+are available only for a direction.
+
 """
 
 import copy
 import warnings
+import weakref
+from collections import namedtuple
 
-import matplotlib.pylab as plt
 import numpy as np
 import pandas as pd
-import seaborn as sns
 from scipy.stats import pearsonr, spearmanr
-from sklearn.decomposition import PCA
-from sklearn.metrics.pairwise import euclidean_distances
+from sklearn.linear_model import SGDClassifier
 from sklearn.svm import LinearSVC
 from tabulate import tabulate
 from tqdm import tqdm
@@ -89,13 +107,17 @@ from tqdm import tqdm
 from responsibly.consts import RANDOM_STATE
 from responsibly.utils import _warning_setup
 from responsibly.we.benchmark import evaluate_word_embedding
-from responsibly.we.data import BOLUKBASI_DATA, OCCUPATION_FEMALE_PRECENTAGE
+from responsibly.we.data import (
+    get_bolukbasi_data, get_occupation_female_precentage,
+)
 from responsibly.we.utils import (
-    assert_gensim_keyed_vectors, cosine_similarity, generate_one_word_forms,
-    generate_words_forms, get_seed_vector, most_similar, normalize,
-    plot_clustering_as_classification, project_params, project_reject_vector,
-    project_vector, reject_vector, round_to_extreme,
-    take_two_sides_extreme_sorted, update_word_vector,
+    VECTORS_CHUNK_SIZE, _normalize_rows, assert_gensim_keyed_vectors,
+    calc_projections_by_indices, copy_model_vectors, cosine_similarity,
+    generate_one_word_forms, generate_words_forms, get_model_version,
+    get_seed_vector, get_word_indices, get_words_mask, most_similar_batch,
+    neutralize_word_vectors, normalize, normalize_model_vectors,
+    plot_clustering_as_classification, project_params, round_to_extreme,
+    take_two_sides_extreme_sorted, update_word_vectors,
 )
 
 
@@ -103,13 +125,165 @@ DIRECTION_METHODS = ['single', 'sum', 'pca']
 DEBIAS_METHODS = ['neutralize', 'hard', 'soft']
 FIRST_PC_THRESHOLD = 0.5
 MAX_NON_SPECIFIC_EXAMPLES = 1000
+SPECIFIC_WORDS_CLASSIFIERS = ['svm', 'sgd']
+SGD_N_EPOCHS = 5
+ANALOGIES_CANDIDATES_FACTOR = 10
+ANALOGIES_BLOCK_SIZE = 1000
+
+PCASubspace = namedtuple('PCASubspace', ['components_',
+                                         'explained_variance_',
+                                         'explained_variance_ratio_'])
+
+# identified directions by model, keyed by the identification arguments,
+# with the vectors of the words they were identified from
+_DIRECTIONS_CACHE = weakref.WeakKeyDictionary()
+
+# extracted word data of GenderBiasWE by model, keyed by only_lower,
+# shared only among models that were registered with the same cache
+_WORD_DATA_CACHES = weakref.WeakKeyDictionary()
 
 __all__ = ['GenderBiasWE', 'BiasWordEmbedding']
 
 _warning_setup()
 
 
-class BiasWordEmbedding:
+def _batch_disjoint_sets(sets):
+    """Split sets of words into batches of same-size and disjoint sets.
+
+    A set is put in a later batch than every batch that shares
+    a word with it, so processing the batches one after the other
+    is the same as processing the sets one by one.
+    """
+
+    batches = {}
+    last_order_by_word = {}
+
+    for words in sets:
+        order = 1 + max(last_order_by_word.get(word, -1) for word in words)
+
+        for word in words:
+            last_order_by_word[word] = order
+
+        batches.setdefault((order, len(words)), []).append(words)
+
+    return [batches[key] for key in sorted(batches)]
+
+
+def _set_word_data_cache(model, cache):
+    """Share the extracted word data of :class:`GenderBiasWE`.
+
+    The cache should be shared only among models with the same
+    vocabulary (e.g., the checkpoints of a single training).
+    """
+
+    _WORD_DATA_CACHES[model] = cache
+
+
+def _to_hashable(obj):
+    if isinstance(obj, (list, tuple)):
+        return tuple(_to_hashable(item) for item in obj)
+    return obj
+
+
+def _flatten_words(obj):
+    if isinstance(obj, str):
+        return [obj]
+    return [word for item in obj for word in _flatten_words(item)]
+
+
+def _generate_analogies_candidates(normalized_vectors, seed_vector, delta,
+                                   n_candidates,
+                                   block_size=ANALOGIES_BLOCK_SIZE):
+    """Generate the best pairs (x, y) such that x - y ~ seed vector.
+
+    The pairs are scanned in blocks of rows, so the peak memory is
+    O(block_size x vocab) rather than O(vocab^2).
+    For normalized vectors, ||x - y||^2 = 2 - 2 x·y, and the cosine
+    similarity between x - y and the seed vector is
+    (x·seed - y·seed) / ||x - y||, so only the similarities
+    of a block are materialized. Each block is compared only to the
+    following rows, as the pair (y, x) has the same distance
+    and the opposite cosine similarity of the pair (x, y).
+    Only the best `n_candidates` pairs by their cosine similarity
+    are kept along the scan, and then they are scored again
+    with the exact x - y vectors.
+
+    :return: Tuple of the pairs indices, their distances,
+             their cosine similarity with the seed vector
+             (all sorted by it in descending order),
+             and the number of pairs under `delta`.
+    """
+    # pylint: disable=too-many-locals
+
+    seed_projections = normalized_vectors @ seed_vector
+
+    best_indices = np.empty((0, 2), dtype=np.int64)
+    best_distances = np.empty(0, dtype=normalized_vectors.dtype)
+    best_cos_distances = np.empty(0, dtype=seed_projections.dtype)
+    n_pairs = 0
+
+    for start in range(0, len(normalized_vectors), block_size):
+        block = normalized_vectors[start:start + block_size]
+
+        distances = block @ normalized_vectors[start:].T
+        distances *= -2
+        distances += 2
+        np.clip(distances, 0, None, out=distances)
+        np.sqrt(distances, out=distances)
+
+        # `distances` must be not-equal to zero
+        # otherwise, x-y will be the zero vector, and every cosine
+        # similarity will be equal to zero.
+        # This cause to the **limitation** of this method which enforce
+        # a not-same words for x and y.
+        distances[np.tril_indices(len(block), m=distances.shape[1])] = 0
+        x_indices, y_indices = np.nonzero((distances < delta)
+                                          & (distances != 0))
+
+        pairs_distances = distances[x_indices, y_indices]
+        x_indices += start
+        y_indices += start
+
+        cos_distances = ((seed_projections[x_indices]
+                          - seed_projections[y_indices])
+                         / pairs_distances)
+
+        n_pairs += 2 * len(cos_distances)
+
+        best_indices = np.concatenate([best_indices,
+                                       np.column_stack([x_indices,
+                                                        y_indices]),
+                                       np.column_stack([y_indices,
+                                                        x_indices])])
+        best_distances = np.concatenate([best_distances,
+                                         pairs_distances,
+                                         pairs_distances])
+        best_cos_distances = np.concatenate([best_cos_distances,
+                                             cos_distances,
+                                             -cos_distances])
+
+        if len(best_cos_distances) > n_candidates:
+            top_indices = np.argpartition(-best_cos_distances,
+                                          n_candidates)[:n_candidates]
+            best_indices = best_indices[top_indices]
+            best_distances = best_distances[top_indices]
+            best_cos_distances = best_cos_distances[top_indices]
+
+    x_minus_y_vectors = (normalized_vectors[best_indices[:, 0]]
+                         - normalized_vectors[best_indices[:, 1]])
+    normalized_x_minus_y_vectors = (x_minus_y_vectors
+                                    / np.linalg.norm(x_minus_y_vectors, axis=1)[:, None])  # pylint: disable=line-too-long
+    best_cos_distances = normalized_x_minus_y_vectors @ seed_vector
+
+    sorted_indices = np.argsort(best_cos_distances)[::-1]
+
+    return (best_indices[sorted_indices],
+            best_distances[sorted_indices],
+            best_cos_distances[sorted_indices],
+            n_pairs)
+
+
+class BiasWordEmbedding:  # pylint: disable=too-many-instance-attributes
     """Measure and adjust a bias in English word embedding.
 
     :param model: Word embedding model of ``gensim.model.KeyedVectors``
@@ -118,6 +292,14 @@ class BiasWordEmbedding:
     :param bool verbose: Set verbosity
     :param bool to_normalize: Whether to normalize all the vectors
                               (recommended!)
+
+    When the vectors are not normalized, their normalized copy is
+    cached, which for the whole vocabulary takes as much memory as
+    the vectors themselves; call :meth:`clear_normalized_vectors_cache`
+    to free it. Update the vectors of the model with the functions of
+    :mod:`responsibly.we.utils`, or call
+    :func:`responsibly.we.utils.bump_model_version` after
+    writing to ``model.vectors`` directly.
     """
 
     def __init__(self, model, only_lower=False, verbose=False,
@@ -146,9 +328,13 @@ class BiasWordEmbedding:
         self.direction = None
         self.positive_end = None
         self.negative_end = None
+        self.subspace = None
+
+        # (model, model version, normalized vectors)
+        self._normalized_vectors_cache = None
 
         if to_normalize:
-            self.model.init_sims(replace=True)
+            normalize_model_vectors(self.model)
 
     def __copy__(self):
         bias_word_embedding = self.__class__(self.model,
@@ -158,6 +344,7 @@ class BiasWordEmbedding:
         bias_word_embedding.direction = copy.deepcopy(self.direction)
         bias_word_embedding.positive_end = copy.deepcopy(self.positive_end)
         bias_word_embedding.negative_end = copy.deepcopy(self.negative_end)
+        bias_word_embedding.subspace = copy.deepcopy(self.subspace)
         return bias_word_embedding
 
     def __deepcopy__(self, memo):
@@ -171,6 +358,106 @@ class BiasWordEmbedding:
     def __contains__(self, item):
         return item in self.model
 
+    def _get_normalized_matrix(self, restrict_vocab=None):
+        """Get the normalized vectors of the first words of the vocabulary.
+
+        If the model is normalized in place, these are its vectors.
+        Otherwise, the normalized vectors are computed once
+        (or taken from gensim's ``vectors_norm``, without a copy),
+        and they are kept until the model is updated by :meth:`debias`
+        or by the update functions of :mod:`responsibly.we.utils`,
+        which bump the version of the model, until the vectors
+        array of the model is replaced, or until
+        :meth:`clear_normalized_vectors_cache` is called.
+
+        Only the requested prefix of the vocabulary is normalized
+        and kept, so for the whole vocabulary, the kept copy
+        is as large as the vectors of the model.
+
+        A direct in-place write to ``model.vectors`` is not detected;
+        it should be followed by
+        :func:`responsibly.we.utils.bump_model_version`.
+
+        :param int restrict_vocab: Number of the first words
+                                   of the vocabulary. By default, all.
+        :return: :class:`numpy.ndarray` of the normalized vectors
+        """
+
+        if self.model.vectors_norm is self.model.vectors:
+            return (self.model.vectors if restrict_vocab is None
+                    else self.model.vectors[:restrict_vocab])
+
+        n_vectors = len(self.model.vectors[:restrict_vocab])
+
+        if self._get_cached_normalized_vectors(n_vectors) is None:
+            if self.model.vectors_norm is not None:
+                normalized_vectors = self.model.vectors_norm[:n_vectors]
+            else:
+                normalized_vectors = np.empty_like(
+                    self.model.vectors[:n_vectors])
+                for start in range(0, n_vectors, VECTORS_CHUNK_SIZE):
+                    chunk = slice(start, min(start + VECTORS_CHUNK_SIZE,
+                                             n_vectors))
+                    normalized_vectors[chunk] = self.model.vectors[chunk]
+                    _normalize_rows(normalized_vectors[chunk])
+
+            self._normalized_vectors_cache = (self.model,
+                                              self.model.vectors,
+                                              get_model_version(self.model),
+                                              normalized_vectors)
+
+        return self._get_cached_normalized_vectors(n_vectors)
+
+    def _get_cached_normalized_vectors(self, n_vectors):
+        """Get the first cached normalized vectors, if they are valid."""
+
+        if self._normalized_vectors_cache is None:
+            return None
+
+        model, vectors, version, normalized_vectors = \
+            self._normalized_vectors_cache
+
+        if (model is not self.model
+                or vectors is not self.model.vectors
+                or version != get_model_version(self.model)
+                or len(normalized_vectors) < n_vectors):
+            return None
+
+        if len(normalized_vectors) == n_vectors:
+            return normalized_vectors
+
+        return normalized_vectors[:n_vectors]
+
+    def clear_normalized_vectors_cache(self):
+        """Drop the cached normalized vectors to free their memory.
+
+        They are computed again on demand.
+        """
+
+        self._normalized_vectors_cache = None
+
+    def _get_normalized_vectors(self, indices):
+        """Get the normalized vectors of given vocabulary indices.
+
+        They are read from the cached normalized vectors if they
+        cover the indices, otherwise only the given vectors
+        are normalized.
+        """
+
+        if self.model.vectors_norm is self.model.vectors:
+            return self.model.vectors[indices]
+
+        indices = np.asarray(indices, dtype=np.int64)
+        n_vectors = indices.max() + 1 if len(indices) else 0
+        normalized_vectors = self._get_cached_normalized_vectors(n_vectors)
+
+        if normalized_vectors is not None:
+            return normalized_vectors[indices]
+
+        vectors = np.array(self.model.vectors[indices])
+        _normalize_rows(vectors)
+        return vectors
+
     def _filter_words_by_model(self, words):
         return [word for word in words if word in self]
 
@@ -180,6 +467,23 @@ class BiasWordEmbedding:
                                ' for this {} instance'
                                .format(self.__class__.__name__))
 
+    def _get_subspace_basis(self):
+        """Get the orthonormal basis (k x d matrix) of the bias subspace.
+
+        For a direction, it is a 1 x d matrix.
+        """
+
+        if self.subspace is not None:
+            return self.subspace
+
+        if self.direction is None:
+            raise RuntimeError('The direction or the subspace'
+                               ' was not identified'
+                               ' for this {} instance'
+                               .format(self.__class__.__name__))
+
+        return normalize(self.direction)[None, :]
+
     # There is a mistake in the article
     # it is written (section 5.1):
     # "To identify the gender subspace, we took the ten gender pair difference
@@ -187,33 +491,91 @@ class BiasWordEmbedding:
     # however in the source code:
     # https://github.com/tolga-b/debiaswe/blob/10277b23e187ee4bd2b6872b507163ef4198686b/debiaswe/we.py#L235-L245
     def _identify_subspace_by_pca(self, definitional_pairs, n_components):
-        matrix = []
-
-        for word1, word2 in definitional_pairs:
-            vector1 = normalize(self[word1])
-            vector2 = normalize(self[word2])
-
-            center = (vector1 + vector2) / 2
-
-            matrix.append(vector1 - center)
-            matrix.append(vector2 - center)
-
-        pca = PCA(n_components=n_components)
-        pca.fit(matrix)
+        set_sizes = [len(definitional_set)
+                     for definitional_set in definitional_pairs]
+        indices = get_word_indices(self.model,
+                                   [word
+                                    for definitional_set in definitional_pairs
+                                    for word in definitional_set])
+        vectors = self.model.vectors[indices].astype(float)
+        _normalize_rows(vectors)
+
+        # the difference vectors from the centers of the sets (e.g., pairs)
+        set_starts = np.concatenate([[0], np.cumsum(set_sizes)[:-1]])
+        centers = (np.add.reduceat(vectors, set_starts, axis=0)
+                   / np.array(set_sizes)[:, None])
+        matrix = vectors - np.repeat(centers, set_sizes, axis=0)
+
+        # PCA by the SVD of the (tiny) centered matrix,
+        # same as sklearn.decomposition.PCA with the full solver
+        matrix -= matrix.mean(axis=0)
+        _, singular_values, components = np.linalg.svd(matrix,
+                                                       full_matrices=False)
+
+        explained_variance = singular_values ** 2 / (len(matrix) - 1)
+        explained_variance_ratio = (explained_variance
+                                    / explained_variance.sum())
+
+        subspace = PCASubspace(components[:n_components],
+                               explained_variance[:n_components],
+                               explained_variance_ratio[:n_components])
 
         if self._verbose:
-            table = enumerate(pca.explained_variance_ratio_, start=1)
-            headers = ['Principal Component',
-                       'Explained Variance Ratio']
-            print(tabulate(table, headers=headers))
+            table = enumerate(subspace.explained_variance_ratio_, start=1)
+            print(tabulate(table, headers=['Principal Component',
+                                           'Explained Variance Ratio']))
 
-        return pca
+        return subspace
 
     # TODO: add the SVD method from section 6 step 1
     # It seems there is a mistake there, I think it is the same as PCA
     # just with replacing it with SVD
+    def _get_cached_direction(self, cache_key, words, calc):
+        """Get an identified direction (or subspace) from the cache.
+
+        The directions are cached per model, so they are shared
+        among the objects of the same model (e.g., in a sweep over
+        definitional pairs). A direction depends only on the vectors
+        of the words it is identified from, so these vectors
+        are kept with it, and it is used only if they are still equal.
+        Therefore, any update of the vectors is detected,
+        even if it is done directly on ``model.vectors``,
+        and the check costs only the comparison of these few vectors.
+
+        :param tuple cache_key: The identification arguments.
+        :param list words: The words that the direction depends on.
+        :param calc: Function that identifies the direction.
+        :return: :class:`numpy.ndarray` of the direction
+                 (or the subspace basis).
+        """
+
+        indices = get_word_indices(self.model,
+                                   [word for word in words
+                                    if word in self.model])
+        vectors = self.model.vectors[indices]
+
+        model_cache = _DIRECTIONS_CACHE.setdefault(self.model, {})
+
+        if (cache_key in model_cache
+                and np.array_equal(model_cache[cache_key][0], vectors)):
+            if self._verbose:
+                print('Using the cached direction.')
+            return model_cache[cache_key][1].copy()
+
+        direction = calc()
+        model_cache[cache_key] = (vectors, direction.copy())
+
+        return direction
+
     def _identify_direction(self, positive_end, negative_end,
                             definitional, method='pca'):
+        """Identify the direction of the bias.
+
+        The identified direction is cached per model,
+        see :meth:`_get_cached_direction`. It is identified again
+        if the vectors of ``positive_end``, ``negative_end``
+        or the ``definitional`` words have changed.
+        """
         if method not in DIRECTION_METHODS:
             raise ValueError('method should be one of {}, {} was given'.format(
                 DIRECTION_METHODS, method))
@@ -225,6 +587,50 @@ class BiasWordEmbedding:
         if self._verbose:
             print('Identify direction using {} method...'.format(method))
 
+        direction = self._get_cached_direction(
+            (method, positive_end, negative_end, _to_hashable(definitional)),
+            [positive_end, negative_end] + _flatten_words(definitional),
+            lambda: self._calc_direction(positive_end, negative_end,
+                                         definitional, method))
+
+        self.direction = direction
+        self.subspace = None
+        self.positive_end = positive_end
+        self.negative_end = negative_end
+
+    def _identify_subspace(self, definitional_sets, n_components):
+        """Identify a k-dimensional bias subspace.
+
+        The subspace is spanned by the first principal components
+        of the differences of the words of the definitional sets
+        from their centers. For example, a race subspace from
+        sets of words of multiple groups.
+
+        Then, the direct bias, neutralize and equalize
+        operate on the subspace instead of a single direction.
+
+        :param list definitional_sets: List of definitional sets of words
+        :param int n_components: The dimension (k) of the subspace
+        """
+
+        if self._verbose:
+            print('Identify {}-dimensional subspace...'
+                  .format(n_components))
+
+        subspace = self._get_cached_direction(
+            ('subspace', n_components, _to_hashable(definitional_sets)),
+            _flatten_words(definitional_sets),
+            lambda: (self._identify_subspace_by_pca(definitional_sets,
+                                                    n_components)
+                     .components_))
+
+        self.subspace = subspace
+        self.direction = None
+        self.positive_end = None
+        self.negative_end = None
+
+    def _calc_direction(self, positive_end, negative_end,
+                        definitional, method):
         direction = None
 
         if method == 'single':
@@ -263,9 +669,7 @@ class BiasWordEmbedding:
             if ends_diff_projection < 0:
                 direction = -direction  # pylint: disable=invalid-unary-operand-type
 
-        self.direction = direction
-        self.positive_end = positive_end
-        self.negative_end = negative_end
+        return direction
 
     def project_on_direction(self, word):
         """Project the normalized vector of the word on the direction.
@@ -274,21 +678,32 @@ class BiasWordEmbedding:
         :return float: The projection scalar
         """
 
-        self._is_direction_identified()
+        return self._calc_projections([word])[0]
 
-        vector = self[word]
-        projection_score = self.model.cosine_similarities(self.direction,
-                                                          [vector])[0]
-        return projection_score
+    def _calc_projections(self, words):
+        """Project the normalized vectors of words on the direction.
+
+        All the word indices are resolved at once, and the projection
+        is done with a matrix-vector product over the model's vectors.
+
+        :param list words: The words to project,
+                           or an array of their vocabulary indices
+        :return: :class:`numpy.ndarray` of the projection scalars
+        """
 
-    def _calc_projection_scores(self, words):
         self._is_direction_identified()
 
-        df = pd.DataFrame({'word': words})
+        if (isinstance(words, np.ndarray)
+                and np.issubdtype(words.dtype, np.integer)):
+            indices = words
+        else:
+            indices = get_word_indices(self.model, words)
+        return calc_projections_by_indices(self.model, indices,
+                                           self.direction)
 
-        # TODO: maybe using cosine_similarities on all the vectors?
-        # it might be faster
-        df['projection'] = df['word'].apply(self.project_on_direction)
+    def _calc_projection_scores(self, words):
+        df = pd.DataFrame({'word': words,
+                           'projection': self._calc_projections(words)})
         df = df.sort_values('projection', ascending=False)
 
         return df
@@ -329,6 +744,10 @@ class BiasWordEmbedding:
         :return: The ax object of the plot
         """
 
+        # pylint: disable=import-outside-toplevel
+        import matplotlib.pylab as plt
+        import seaborn as sns
+
         self._is_direction_identified()
 
         projections_df = self._calc_projection_scores(words)
@@ -372,10 +791,16 @@ class BiasWordEmbedding:
     def plot_dist_projections_on_direction(self, word_groups, ax=None):
         """Plot the projection scalars distribution on the direction.
 
-        :param dict word_groups word: The groups to projects
+        :param dict word_groups word: The groups to projects,
+                                      as lists of words or arrays
+                                      of their vocabulary indices
         :return float: The ax object of the plot
         """
 
+        # pylint: disable=import-outside-toplevel
+        import matplotlib.pylab as plt
+        import seaborn as sns
+
         if ax is None:
             _, ax = plt.subplots(1)
 
@@ -384,9 +809,7 @@ class BiasWordEmbedding:
         for name in names:
             words = word_groups[name]
             label = '{} (#{})'.format(name, len(words))
-            vectors = [self[word] for word in words]
-            projections = self.model.cosine_similarities(self.direction,
-                                                         vectors)
+            projections = self._calc_projections(words)
             sns.distplot(projections, hist=False, label=label, ax=ax)
 
         plt.axvline(0, color='k', linestyle='--')
@@ -422,11 +845,10 @@ class BiasWordEmbedding:
                                      for web in (word_embedding_bias_dict
                                                  .values()))]
 
-        projections = {name: web._calc_projection_scores(intersection_words)['projection']  # pylint: disable=C0301
+        projections = {name: web._calc_projections(intersection_words)
                        for name, web in word_embedding_bias_dict.items()}
 
-        df = pd.DataFrame(projections)
-        df.index = intersection_words
+        df = pd.DataFrame(projections, index=intersection_words)
 
         rho, _ = spearmanr(*df.transpose().values)
         return df, rho
@@ -445,7 +867,8 @@ class BiasWordEmbedding:
         :type scatter_kwargs: dict or None
         :return: The ax object of the plot
         """
-        # pylint: disable=W0212
+        # pylint: disable=W0212,import-outside-toplevel
+        import matplotlib.pylab as plt
 
         df, rho = cls._calc_bias_across_word_embeddings(word_embedding_bias_dict,  # pylint: disable=C0301
                                                         words)
@@ -479,7 +902,6 @@ class BiasWordEmbedding:
 
         return ax
 
-    # TODO: refactor for speed and clarity
     def generate_analogies(self, n_analogies=100, seed='ends',
                            multiple=False,
                            delta=1., restrict_vocab=30000,
@@ -535,72 +957,70 @@ class BiasWordEmbedding:
          positive_end,
          negative_end) = get_seed_vector(seed, self)
 
-        restrict_vocab_vectors = self.model.vectors[:restrict_vocab]
-
-        normalized_vectors = (restrict_vocab_vectors
-                              / np.linalg.norm(restrict_vocab_vectors, axis=1)[:, None])
-
-        pairs_distances = euclidean_distances(normalized_vectors, normalized_vectors)
-
-        # `pairs_distances` must be not-equal to zero
-        # otherwise, x-y will be the zero vector, and every cosine similarity
-        # will be equal to zero.
-        # This cause to the **limitation** of this method which enforce a not-same
-        # words for x and y.
-        pairs_mask = (pairs_distances < delta) & (pairs_distances != 0)
+        normalized_vectors = self._get_normalized_matrix(restrict_vocab)
 
-        pairs_indices = np.array(np.nonzero(pairs_mask)).T
-        x_vectors = np.take(normalized_vectors, pairs_indices[:, 0], axis=0)
-        y_vectors = np.take(normalized_vectors, pairs_indices[:, 1], axis=0)
+        # Only the best candidate pairs are kept, and if they are not
+        # enough to generate `n_analogies` (because of `multiple`),
+        # the candidates are generated again with a larger bound.
+        n_candidates = ANALOGIES_CANDIDATES_FACTOR * n_analogies
 
-        x_minus_y_vectors = x_vectors - y_vectors
-        normalized_x_minus_y_vectors = (x_minus_y_vectors
-                                        / np.linalg.norm(x_minus_y_vectors, axis=1)[:, None])
+        while True:
+            (pairs_indices,
+             pairs_distances,
+             cos_distances,
+             n_pairs) = _generate_analogies_candidates(normalized_vectors,
+                                                       seed_vector,
+                                                       delta,
+                                                       n_candidates)
 
-        cos_distances = normalized_x_minus_y_vectors @ seed_vector
+            analogies = []
+            generated_words_x = set()
+            generated_words_y = set()
 
-        sorted_cos_distances_indices = np.argsort(cos_distances)[::-1]
+            for paris_index, distance, cos_distance in zip(pairs_indices,
+                                                           pairs_distances,
+                                                           cos_distances):
+                if len(analogies) == n_analogies:
+                    break
 
-        sorted_cos_distances_indices_iter = iter(sorted_cos_distances_indices)
+                word_x, word_y = [self.model.index2word[index]
+                                  for index in paris_index]
 
-        analogies = []
-        generated_words_x = set()
-        generated_words_y = set()
+                if multiple or (not multiple
+                                and (word_x not in generated_words_x
+                                     and word_y not in generated_words_y)):
 
-        while len(analogies) < n_analogies:
-            cos_distance_index = next(sorted_cos_distances_indices_iter)
-            paris_index = pairs_indices[cos_distance_index]
-            word_x, word_y = [self.model.index2word[index]
-                              for index in paris_index]
+                    analogies.append({positive_end: word_x,
+                                      negative_end: word_y,
+                                      'score': cos_distance,
+                                      'distance': distance})
 
-            if multiple or (not multiple
-                            and (word_x not in generated_words_x
-                                 and word_y not in generated_words_y)):
+                    generated_words_x.add(word_x)
+                    generated_words_y.add(word_y)
 
-                analogy = ({positive_end: word_x,
-                            negative_end: word_y,
-                            'score': cos_distances[cos_distance_index],
-                            'distance': pairs_distances[tuple(paris_index)]})
+            if len(analogies) == n_analogies or n_candidates >= n_pairs:
+                break
 
-                generated_words_x.add(word_x)
-                generated_words_y.add(word_y)
+            n_candidates *= 2
 
-                if unrestricted:
-                    most_x = next(word
-                                  for word, _ in most_similar(self.model,
-                                                              [word_y, positive_end],
-                                                              [negative_end]))
-                    most_y = next(word
-                                  for word, _ in most_similar(self.model,
-                                                              [word_x, negative_end],
-                                                              [positive_end]))
-
-                    analogy['most_x'] = most_x
-                    analogy['most_y'] = most_y
-                    analogy['match'] = ((word_x == most_x)
-                                        and (word_y == most_y))
-
-                analogies.append(analogy)
+        if unrestricted:
+            queries = []
+            for analogy in analogies:
+                queries.append(([analogy[negative_end], positive_end],
+                                [negative_end]))
+                queries.append(([analogy[positive_end], negative_end],
+                                [positive_end]))
+
+            most_similar_results = most_similar_batch(self.model, queries,
+                                                      topn=1)
+
+            for analogy, (most_x, ), (most_y, ) in zip(analogies,
+                                                       most_similar_results[::2],
+                                                       most_similar_results[1::2]):
+                analogy['most_x'], _ = most_x
+                analogy['most_y'], _ = most_y
+                analogy['match'] = ((analogy[positive_end] == analogy['most_x'])
+                                    and (analogy[negative_end] == analogy['most_y']))
 
         df = pd.DataFrame(analogies)
 
@@ -616,7 +1036,8 @@ class BiasWordEmbedding:
     def calc_direct_bias(self, neutral_words, c=None):
         """Calculate the direct bias.
 
-        Based on the projection of neutral words on the direction.
+        Based on the projection of neutral words on the direction
+        (or the norm of their projection on the subspace).
 
         :param list neutral_words: List of neutral words
         :param c: Strictness of bias measuring
@@ -627,8 +1048,10 @@ class BiasWordEmbedding:
         if c is None:
             c = 1
 
-        projections = self._calc_projection_scores(neutral_words)['projection']
-        direct_bias_terms = np.abs(projections) ** c
+        indices = get_word_indices(self.model, neutral_words)
+        coordinates = calc_projections_by_indices(self.model, indices,
+                                                  self._get_subspace_basis())
+        direct_bias_terms = np.linalg.norm(coordinates, axis=1) ** c
         direct_bias = direct_bias_terms.sum() / len(neutral_words)
 
         return direct_bias
@@ -639,27 +1062,56 @@ class BiasWordEmbedding:
         Based on the amount of shared projection of the words on the direction.
 
         Also called PairBias.
-        :param str word1: First word
-        :param str word2: Second word
+
+        The words can be also two arrays of words (of the same length),
+        and then the indirect biases of all the pairs
+        are calculated at once.
+
+        :param str word1: First word (or array of words)
+        :param str word2: Second word (or array of words)
         :type c: float or None
         :return The indirect bias between the two words
+                (or :class:`numpy.ndarray` of the indirect biases)
         """
 
         self._is_direction_identified()
 
-        vector1 = normalize(self[word1])
-        vector2 = normalize(self[word2])
+        is_single = isinstance(word1, str) and isinstance(word2, str)
+        if is_single:
+            word1, word2 = [word1], [word2]
 
-        perpendicular_vector1 = reject_vector(vector1, self.direction)
-        perpendicular_vector2 = reject_vector(vector2, self.direction)
+        if len(word1) != len(word2):
+            raise ValueError('word1 and word2 should have the same length,'
+                             ' {} and {} were given'
+                             .format(len(word1), len(word2)))
 
-        inner_product = vector1 @ vector2
-        perpendicular_similarity = cosine_similarity(perpendicular_vector1,
-                                                     perpendicular_vector2)
+        vectors1 = (self._get_normalized_vectors(get_word_indices(self.model,
+                                                                  word1))
+                    .astype(float))
+        vectors2 = (self._get_normalized_vectors(get_word_indices(self.model,
+                                                                  word2))
+                    .astype(float))
+        direction = normalize(self.direction)
 
-        indirect_bias = ((inner_product - perpendicular_similarity)
-                         / inner_product)
-        return indirect_bias
+        inner_products = (vectors1 * vectors2).sum(axis=1)
+        projections1 = vectors1 @ direction
+        projections2 = vectors2 @ direction
+
+        # for unit vectors and direction, the rejected vectors
+        # have inner product of <v1, v2> - <v1, d><v2, d>
+        # and norms of sqrt(1 - <v, d>^2)
+        perpendicular_similarities = ((inner_products
+                                       - projections1 * projections2)
+                                      / np.sqrt((1 - projections1 ** 2)
+                                                * (1 - projections2 ** 2)))
+
+        indirect_biases = ((inner_products - perpendicular_similarities)
+                           / inner_products)
+
+        if is_single:
+            return indirect_biases[0]
+
+        return indirect_biases
 
     def generate_closest_words_indirect_bias(self,
                                              neutral_positive_end,
@@ -678,6 +1130,7 @@ class BiasWordEmbedding:
         :param str neutral_negative_end: A word that define the negative side
                                          of the neutral direction.
         :param list words: List of words to project on the neutral direction.
+                           By default, all the words in the vocabulary.
         :param int n_extreme: The number for the most extreme words
                               (positive and negative) to show.
         :return: Data Frame of the most extreme words
@@ -687,10 +1140,33 @@ class BiasWordEmbedding:
         neutral_direction = normalize(self[neutral_positive_end]
                                       - self[neutral_negative_end])
 
-        vectors = [normalize(self[word]) for word in words]
-        df = (pd.DataFrame([{'word': word,
-                             'projection': vector @ neutral_direction}
-                            for word, vector in zip(words, vectors)])
+        if words is None:
+            # all the vocabulary is projected,
+            # so the normalized vectors are kept for the next calls
+            self._get_normalized_matrix()
+            indices = np.arange(len(self.model.vectors))
+        else:
+            indices = get_word_indices(self.model, words)
+
+        projections = np.empty(len(indices))
+        for start in range(0, len(indices), VECTORS_CHUNK_SIZE):
+            chunk = slice(start, start + VECTORS_CHUNK_SIZE)
+            projections[chunk] = (self._get_normalized_vectors(indices[chunk])
+                                  @ neutral_direction)
+
+        # only the most extreme words on both sides are sorted
+        if len(projections) > 2 * n_extreme:
+            partitioned = np.argpartition(projections,
+                                          [n_extreme - 1,
+                                           len(projections) - n_extreme])
+            candidates = np.concatenate([partitioned[:n_extreme],
+                                         partitioned[-n_extreme:]])
+        else:
+            candidates = np.arange(len(projections))
+
+        df = (pd.DataFrame({'word': [self.model.index2word[index]
+                                     for index in indices[candidates]],
+                            'projection': projections[candidates]})
               .sort_values('projection', ascending=False))
 
         df = take_two_sides_extreme_sorted(df, n_extreme,
@@ -698,17 +1174,15 @@ class BiasWordEmbedding:
                                            neutral_positive_end,
                                            neutral_negative_end)
 
-        df['indirect_bias'] = df.apply(lambda r:
-                                       self.calc_indirect_bias(r['word'],
-                                                               r['end']),
-                                       axis=1)
+        df['indirect_bias'] = self.calc_indirect_bias(df['word'].values,
+                                                      df['end'].values)
 
         df = df.set_index(['end', 'word'])
         df = df[['projection', 'indirect_bias']]
 
         return df
 
-    def _extract_neutral_words(self, specific_words):
+    def _extract_neutral_indices(self, specific_words):
         extended_specific_words = set()
 
         # because or specific_full data was trained on partial word embedding
@@ -718,70 +1192,117 @@ class BiasWordEmbedding:
             extended_specific_words.add(word.upper())
             extended_specific_words.add(word.title())
 
-        neutral_words = [word for word in self.model.vocab
-                         if word not in extended_specific_words]
+        specific_mask = get_words_mask(self.model, extended_specific_words)
 
-        return neutral_words
+        return np.flatnonzero(~specific_mask)
+
+    def _extract_neutral_words(self, specific_words):
+        neutral_indices = self._extract_neutral_indices(specific_words)
+        return [self.model.index2word[index] for index in neutral_indices]
 
     def _neutralize(self, neutral_words):
-        self._is_direction_identified()
+        basis = self._get_subspace_basis()
 
-        if self._verbose:
-            neutral_words_iter = tqdm(neutral_words)
+        if (isinstance(neutral_words, np.ndarray)
+                and np.issubdtype(neutral_words.dtype, np.integer)):
+            indices = np.unique(neutral_words)
         else:
-            neutral_words_iter = iter(neutral_words)
+            indices = np.unique(get_word_indices(self.model, neutral_words))
 
-        for word in neutral_words_iter:
-            neutralized_vector = reject_vector(self[word],
-                                               self.direction)
-            update_word_vector(self.model, word, neutralized_vector)
+        chunk_starts = range(0, len(indices), VECTORS_CHUNK_SIZE)
+        if self._verbose:
+            chunk_starts = tqdm(chunk_starts)
+
+        for start in chunk_starts:
+            neutralize_word_vectors(self.model,
+                                    indices[start:start + VECTORS_CHUNK_SIZE],
+                                    basis)
 
-        self.model.init_sims(replace=True)
+        normalize_model_vectors(self.model)
 
     def _equalize(self, equality_sets):
         # pylint: disable=R0914
 
-        self._is_direction_identified()
+        # shape: (k, dim), k=1 for a direction
+        basis = self._get_subspace_basis()
 
         if self._verbose:
             words_data = []
+            equality_set_index = 0
+
+        for equality_sets_batch in _batch_disjoint_sets(equality_sets):
+            # shape: (n_sets, set_size)
+            indices = np.array([get_word_indices(self.model, equality_set)
+                                for equality_set in equality_sets_batch])
+
+            # shape: (n_sets, set_size, dim)
+            vectors = (self._get_normalized_vectors(indices.ravel())
+                       .astype(float)
+                       .reshape(indices.shape + (-1,)))
+
+            center = vectors.mean(axis=1)
+            projected_center = (center @ basis.T) @ basis
+            rejected_center = center - projected_center
+            scaling = np.sqrt(1 - np.linalg.norm(rejected_center, axis=1)**2)
+
+            # For a direction, the normalized difference between
+            # the projected vector and the projected center
+            # is either the direction or its opposite
+            # (or zero, as `normalize` does).
+            #
+            # In the code it is different of Bolukbasi
+            # It behaves the same only for equality_sets
+            # with size of 2 (pairs) - not sure!
+            # However, my code is the same as the article
+            # equalized_vector = rejected_center + scaling * self.direction
+            # https://github.com/tolga-b/debiaswe/blob/10277b23e187ee4bd2b6872b507163ef4198686b/debiaswe/debias.py#L36-L37
+            # For pairs, projected_part_vector1 == -projected_part_vector2,
+            # and this is the same as
+            # projected_part_vector1 == self.direction
+
+            # shape: (n_sets, set_size, k)
+            coordinates = vectors @ basis.T
+            projected_parts = ((coordinates
+                                - (center @ basis.T)[:, None, :])
+                               @ basis)
+            projected_parts_norms = np.linalg.norm(projected_parts, axis=2)
+            projected_parts_norms[projected_parts_norms == 0] = 1
+            projected_parts /= projected_parts_norms[:, :, None]
+
+            equalized_vectors = (rejected_center[:, None, :]
+                                 + (scaling[:, None, None]
+                                    * projected_parts))
+
+            update_word_vectors(self.model, indices.ravel(),
+                                equalized_vectors.reshape(-1,
+                                                          vectors.shape[2]))
 
-        for equality_set_index, equality_set_words in enumerate(equality_sets):
-            equality_set_vectors = [normalize(self[word])
-                                    for word in equality_set_words]
-            center = np.mean(equality_set_vectors, axis=0)
-            (projected_center,
-             rejected_center) = project_reject_vector(center,
-                                                      self.direction)
-            scaling = np.sqrt(1 - np.linalg.norm(rejected_center)**2)
-
-            for word, vector in zip(equality_set_words, equality_set_vectors):
-                projected_vector = project_vector(vector, self.direction)
-
-                projected_part = normalize(projected_vector - projected_center)
-
-                # In the code it is different of Bolukbasi
-                # It behaves the same only for equality_sets
-                # with size of 2 (pairs) - not sure!
-                # However, my code is the same as the article
-                # equalized_vector = rejected_center + scaling * self.direction
-                # https://github.com/tolga-b/debiaswe/blob/10277b23e187ee4bd2b6872b507163ef4198686b/debiaswe/debias.py#L36-L37
-                # For pairs, projected_part_vector1 == -projected_part_vector2,
-                # and this is the same as
-                # projected_part_vector1 == self.direction
-                equalized_vector = rejected_center + scaling * projected_part
-
-                update_word_vector(self.model, word, equalized_vector)
-
-                if self._verbose:
-                    words_data.append({
-                        'equality_set_index': equality_set_index,
-                        'word': word,
-                        'scaling': scaling,
-                        'projected_scalar': vector @ self.direction,
-                        'equalized_projected_scalar': (equalized_vector
-                                                       @ self.direction),
-                    })
+            if self._verbose:
+                equalized_coordinates = equalized_vectors @ basis.T
+                # the projection scalars for a direction,
+                # and the projection norms for a subspace
+                if len(basis) == 1:
+                    projected_scalars = coordinates[:, :, 0]
+                    equalized_projected_scalars = (equalized_coordinates
+                                                   [:, :, 0])
+                else:
+                    projected_scalars = np.linalg.norm(coordinates, axis=2)
+                    equalized_projected_scalars = np.linalg.norm(
+                        equalized_coordinates, axis=2)
+
+                for set_index, set_words in enumerate(equality_sets_batch):
+                    for word_index, word in enumerate(set_words):
+                        words_data.append({
+                            'equality_set_index': equality_set_index,
+                            'word': word,
+                            'scaling': scaling[set_index],
+                            'projected_scalar':
+                                projected_scalars[set_index, word_index],
+                            'equalized_projected_scalar':
+                                equalized_projected_scalars[set_index,
+                                                            word_index],
+                        })
+                    equality_set_index += 1
 
         if self._verbose:
             print('Equalize Words Data '
@@ -790,7 +1311,7 @@ class BiasWordEmbedding:
                              .set_index(['equality_set_index', 'word']))
             print(tabulate(words_data_df, headers='keys'))
 
-        self.model.init_sims(replace=True)
+        normalize_model_vectors(self.model)
 
     def _generate_pair_candidates(self, pairs):
         # pylint: disable=line-too-long
@@ -806,12 +1327,17 @@ class BiasWordEmbedding:
 
         :param str method: The method of debiasing.
         :param list neutral_words: List of neutral words
-                                   for the neutralize step
+                                   for the neutralize step,
+                                   or an array of their indices
+                                   in the vocabulary
         :param list equality_sets: List of equality sets,
                                    for the equalize step.
                                    The sets represent the direction.
         :param bool inplace: Whether to debias the object inplace
-                             or return a new one
+                             or return a new one.
+                             The new one shares the vocabulary
+                             of the model, and has only its own copy
+                             of the vectors.
 
         .. warning::
 
@@ -821,15 +1347,16 @@ class BiasWordEmbedding:
 
         """
 
+        if method not in DEBIAS_METHODS:
+            raise ValueError('method should be one of {}, {} was given'.format(
+                DEBIAS_METHODS, method))
+
         # pylint: disable=W0212
         if inplace:
             bias_word_embedding = self
         else:
-            bias_word_embedding = copy.deepcopy(self)
-
-        if method not in DEBIAS_METHODS:
-            raise ValueError('method should be one of {}, {} was given'.format(
-                DEBIAS_METHODS, method))
+            bias_word_embedding = copy.copy(self)
+            bias_word_embedding.model = copy_model_vectors(self.model)
 
         if method in ['hard', 'neutralize']:
             if self._verbose:
@@ -855,7 +1382,9 @@ class BiasWordEmbedding:
 
     def evaluate_word_embedding(self,
                                 kwargs_word_pairs=None,
-                                kwargs_word_analogies=None):
+                                kwargs_word_analogies=None,
+                                n_jobs=None, executor='thread',
+                                with_timing=False):
         """
         Evaluate word pairs tasks and word analogies tasks.
 
@@ -868,25 +1397,90 @@ class BiasWordEmbedding:
                                       evaluate_word_analogies
                                       method.
         :type evaluate_word_analogies: dict or None
+        :param int n_jobs: Number of tasks to evaluate in parallel.
+                           If `-1`, then the number of CPUs is used.
+                           By default, the evaluation is serial.
+        :param str executor: Parallelize with threads (`'thread'`)
+                             or with forked processes (`'process'`).
+        :param bool with_timing: Whether to add the running time
+                                 of each task (in seconds) as a column.
         :return: Tuple of :class:`pandas.DataFrame`
                  for the evaluation results.
         """
+        # pylint: disable=too-many-arguments
 
         return evaluate_word_embedding(self.model,
                                        kwargs_word_pairs,
-                                       kwargs_word_analogies)
+                                       kwargs_word_analogies,
+                                       n_jobs, executor, with_timing)
+
+    def _fit_specific_words_classifier(self, indices, y, classifier):
+        if classifier == 'svm':
+            clf = LinearSVC(C=1, class_weight='balanced',
+                            random_state=RANDOM_STATE)
+            clf.fit(self._get_normalized_vectors(indices), y)
+            return clf
+
+        # SGD (with hinge loss) streams the training examples in batches,
+        # so the examples are never all in memory at once.
+        # `partial_fit` doesn't support `class_weight='balanced'`,
+        # therefore the same weights are given as sample weights.
+        class_counts = np.bincount(y, minlength=2)
+        class_weights = len(y) / (2 * np.maximum(class_counts, 1))
+
+        clf = SGDClassifier(loss='hinge', random_state=RANDOM_STATE)
+
+        for _ in range(SGD_N_EPOCHS):
+            for start in range(0, len(indices), VECTORS_CHUNK_SIZE):
+                batch = slice(start, start + VECTORS_CHUNK_SIZE)
+                batch_y = y[batch]
+                clf.partial_fit(self._get_normalized_vectors(indices[batch]),
+                                batch_y,
+                                classes=[0, 1],
+                                sample_weight=class_weights[batch_y])
+
+        return clf
+
+    def _predict_specific_indices(self, clf):
+        normalized_vectors = self._get_normalized_matrix()
+        is_specific = np.empty(len(normalized_vectors), dtype=bool)
+
+        for start in range(0, len(normalized_vectors), VECTORS_CHUNK_SIZE):
+            chunk = slice(start, start + VECTORS_CHUNK_SIZE)
+            # positive score is the same as `predict` of the class 1
+            is_specific[chunk] = (clf.decision_function(
+                normalized_vectors[chunk]) > 0)
+
+        return np.flatnonzero(is_specific)
 
     def learn_full_specific_words(self, seed_specific_words,
-                                  max_non_specific_examples=None, debug=None):
+                                  max_non_specific_examples=None, debug=None,
+                                  classifier='svm', return_indices=False):
         """Learn specific words given a list of seed specific wordsself.
 
         Using Linear SVM.
 
+        The training set is sampled by vocabulary indices,
+        and the whole vocabulary is classified in chunks
+        of normalized vectors.
+
         :param list seed_specific_words: List of seed specific words
         :param int max_non_specific_examples: The number of non-specific words
                                               to sample for training
-        :return: List of learned specific words and the classifier object
+        :param str classifier: The linear classifier -
+                               `'svm'` (``LinearSVC``) or
+                               `'sgd'` (``SGDClassifier`` trained
+                               with ``partial_fit`` in batches,
+                               for a very large number of
+                               non-specific examples)
+        :param bool return_indices: Whether to return also
+                                    the vocabulary indices of
+                                    the learned specific words
+        :return: List of learned specific words
+                 (and their indices, if `return_indices`)
+                 and the classifier object
         """
+        # pylint: disable=too-many-arguments
 
         if debug is None:
             debug = False
@@ -894,44 +1488,39 @@ class BiasWordEmbedding:
         if max_non_specific_examples is None:
             max_non_specific_examples = MAX_NON_SPECIFIC_EXAMPLES
 
-        data = []
-        non_specific_example_count = 0
-
-        for word in self.model.vocab:
-            is_specific = word in seed_specific_words
+        if classifier not in SPECIFIC_WORDS_CLASSIFIERS:
+            raise ValueError('classifier should be one of {}, {} was given'
+                             .format(SPECIFIC_WORDS_CLASSIFIERS, classifier))
 
-            if not is_specific:
-                non_specific_example_count += 1
-                if non_specific_example_count <= max_non_specific_examples:
-                    data.append((self[word], is_specific))
-            else:
-                data.append((self[word], is_specific))
+        is_specific = get_words_mask(self.model, seed_specific_words)
 
-        np.random.seed(RANDOM_STATE)
-        np.random.shuffle(data)
+        # all the specific words, and the first non-specific words,
+        # in the vocabulary order
+        is_example = is_specific.copy()
+        is_example[np.flatnonzero(~is_specific)
+                   [:max_non_specific_examples]] = True
+        indices = np.flatnonzero(is_example)
 
-        X, y = zip(*data)
+        rng = np.random.RandomState(RANDOM_STATE)  # pylint: disable=no-member
+        rng.shuffle(indices)
 
-        X = np.array(X)
-        X /= np.linalg.norm(X, axis=1)[:, None]
+        y = is_specific[indices].astype('int')
 
-        y = np.array(y).astype('int')
+        clf = self._fit_specific_words_classifier(indices, y, classifier)
 
-        clf = LinearSVC(C=1, class_weight='balanced',
-                        random_state=RANDOM_STATE)
+        full_specific_indices = self._predict_specific_indices(clf)
+        full_specific_words = [self.model.index2word[index]
+                               for index in full_specific_indices]
 
-        clf.fit(X, y)
+        results = (full_specific_words,)
+        if return_indices:
+            results += (full_specific_indices,)
+        results += (clf,)
 
-        full_specific_words = []
-        for word in self.model.vocab:
-            vector = [normalize(self[word])]
-            if clf.predict(vector):
-                full_specific_words.append(word)
+        if debug:
+            results += (self._get_normalized_vectors(indices), y)
 
-        if not debug:
-            return full_specific_words, clf
-
-        return full_specific_words, clf, X, y
+        return results
 
     def _plot_most_biased_one_cluster(self,
                                       most_biased_neutral_words, y_bias,
@@ -973,9 +1562,12 @@ class BiasWordEmbedding:
                  and their projection on the bias direction.
         """
 
-        points = {word: (value, self.project_on_direction(word))
-                  for word, value in factual_properity.items()
-                  if word in self.model}
+        words = [word for word in factual_properity
+                 if word in self.model]
+        projections = self._calc_projections(words)
+
+        points = {word: (factual_properity[word], projection)
+                  for word, projection in zip(words, projections)}
 
         x, y = zip(*points.values())
 
@@ -990,6 +1582,9 @@ class BiasWordEmbedding:
                                        and their factual values.
         """
 
+        # pylint: disable=import-outside-toplevel
+        import matplotlib.pylab as plt
+
         result = self.compute_factual_association(factual_properity)
 
         (r, pvalue), points = result
@@ -1043,6 +1638,8 @@ class BiasWordEmbedding:
         - https://github.com/gonenhila/gender_bias_lipstick
         """
         # pylint: disable=protected-access,too-many-locals,line-too-long
+        # pylint: disable=import-outside-toplevel
+        import matplotlib.pylab as plt
 
         assert biased.positive_end == debiased.positive_end, \
             'Postive ends should be the same.'
@@ -1051,17 +1648,20 @@ class BiasWordEmbedding:
 
         seed_vector, _, _ = get_seed_vector(seed, biased)
 
-        neutral_words = biased._data['neutral_words']
-        neutral_word_vectors = (biased[word] for word in neutral_words)
-        neutral_word_projections = [(normalize(vector) @ seed_vector, word)
-                                    for word, vector
-                                    in zip(neutral_words,
-                                           neutral_word_vectors)]
+        neutral_indices = biased._neutral_indices
+        neutral_word_projections = calc_projections_by_indices(biased.model,
+                                                               neutral_indices,
+                                                               seed_vector)
 
-        neutral_word_projections.sort()
+        # stable sort, so ties are broken by the (sorted) words
+        order = np.argsort(neutral_word_projections, kind='stable')
 
-        _, most_negative_words = zip(*neutral_word_projections[:n_extreme])
-        _, most_positive_words = zip(*neutral_word_projections[-n_extreme:])
+        # only the plotted words are mapped back from their indices
+        index2word = biased.model.index2word
+        most_negative_words = tuple(index2word[neutral_indices[index]]
+                                    for index in order[:n_extreme])
+        most_positive_words = tuple(index2word[neutral_indices[index]]
+                                    for index in order[-n_extreme:])
 
         most_biased_neutral_words = most_negative_words + most_positive_words
 
@@ -1097,6 +1697,14 @@ class GenderBiasWE(BiasWordEmbedding):
                                    `'single'`, `'sum'` or `'pca'`.
     :param bool to_normalize: Whether to normalize all the vectors
                               (recommended!)
+
+    When the vectors are not normalized, their normalized copy is
+    cached, which for the whole vocabulary takes as much memory as
+    the vectors themselves; call :meth:`clear_normalized_vectors_cache`
+    to free it. Update the vectors of the model with the functions of
+    :mod:`responsibly.we.utils`, or call
+    :func:`responsibly.we.utils.bump_model_version` after
+    writing to ``model.vectors`` directly.
     """
 
     def __init__(self, model, only_lower=False, verbose=False,
@@ -1122,21 +1730,45 @@ class GenderBiasWE(BiasWordEmbedding):
                                      identify_direction)
 
     def _initialize_data(self):
-        self._data = copy.deepcopy(BOLUKBASI_DATA['gender'])
+        cache = _WORD_DATA_CACHES.get(self.model)
+
+        if cache is None or self.only_lower not in cache:
+            data, neutral_indices = self._extract_data()
+            if cache is not None:
+                cache[self.only_lower] = (data, neutral_indices)
+        else:
+            data, neutral_indices = cache[self.only_lower]
+
+        # the word lists and the indices are shared read-only
+        self._data = dict(data)
+        self._neutral_indices = neutral_indices
+
+    def _extract_data(self):
+        data = copy.deepcopy(get_bolukbasi_data()['gender'])
 
         if not self.only_lower:
-            self._data['specific_full_with_definitional_equalize'] = \
-                generate_words_forms(self
-                                     ._data['specific_full_with_definitional_equalize'])  # pylint: disable=C0301
+            data['specific_full_with_definitional_equalize'] = \
+                generate_words_forms(data['specific_full_with_definitional_equalize'])  # pylint: disable=C0301
+
+        for key in data['word_group_keys']:
+            data[key] = self._filter_words_by_model(data[key])
+
+        neutral_indices = self._extract_neutral_indices(data['specific_full_with_definitional_equalize'])  # pylint: disable=C0301
+
+        # sorted by the words, as the other word groups
+        neutral_words = np.asarray(self.model.index2word,
+                                   dtype=object)[neutral_indices]
+        neutral_indices = neutral_indices[np.argsort(neutral_words,
+                                                     kind='stable')]
+        neutral_indices.flags.writeable = False
 
-        for key in self._data['word_group_keys']:
-            self._data[key] = (self._filter_words_by_model(self
-                                                           ._data[key]))
+        return data, neutral_indices
 
-        self._data['neutral_words'] = self._extract_neutral_words(self
-                                                                  ._data['specific_full_with_definitional_equalize'])  # pylint: disable=C0301
-        self._data['neutral_words'].sort()
-        self._data['word_group_keys'].append('neutral_words')
+    @property
+    def _neutral_words(self):
+        """Neutral words, built on demand from their indices."""
+        index2word = self.model.index2word
+        return [index2word[index] for index in self._neutral_indices]
 
     def plot_projection_scores(self, words='professions', n_extreme=10,
                                ax=None, axis_projection_step=None):
@@ -1151,6 +1783,7 @@ class GenderBiasWE(BiasWordEmbedding):
         if word_groups == 'bolukbasi':
             word_groups = {key: self._data[key]
                            for key in self._data['word_group_keys']}
+            word_groups['neutral_words'] = self._neutral_indices
 
         return super().plot_dist_projections_on_direction(word_groups, ax)
 
@@ -1158,7 +1791,7 @@ class GenderBiasWE(BiasWordEmbedding):
     def plot_bias_across_word_embeddings(cls, word_embedding_bias_dict,
                                          ax=None, scatter_kwargs=None):
         # pylint: disable=W0221
-        words = BOLUKBASI_DATA['gender']['neutral_profession_names']
+        words = get_bolukbasi_data()['gender']['neutral_profession_names']
         # TODO: is it correct for inheritance of class method?
         super(cls, cls).plot_bias_across_word_embeddings(word_embedding_bias_dict,  # pylint: disable=C0301
                                                          words,
@@ -1191,7 +1824,7 @@ class GenderBiasWE(BiasWordEmbedding):
         # pylint: disable=line-too-long
         if method in ['hard', 'neutralize']:
             if neutral_words is None:
-                neutral_words = self._data['neutral_words']
+                neutral_words = self._neutral_indices
 
         if method == 'hard' and equality_sets is None:
             equality_sets = {tuple(w) for w in self._data['equalize_pairs']}
@@ -1202,19 +1835,23 @@ class GenderBiasWE(BiasWordEmbedding):
 
     def learn_full_specific_words(self, seed_specific_words='bolukbasi',
                                   max_non_specific_examples=None,
-                                  debug=None):
+                                  debug=None, classifier='svm',
+                                  return_indices=False):
+        # pylint: disable=too-many-arguments
         if seed_specific_words == 'bolukbasi':
             seed_specific_words = self._data['specific_seed']
 
         return super().learn_full_specific_words(seed_specific_words,
                                                  max_non_specific_examples,
-                                                 debug)
+                                                 debug, classifier,
+                                                 return_indices)
 
-    def compute_factual_association(self,
-                                    factual_properity=OCCUPATION_FEMALE_PRECENTAGE):  # pylint: disable=line-too-long
+    def compute_factual_association(self, factual_properity=None):
+        if factual_properity is None:
+            factual_properity = get_occupation_female_precentage()
         return super().compute_factual_association(factual_properity)
 
-    def plot_factual_association(self,
-                                 factual_properity=OCCUPATION_FEMALE_PRECENTAGE,  # pylint: disable=line-too-long
-                                 ax=None):
+    def plot_factual_association(self, factual_properity=None, ax=None):
+        if factual_properity is None:
+            factual_properity = get_occupation_female_precentage()
         return super().plot_factual_association(factual_properity, ax)
@@ -1,24 +1,132 @@
 # TODO how import files from a package
 import json
+import os
+import sys
+import tempfile
 import warnings
+from functools import lru_cache
 
-from gensim.models.keyedvectors import KeyedVectors
+import numpy as np
 from pkg_resources import resource_filename, resource_string
 
 
+W2V_SMALL_FILENAME = 'GoogleNews-vectors-negative300-bolukbasi.bin'
+CACHE_DIR_ENV_VAR = 'RESPONSIBLY_CACHE_DIR'
+DEFAULT_CACHE_DIR = os.path.join('~', '.cache', 'responsibly')
+
+
+def _get_cache_dir():
+    return os.path.expanduser(os.environ.get(CACHE_DIR_ENV_VAR,
+                                             DEFAULT_CACHE_DIR))
+
+
+def _parse_w2v_small():
+    # pylint: disable=C0301,import-outside-toplevel
+    from gensim.models.keyedvectors import Word2VecKeyedVectors
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', DeprecationWarning)
+        model = Word2VecKeyedVectors.load_word2vec_format(
+            resource_filename(__name__, W2V_SMALL_FILENAME),
+            binary=True)
+
+    return model
+
+
+def _convert_w2v_small_to_cache(vectors_path, vocab_path):
+    """Save the parsed model as a `.npy` matrix and a vocabulary index.
+
+    The files are written under temporary names and then renamed,
+    so concurrent processes never see a partially written file.
+    """
+
+    model = _parse_w2v_small()
+
+    cache_dir = os.path.dirname(vectors_path)
+    os.makedirs(cache_dir, exist_ok=True)
+
+    for path, save in [(vectors_path,
+                        lambda f: np.save(f, model.vectors)),
+                       (vocab_path,
+                        lambda f: f.write(json.dumps(model.index2word)
+                                          .encode('utf-8')))]:
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir)
+        with os.fdopen(fd, 'wb') as f:
+            save(f)
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+
+
+@lru_cache(maxsize=None)
+def _load_w2v_small_cache():
+    """Load the vocabulary and the path to the memory-mappable vectors.
+
+    The cache files are named by the size and the modification time
+    of the bundled model, so they are rebuilt if it changes.
+
+    Returns ``None`` if the cache directory is not writable.
+    """
+
+    source_stat = os.stat(resource_filename(__name__, W2V_SMALL_FILENAME))
+    cache_name = 'w2v_small-{}-{}'.format(source_stat.st_size,
+                                          int(source_stat.st_mtime))
+
+    cache_dir = _get_cache_dir()
+    vectors_path = os.path.join(cache_dir, cache_name + '.vectors.npy')
+    vocab_path = os.path.join(cache_dir, cache_name + '.vocab.json')
+
+    try:
+        if not (os.path.exists(vectors_path)
+                and os.path.exists(vocab_path)):
+            _convert_w2v_small_to_cache(vectors_path, vocab_path)
+    except OSError:
+        return None
+
+    # pylint: disable=import-outside-toplevel
+    from gensim.models.keyedvectors import Vocab
+
+    with open(vocab_path, encoding='utf-8') as f:
+        index2word = json.load(f)
+
+    vocab = {word: Vocab(index=index, count=len(index2word) - index)
+             for index, word in enumerate(index2word)}
+
+    return vectors_path, index2word, vocab
+
+
 def load_w2v_small():
     """Load reduced Word2Vec model as `KeyedVectors` object.
 
     Based on the pre-trained embedding on the Google News corpus:
     https://code.google.com/archive/p/word2vec/
+
+    On the first call, the model is converted to a NumPy matrix
+    and a vocabulary index in a cache directory
+    (``~/.cache/responsibly``, or the ``RESPONSIBLY_CACHE_DIR``
+    environment variable), and from then on the vectors
+    are memory-mapped from there.
+
+    The vectors are mapped copy-on-write, so all the processes
+    share the same pages, while every returned model
+    can still be modified (e.g., debiased) independently.
     """
-    # pylint: disable=C0301
 
-    with warnings.catch_warnings():
-        warnings.simplefilter('ignore', DeprecationWarning)
-        model = KeyedVectors.load_word2vec_format(
-            resource_filename(__name__, 'GoogleNews-vectors-negative300-bolukbasi.bin'),
-            binary=True)
+    # pylint: disable=import-outside-toplevel
+    from gensim.models.keyedvectors import Word2VecKeyedVectors
+
+    cache = _load_w2v_small_cache()
+
+    if cache is None:
+        return _parse_w2v_small()
+
+    vectors_path, index2word, vocab = cache
+
+    vectors = np.load(vectors_path, mmap_mode='c')
+
+    model = Word2VecKeyedVectors(vector_size=vectors.shape[1])
+    model.vectors = vectors
+    model.index2word = list(index2word)
+    model.vocab = dict(vocab)
 
     return model
 
@@ -30,43 +138,95 @@ def load_json_resource(resource_name):
     )
 
 
-BOLUKBASI_DATA = load_json_resource('bolukbasi')
+@lru_cache(maxsize=None)
+def get_bolukbasi_data():
+    """Load the word lists of Bolukbasi et al. (2016).
+
+    The data is loaded on the first call, and cached afterwards.
+    """
+
+    bolukbasi_data = load_json_resource('bolukbasi')
+    gender_data = bolukbasi_data['gender']
+
+    gender_data['profession_names'] = list(
+        zip(*gender_data['professions']))[0]
+
+    gender_data['specific_full'].sort()
+
+    # TODO: in the code of the article, the last definitional pair
+    # is not in the specific full
+    gender_data['specific_full_with_definitional_equalize'] = list(
+        (set.union(
+            *map(set, gender_data['definitional_pairs']))
+         | set.union(
+             *map(set, gender_data['equalize_pairs']))
+         | set(gender_data['specific_full']))
+    )
+    gender_data['specific_full_with_definitional_equalize'].sort()
+
+    gender_data['neutral_profession_names'] = list(
+        set(gender_data['profession_names'])
+        - set(gender_data['specific_full_with_definitional_equalize'])
+    )
+    gender_data['neutral_profession_names'].sort()
+
+    gender_data['word_group_keys'] = ['profession_names',
+                                      'neutral_profession_names',
+                                      'specific_seed',
+                                      'specific_full',
+                                      'specific_full_with_definitional_equalize']  # pylint: disable=C0301
+
+    return bolukbasi_data
+
+
+@lru_cache(maxsize=None)
+def get_weat_data():
+    """Load the WEAT stimuli of Caliskan et al. (2017).
+
+    The data is loaded on the first call, and cached afterwards.
+    """
+
+    return load_json_resource('weat')
+
+
+@lru_cache(maxsize=None)
+def get_occupation_female_precentage():
+    """Load the female percentage in occupations.
+
+    Zhao, J., Wang, T., Yatskar, M., Ordonez, V., & Chang, K. W. (2018).
+    Gender bias in coreference resolution: Evaluation and debiasing methods.
+    arXiv preprint arXiv:1804.06876.
+    https://arxiv.org/abs/1804.06876
+
+    The data is loaded on the first call, and cached afterwards.
+    """
+
+    return load_json_resource('occupational_female_precentage')
+
 
-BOLUKBASI_DATA['gender']['profession_names'] = list(
-    zip(*BOLUKBASI_DATA['gender']['professions']))[0]
+_LAZY_DATA_ACCESSORS = {
+    'BOLUKBASI_DATA': get_bolukbasi_data,
+    'WEAT_DATA': get_weat_data,
+    'OCCUPATION_FEMALE_PRECENTAGE': get_occupation_female_precentage,
+}
 
 
-BOLUKBASI_DATA['gender']['specific_full'].sort()
+def __getattr__(name):
+    """Load the data constants lazily on their first access (PEP 562)."""
 
-# TODO: in the code of the article, the last definitional pair
-# is not in the specific full
-BOLUKBASI_DATA['gender']['specific_full_with_definitional_equalize'] = list(
-    (set.union(
-        *map(set, BOLUKBASI_DATA['gender']['definitional_pairs']))
-     | set.union(
-         *map(set, BOLUKBASI_DATA['gender']['equalize_pairs']))
-     | set(BOLUKBASI_DATA['gender']['specific_full']))
-)
-BOLUKBASI_DATA['gender']['specific_full_with_definitional_equalize'].sort()
+    if name in _LAZY_DATA_ACCESSORS:
+        return _LAZY_DATA_ACCESSORS[name]()
 
-BOLUKBASI_DATA['gender']['neutral_profession_names'] = list(
-    set(BOLUKBASI_DATA['gender']['profession_names'])
-    - set(BOLUKBASI_DATA['gender']['specific_full_with_definitional_equalize'])
-)
-BOLUKBASI_DATA['gender']['neutral_profession_names'].sort()
+    raise AttributeError('module {!r} has no attribute {!r}'
+                         .format(__name__, name))
 
-BOLUKBASI_DATA['gender']['word_group_keys'] = ['profession_names',
-                                               'neutral_profession_names',
-                                               'specific_seed',
-                                               'specific_full',
-                                               'specific_full_with_definitional_equalize']  # pylint: disable=C0301
 
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_DATA_ACCESSORS))
 
-WEAT_DATA = load_json_resource('weat')
 
-# Zhao, J., Wang, T., Yatskar, M., Ordonez, V., & Chang, K. W. (2018).
-# Gender bias in coreference resolution: Evaluation and debiasing methods.
-# arXiv preprint arXiv:1804.06876.
-# https://arxiv.org/abs/1804.06876
-OCCUPATION_FEMALE_PRECENTAGE = load_json_resource(
-    'occupational_female_precentage')
+# a module __getattr__ (PEP 562) is supported only since Python 3.7
+if sys.version_info < (3, 7):
+    BOLUKBASI_DATA = get_bolukbasi_data()
+    WEAT_DATA = get_weat_data()
+    OCCUPATION_FEMALE_PRECENTAGE = get_occupation_female_precentage()
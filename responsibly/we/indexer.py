@@ -0,0 +1,270 @@
+"""
+Approximate nearest-neighbours index for word embedding.
+
+The index can be plugged into the argument ``indexer`` of
+:func:`~responsibly.we.utils.most_similar`,
+instead of a brute-force scan over all the vectors of the model.
+
+It is an IVF-flat (inverted file) index:
+the normalized vectors are clustered with spherical k-means
+(coarse quantization) into inverted lists.
+A query is compared to the centroids of the lists first,
+and then exhaustively only to the vectors of the ``n_probe``
+closest lists.
+
+The recall-latency trade-off is controlled by ``n_lists``
+(more lists - smaller lists to scan) and ``n_probe``
+(more probed lists - higher recall and latency).
+
+Reference:
+    - Jégou, H., Douze, M., & Schmid, C. (2011).
+      `Product quantization for nearest neighbor search
+      <https://hal.inria.fr/inria-00514462v2/document>`_.
+      IEEE transactions on pattern analysis and machine intelligence,
+      33(1), 117-128.
+
+Usage
+~~~~~
+
+.. code:: python
+
+   >>> from responsibly.we import IVFIndexer, load_w2v_small, most_similar
+   >>> w2v_small = load_w2v_small()
+   >>> indexer = IVFIndexer(w2v_small, n_lists=100, n_probe=10)
+   >>> most_similar(w2v_small, 'nurse', indexer=indexer, topn=3)
+   [('nurse', 1.0), ('registered_nurse', 0.7...), ('nurses', 0.7...)]
+   >>> indexer.save('w2v_small.ivf.npz')
+   >>> indexer = IVFIndexer.load('w2v_small.ivf.npz', w2v_small)
+
+"""
+
+import numpy as np
+from scipy.sparse import csr_matrix
+
+from responsibly.consts import RANDOM_STATE
+from responsibly.we.utils import VECTORS_CHUNK_SIZE, normalize
+
+
+DEFAULT_N_PROBE = 10
+DEFAULT_N_ITER = 10
+TRAIN_SAMPLES_PER_LIST = 256
+
+
+def _assign_to_centroids(vectors, centroids, chunk_size=VECTORS_CHUNK_SIZE):
+    """Assign normalized vectors to the closest (cosine) centroid."""
+    labels = np.empty(len(vectors), dtype=np.int64)
+
+    for start in range(0, len(vectors), chunk_size):
+        chunk = vectors[start:start + chunk_size]
+        labels[start:start + chunk_size] = (chunk @ centroids.T).argmax(axis=1)
+
+    return labels
+
+
+def _spherical_kmeans(vectors, n_clusters, n_iter, random_state):
+    """Cluster normalized vectors with spherical k-means."""
+    rng = np.random.RandomState(random_state)  # pylint: disable=no-member
+
+    centroids = vectors[rng.choice(len(vectors), n_clusters, replace=False)]
+
+    for _ in range(n_iter):
+        labels = _assign_to_centroids(vectors, centroids)
+
+        membership = csr_matrix((np.ones(len(vectors)),
+                                 (labels, np.arange(len(vectors)))),
+                                shape=(n_clusters, len(vectors)))
+        sums = np.asarray(membership @ vectors)
+
+        norms = np.linalg.norm(sums, axis=1)
+        is_empty = norms == 0
+
+        # re-seed empty clusters with random vectors
+        sums[is_empty] = vectors[rng.choice(len(vectors), is_empty.sum(),
+                                            replace=False)]
+        norms[is_empty] = 1
+
+        centroids = sums / norms[:, None]
+
+    return centroids
+
+
+class IVFIndexer:
+    """Approximate nearest-neighbours index (IVF-flat) of a word embedding.
+
+    :param model: Word embedding model of ``gensim.model.KeyedVectors``.
+    :param int n_lists: Number of inverted lists (clusters).
+                        By default, the square root
+                        of the vocabulary size.
+    :param int n_probe: Number of the closest lists to scan per query.
+    :param int n_iter: Number of the k-means iterations.
+    :param int n_train: Number of vectors to train the k-means on.
+                        By default, 256 per list.
+    :param int random_state: Random seed of the k-means.
+    """
+
+    def __init__(self, model=None, n_lists=None, n_probe=DEFAULT_N_PROBE,
+                 n_iter=DEFAULT_N_ITER, n_train=None,
+                 random_state=RANDOM_STATE):
+        # pylint: disable=too-many-arguments
+
+        self.model = model
+        self.n_probe = n_probe
+
+        self.centroids = None
+        self.list_offsets = None
+        self.list_indices = None
+
+        if model is not None:
+            self.build_index(n_lists, n_iter, n_train, random_state)
+
+    def build_index(self, n_lists=None, n_iter=DEFAULT_N_ITER,
+                    n_train=None, random_state=RANDOM_STATE):
+        """Build the index from the vectors of the model.
+
+        :param int n_lists: Number of inverted lists (clusters).
+        :param int n_iter: Number of the k-means iterations.
+        :param int n_train: Number of vectors to train the k-means on.
+        :param int random_state: Random seed of the k-means.
+        """
+
+        self.model.init_sims()
+        vectors = self.model.vectors_norm
+
+        if n_lists is None:
+            n_lists = int(np.sqrt(len(vectors)))
+        n_lists = max(1, min(n_lists, len(vectors)))
+
+        if n_train is None:
+            n_train = TRAIN_SAMPLES_PER_LIST * n_lists
+        n_train = max(n_lists, min(n_train, len(vectors)))
+
+        rng = np.random.RandomState(random_state)  # pylint: disable=no-member
+        train_indices = np.sort(rng.choice(len(vectors), n_train,
+                                           replace=False))
+
+        self.centroids = _spherical_kmeans(vectors[train_indices],
+                                           n_lists, n_iter, random_state)
+
+        labels = _assign_to_centroids(vectors, self.centroids)
+
+        self.list_indices = np.argsort(labels, kind='stable')
+        self.list_offsets = np.concatenate(
+            [[0], np.cumsum(np.bincount(labels, minlength=n_lists))])
+
+    @property
+    def n_lists(self):
+        """Number of inverted lists (clusters) of the index."""
+        return len(self.centroids)
+
+    def _is_index_built(self):
+        if self.centroids is None:
+            raise RuntimeError('The index was not built'
+                               ' for this {} instance'
+                               .format(self.__class__.__name__))
+
+    def _probe_candidates(self, vector, n_probe):
+        """Collect the vocabulary indices of the closest lists."""
+        n_probe = min(n_probe, self.n_lists)
+
+        centroid_similarities = self.centroids @ vector
+        probed_lists = np.argpartition(-centroid_similarities,
+                                       n_probe - 1)[:n_probe]
+
+        starts = self.list_offsets[probed_lists]
+        ends = self.list_offsets[probed_lists + 1]
+
+        return np.concatenate([self.list_indices[start:end]
+                               for start, end in zip(starts, ends)])
+
+    def most_similar(self, vector, num_neighbors, n_probe=None,
+                     restrict_vocab=None):
+        """Find the approximate top-N most similar words to a vector.
+
+        :param vector: Query vector.
+        :param int num_neighbors: Number of top-N similar words to return.
+        :param int n_probe: Number of the closest lists to scan.
+                            By default, the one of the index.
+        :param int restrict_vocab: Optional integer which limits the
+                                   range of vectors which are searched
+                                   to the first words of the vocabulary.
+                                   If the probed lists have too few
+                                   of them, more lists are probed.
+        :return: Sequence of (word, similarity).
+        """
+
+        self._is_index_built()
+
+        if n_probe is None:
+            n_probe = self.n_probe
+
+        vector = normalize(np.asarray(vector, dtype=float))
+        vector = vector.astype(self.model.vectors_norm.dtype)
+
+        while True:
+            candidates = self._probe_candidates(vector, n_probe)
+            if restrict_vocab is not None:
+                candidates = candidates[candidates < restrict_vocab]
+
+            if len(candidates) >= num_neighbors or n_probe >= self.n_lists:
+                break
+
+            n_probe *= 2
+
+        num_neighbors = min(num_neighbors, len(candidates))
+        if num_neighbors < 1:
+            return []
+
+        similarities = self.model.vectors_norm[candidates] @ vector
+
+        best = np.argpartition(-similarities,
+                               num_neighbors - 1)[:num_neighbors]
+        best = best[np.argsort(-similarities[best])]
+
+        return [(self.model.index2word[candidates[index]],
+                 float(similarities[index]))
+                for index in best]
+
+    def save(self, fname):
+        """Save the index to disk (as a NumPy ``.npz`` file).
+
+        The model itself is not saved.
+
+        :param str fname: Path to the file.
+        """
+
+        self._is_index_built()
+
+        np.savez(fname,
+                 centroids=self.centroids,
+                 list_offsets=self.list_offsets,
+                 list_indices=self.list_indices,
+                 n_probe=self.n_probe,
+                 vocab_size=len(self.list_indices))
+
+    @classmethod
+    def load(cls, fname, model):
+        """Load an index from disk.
+
+        :param str fname: Path to the file.
+        :param model: The word embedding model
+                      that the index was built from.
+        :return: :class:`IVFIndexer` object.
+        """
+
+        with np.load(fname) as data:
+            if int(data['vocab_size']) != len(model.vocab):
+                raise ValueError('The index was built on a vocabulary'
+                                 ' of size {}, but the model vocabulary'
+                                 ' is of size {}.'
+                                 .format(int(data['vocab_size']),
+                                         len(model.vocab)))
+
+            indexer = cls(n_probe=int(data['n_probe']))
+            indexer.model = model
+            indexer.centroids = data['centroids']
+            indexer.list_offsets = data['list_offsets']
+            indexer.list_indices = data['list_indices']
+
+        model.init_sims()
+
+        return indexer
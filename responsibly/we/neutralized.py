@@ -0,0 +1,264 @@
+"""
+Virtually neutralized view of a word embedding.
+
+Neutralizing (the first step of the hard debiasing)
+projects out the direction (or the subspace) of the bias
+from the vectors of the neutral words.
+This is a low-rank correction of a subset of the rows,
+so instead of rewriting the vectors, it can be applied on the fly.
+
+:class:`NeutralizedKeyedVectors` wraps a model and serves the neutralized
+vectors, similarities and most similar words,
+while the vectors of the model are neither changed nor copied
+(e.g., a memory-mapped model stays memory-mapped).
+Only the coordinates of the normalized vectors in the bias subspace
+are kept, i.e., ``k`` numbers per word.
+
+The results are the same as of
+:meth:`~responsibly.we.bias.BiasWordEmbedding.debias`
+with ``method='neutralize'``: the neutral words are neutralized,
+and all the vectors are normalized to unit length.
+
+Usage
+~~~~~
+
+.. code:: python
+
+   >>> from responsibly.we import GenderBiasWE, load_w2v_small
+   >>> from responsibly.we.neutralized import NeutralizedKeyedVectors
+   >>> w2v_small = load_w2v_small()
+   >>> w2v_small_gender_bias_we = GenderBiasWE(w2v_small)
+   >>> neutralized = (NeutralizedKeyedVectors
+   ...                .from_bias_word_embedding(w2v_small_gender_bias_we))
+   >>> neutralized.most_similar('nurse', topn=3)
+   [('nurse', 1.0), ('registered_nurse', 0.7...), ('nurses', 0.7...)]
+   >>> neutralized.similarity('nurse', 'doctor')
+   0.65...
+
+"""
+
+import gensim
+import numpy as np
+
+from responsibly.we.utils import (
+    VECTORS_CHUNK_SIZE, _as_basis, _calc_most_similar_query,
+    assert_gensim_keyed_vectors, get_word_indices,
+)
+
+
+class NeutralizedKeyedVectors:
+    """Neutralized view of a word embedding model, computed on the fly.
+
+    :param model: Word embedding model of ``gensim.model.KeyedVectors``.
+    :param direction: Direction vector to neutralize on,
+                      or a k x d orthonormal basis matrix
+                      of a subspace.
+    :param neutral_indices: Array of the vocabulary indices
+                            of the neutral words.
+    :param int chunk_size: Number of vectors to process at once.
+    """
+
+    def __init__(self, model, direction, neutral_indices,
+                 chunk_size=VECTORS_CHUNK_SIZE):
+        assert_gensim_keyed_vectors(model)
+
+        self.model = model
+        self.basis = _as_basis(np.asarray(direction, dtype=float))
+        self.chunk_size = chunk_size
+
+        self.neutral_mask = np.zeros(len(model.vectors), dtype=bool)
+        self.neutral_mask[neutral_indices] = True
+
+        # per row: the norm of the vector,
+        # and the coordinates of the normalized vector in the subspace
+        self._norms = np.empty(len(model.vectors))
+        self._coordinates = np.empty((len(model.vectors), len(self.basis)))
+
+        for start in range(0, len(model.vectors), chunk_size):
+            chunk = model.vectors[start:start + chunk_size]
+            norms = np.linalg.norm(chunk, axis=1)
+            norms[norms == 0] = 1
+            self._norms[start:start + chunk_size] = norms
+            self._coordinates[start:start + chunk_size] = ((chunk
+                                                            @ self.basis.T)
+                                                           / norms[:, None])
+
+        # norm of the normalized vector after neutralizing
+        # (one for non-neutral words)
+        self._rejected_norms = np.ones(len(model.vectors))
+        self._rejected_norms[self.neutral_mask] = np.sqrt(np.maximum(
+            1 - (self._coordinates[self.neutral_mask] ** 2).sum(axis=1), 0))
+        self._rejected_norms[self._rejected_norms == 0] = 1
+
+    @classmethod
+    def from_bias_word_embedding(cls, bias_word_embedding,
+                                 neutral_words=None):
+        """Create a neutralized view of the model of a bias word embedding.
+
+        :param bias_word_embedding: Bias word embedding object
+                                    with an identified direction
+                                    or subspace.
+        :param list neutral_words: List of neutral words, or an array
+                                   of their vocabulary indices.
+                                   By default, the neutral words of
+                                   the object (e.g., of
+                                   :class:`~responsibly.we.GenderBiasWE`).
+                                   Required for objects without
+                                   pre-defined neutral words.
+        :return: :class:`NeutralizedKeyedVectors` object.
+        """
+        # pylint: disable=protected-access
+
+        if neutral_words is None:
+            if not hasattr(bias_word_embedding, '_neutral_indices'):
+                raise ValueError('neutral_words should be given for'
+                                 ' an instance of {}'
+                                 .format(bias_word_embedding
+                                         .__class__.__name__))
+            neutral_words = bias_word_embedding._neutral_indices
+
+        if (isinstance(neutral_words, np.ndarray)
+                and np.issubdtype(neutral_words.dtype, np.integer)):
+            neutral_indices = neutral_words
+        else:
+            neutral_indices = get_word_indices(bias_word_embedding.model,
+                                               neutral_words)
+
+        return cls(bias_word_embedding.model,
+                   bias_word_embedding._get_subspace_basis(),
+                   neutral_indices)
+
+    @property
+    def vocab(self):
+        return self.model.vocab
+
+    @property
+    def index2word(self):
+        return self.model.index2word
+
+    @property
+    def vector_size(self):
+        return self.model.vector_size
+
+    def __contains__(self, word):
+        return word in self.model.vocab
+
+    def __len__(self):
+        return len(self.model.vocab)
+
+    def __getitem__(self, word):
+        return self.word_vec(word)
+
+    def _get_vectors_by_indices(self, indices):
+        vectors = self.model.vectors[indices].astype(float)
+        vectors /= self._norms[indices, None]
+
+        neutral = np.flatnonzero(self.neutral_mask[indices])
+        neutral_indices = np.asarray(indices)[neutral]
+
+        vectors[neutral] -= self._coordinates[neutral_indices] @ self.basis
+        vectors[neutral] /= self._rejected_norms[neutral_indices, None]
+
+        return vectors
+
+    def word_vec(self, word, use_norm=True):
+        """Get the neutralized vector of a word (of unit length).
+
+        :param str word: The word
+        :param bool use_norm: Ignored, the vectors are always normalized,
+                              as after the in-place neutralizing
+        :return: :class:`numpy.ndarray` of the vector
+        """
+        # pylint: disable=unused-argument
+
+        index = get_word_indices(self.model, [word])
+        return self._get_vectors_by_indices(index)[0]
+
+    def similarity(self, word1, word2):
+        """Compute the cosine similarity between two words.
+
+        :param str word1: First word
+        :param str word2: Second word
+        :return: The cosine similarity
+        """
+
+        vector1, vector2 = self._get_vectors_by_indices(
+            get_word_indices(self.model, [word1, word2]))
+        return float(vector1 @ vector2)
+
+    def cosine_similarities_by_vector(self, vector, restrict_vocab=None):
+        """Compute the cosine similarities of all the words to a vector.
+
+        The similarities are computed with a single pass over
+        the vectors of the model, and the neutralizing correction
+        is applied through the coordinates in the bias subspace.
+
+        :param vector: Query vector of unit length.
+        :param int restrict_vocab: Limit the words to the first ones
+                                   in the vocabulary order.
+        :return: :class:`numpy.ndarray` of the similarities.
+        """
+
+        n_vectors = (len(self.model.vectors) if restrict_vocab is None
+                     else min(restrict_vocab, len(self.model.vectors)))
+
+        # in the dtype of the vectors, so the chunks are not upcast
+        dtype = self.model.vectors.dtype
+        vector = np.asarray(vector, dtype=dtype)
+        basis_vector = self.basis.astype(dtype) @ vector
+
+        similarities = np.empty(n_vectors)
+
+        for start in range(0, n_vectors, self.chunk_size):
+            end = min(start + self.chunk_size, n_vectors)
+            similarities[start:end] = ((self.model.vectors[start:end]
+                                        @ vector)
+                                       / self._norms[start:end])
+
+        # (u - (u B^T) B) . q = u . q - (u B^T) . (B q)
+        similarities[self.neutral_mask[:n_vectors]] -= (
+            self._coordinates[:n_vectors][self.neutral_mask[:n_vectors]]
+            @ basis_vector)
+        similarities /= self._rejected_norms[:n_vectors]
+
+        return similarities
+
+    def most_similar(self, positive=None, negative=None,
+                     topn=10, restrict_vocab=None, unrestricted=True):
+        """Find the top-N most similar words in the neutralized embedding.
+
+        Same as :func:`~responsibly.we.utils.most_similar`.
+
+        :param list positive: List of words that contribute positively.
+        :param list negative: List of words that contribute negatively.
+        :param int topn: Number of top-N similar words to return.
+        :param int restrict_vocab: Optional integer which limits the
+                                   range of vectors
+                                   which are searched for most-similar
+                                   values.
+        :param bool unrestricted: Whether to restricted the most
+                                  similar words to be not from
+                                  the positive or negative word list.
+        :return: Sequence of (word, similarity).
+        """
+        # pylint: disable=too-many-arguments
+
+        if topn is not None and topn < 1:
+            return []
+
+        mean, all_words = _calc_most_similar_query(self, positive, negative)
+
+        dists = self.cosine_similarities_by_vector(mean, restrict_vocab)
+
+        if topn is None:
+            return dists
+
+        best = gensim.matutils.argsort(dists,
+                                       topn=topn + len(all_words),
+                                       reverse=True)
+
+        result = [(self.model.index2word[sim], float(dists[sim]))
+                  for sim in best
+                  if unrestricted or sim not in all_words]
+
+        return result[:topn]
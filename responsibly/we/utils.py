@@ -1,7 +1,13 @@
+import copy
 import math
+import multiprocessing
+import os
+import warnings
+import weakref
+from functools import partial
+from multiprocessing.pool import ThreadPool
 
 import gensim
-import matplotlib.pylab as plt
 import numpy as np
 import pandas as pd
 from six import string_types
@@ -16,6 +22,76 @@ WORD_EMBEDDING_MODEL_TYPES = (gensim.models.keyedvectors.KeyedVectors,
                               gensim.models.word2vec.Word2Vec,
                               gensim.models.base_any2vec.BaseWordEmbeddingsModel,)  # pylint: disable=line-too-long
 
+VECTORS_CHUNK_SIZE = 100000
+MOST_SIMILAR_CHUNK_SIZE = 10000
+EXECUTOR_OPTIONS = ['thread', 'process']
+
+# objects (e.g., models) that are shared with forked worker processes
+# without pickling, keyed by their id
+_SHARED_OBJECTS = {}
+
+# version counters of models, bumped by the in-place updates of this module,
+# for caching results that are computed from the vectors of a model
+_MODEL_VERSIONS = weakref.WeakKeyDictionary()
+
+
+def _run_shared_task(func, shared_key, task):
+    return func(_SHARED_OBJECTS[shared_key], task)
+
+
+def _run_tasks(func, shared, tasks, n_jobs=None, executor='thread'):
+    """Run ``func(shared, task)`` on each task, serially or in parallel.
+
+    The results are in the order of the tasks.
+
+    With the `'process'` executor, the worker processes are forked
+    after the shared object (e.g., the models) is registered
+    in a module-level registry, so it is shared with them
+    instead of being pickled per task. Therefore, ``func``
+    should be picklable (e.g., a module-level function or its partial).
+
+    :param func: Function of the shared object and a task.
+    :param shared: Object that is shared by all the tasks.
+    :param list tasks: The tasks.
+    :param int n_jobs: Number of tasks to run in parallel.
+                       If `-1`, then the number of CPUs is used.
+                       By default, the tasks run serially.
+    :param str executor: Parallelize with threads (`'thread'`)
+                         or with forked processes (`'process'`).
+    :return: List of the results.
+    """
+
+    if executor not in EXECUTOR_OPTIONS:
+        raise ValueError('executor should be one of {}, {} was given'.format(
+            EXECUTOR_OPTIONS, executor))
+
+    if n_jobs == -1:
+        n_jobs = os.cpu_count()
+
+    if n_jobs is None or n_jobs <= 1 or len(tasks) <= 1:
+        return [func(shared, task) for task in tasks]
+
+    n_jobs = min(n_jobs, len(tasks))
+
+    if (executor == 'process'
+            and 'fork' not in multiprocessing.get_all_start_methods()):
+        warnings.warn('Forking processes is not supported on this platform,'
+                      ' using threads instead.')
+        executor = 'thread'
+
+    if executor == 'thread':
+        with ThreadPool(n_jobs) as pool:
+            return pool.map(partial(func, shared), tasks)
+
+    shared_key = id(shared)
+    _SHARED_OBJECTS[shared_key] = shared
+    try:
+        with multiprocessing.get_context('fork').Pool(n_jobs) as pool:
+            return pool.map(partial(_run_shared_task, func, shared_key),
+                            tasks)
+    finally:
+        del _SHARED_OBJECTS[shared_key]
+
 
 def round_to_extreme(value, digits=2):
     place = 10**digits
@@ -84,10 +160,186 @@ def cosine_similarities_by_words(model, word, words):
     return model.cosine_similarities(vec, vecs)
 
 
+def get_word_indices(model, words):
+    """Resolve the vocabulary indices of a sequence of words at once."""
+
+    assert not isinstance(words, string_types), \
+        'The argument `words` should not be a string.'
+
+    try:
+        return np.fromiter((model.vocab[word].index for word in words),
+                           dtype=np.int64)
+    except KeyError as e:
+        raise KeyError("word '{}' not in vocabulary"
+                       .format(e.args[0])) from e
+
+
+def get_words_mask(model, words):
+    """Compute a boolean mask over the vocabulary of a set of words.
+
+    Words that are not in the vocabulary are ignored.
+    """
+
+    mask = np.zeros(len(model.index2word), dtype=bool)
+    mask[[model.vocab[word].index for word in words
+          if word in model.vocab]] = True
+    return mask
+
+
+def _as_basis(direction):
+    """Convert a direction vector or a subspace basis to a basis matrix.
+
+    A 1-D direction is normalized and returned as a 1 x d matrix,
+    and a 2-D (orthonormal) basis is returned as is.
+    """
+    if direction.ndim == 1:
+        return normalize(direction)[None, :]
+    return direction
+
+
+def calc_projections_by_indices(model, indices, direction,
+                                chunk_size=VECTORS_CHUNK_SIZE):
+    """Project the normalized vectors of given indices on a direction.
+
+    The vectors are gathered in chunks, and each chunk is projected
+    with a single matrix product, so the peak memory is bounded
+    by ``chunk_size`` rows.
+
+    :param model: Word embedding model of ``gensim.model.KeyedVectors``.
+    :param indices: Array of vocabulary indices.
+    :param direction: Direction vector to project on,
+                      or a k x d orthonormal basis matrix
+                      of a subspace.
+    :param int chunk_size: Number of vectors to project at once.
+    :return: :class:`numpy.ndarray` of the projection scalars,
+             or of the (n x k) coordinates in the subspace basis.
+    """
+
+    is_normalized = model.vectors_norm is not None
+    vectors = model.vectors_norm if is_normalized else model.vectors
+
+    basis = _as_basis(direction)
+    projections = np.empty((len(indices), len(basis)))
+
+    for start in range(0, len(indices), chunk_size):
+        chunk = vectors[indices[start:start + chunk_size]]
+        chunk_projections = chunk @ basis.T
+        if not is_normalized:
+            chunk_projections /= np.linalg.norm(chunk, axis=1)[:, None]
+        projections[start:start + chunk_size] = chunk_projections
+
+    if direction.ndim == 1:
+        return projections[:, 0]
+
+    return projections
+
+
+def get_model_version(model):
+    """Get the version of a model, the number of its in-place updates.
+
+    Only the updates that are done with the functions of this module
+    are counted.
+    """
+    return _MODEL_VERSIONS.get(model, 0)
+
+
+def bump_model_version(model):
+    """Mark that the vectors of a model were updated in place."""
+    _MODEL_VERSIONS[model] = get_model_version(model) + 1
+
+
 def update_word_vector(model, word, new_vector):
     model.vectors[model.vocab[word].index] = new_vector
     if model.vectors_norm is not None:
         model.vectors_norm[model.vocab[word].index] = normalize(new_vector)
+    bump_model_version(model)
+
+
+def _normalize_rows(matrix):
+    """Normalize in place the rows of a 2-D matrix, skipping zero rows."""
+    norms = np.linalg.norm(matrix, axis=1)
+    norms[norms == 0] = 1
+    matrix /= norms[:, None]
+
+
+def update_word_vectors(model, indices, new_vectors):
+    """Update the vectors of words by their indices at once."""
+    model.vectors[indices] = new_vectors
+    if (model.vectors_norm is not None
+            and model.vectors_norm is not model.vectors):
+        normalized_new_vectors = np.array(new_vectors, dtype=float)
+        _normalize_rows(normalized_new_vectors)
+        model.vectors_norm[indices] = normalized_new_vectors
+    bump_model_version(model)
+
+
+def normalize_model_vectors(model, chunk_size=VECTORS_CHUNK_SIZE):
+    """Normalize in place all the vectors of a model, chunk by chunk.
+
+    Same as ``model.init_sims(replace=True)``, but the peak memory is
+    bounded by ``chunk_size`` rows. Nothing is computed if the model
+    is already normalized in place.
+    """
+
+    if model.vectors_norm is not model.vectors:
+        for start in range(0, len(model.vectors), chunk_size):
+            _normalize_rows(model.vectors[start:start + chunk_size])
+
+        model.vectors_norm = model.vectors
+        bump_model_version(model)
+
+
+def copy_model_vectors(model):
+    """Copy a model with its own vectors, sharing its vocabulary.
+
+    Unlike ``copy.deepcopy``, the vocabulary structures
+    (``vocab`` and ``index2word``) are shared with the original model,
+    and the normalized vectors are copied only if they are not
+    the vectors themselves (i.e., normalized in place).
+    Therefore, the copy takes only the memory of the vectors,
+    and they can be updated without changing the original model.
+
+    :param model: Word embedding model of ``gensim.model.KeyedVectors``.
+    :return: The copy of the model.
+    """
+
+    model_copy = copy.copy(model)
+    model_copy.vectors = model.vectors.copy()
+
+    if model.vectors_norm is model.vectors:
+        model_copy.vectors_norm = model_copy.vectors
+    elif model.vectors_norm is not None:
+        model_copy.vectors_norm = model.vectors_norm.copy()
+
+    return model_copy
+
+
+def neutralize_word_vectors(model, indices, direction,
+                            chunk_size=VECTORS_CHUNK_SIZE):
+    """Neutralize in place the vectors of words by their indices.
+
+    The projection on the direction (or the subspace) is removed
+    as one low-rank update ``V -= (V @ B.T) @ B`` per chunk of rows,
+    and the neutralized vectors are normalized to unit length.
+
+    :param model: Word embedding model of ``gensim.model.KeyedVectors``.
+    :param indices: Array of vocabulary indices to neutralize.
+    :param direction: Direction vector to neutralize on,
+                      or a k x d orthonormal basis matrix
+                      of a subspace.
+    :param int chunk_size: Number of vectors to neutralize at once.
+    """
+
+    basis = _as_basis(direction)
+
+    for start in range(0, len(indices), chunk_size):
+        chunk_indices = indices[start:start + chunk_size]
+        chunk = model.vectors[chunk_indices]
+
+        chunk -= ((chunk @ basis.T) @ basis).astype(chunk.dtype)
+        _normalize_rows(chunk)
+
+        update_word_vectors(model, chunk_indices, chunk)
 
 
 def generate_one_word_forms(word):
@@ -124,50 +376,18 @@ def assert_gensim_keyed_vectors(model):
                                 type(model)))
 
 
-def most_similar(model, positive=None, negative=None,
-                 topn=10, restrict_vocab=None, indexer=None,
-                 unrestricted=True):
-    """
-    Find the top-N most similar words.
-
-    Positive words contribute positively towards the similarity,
-    negative words negatively.
-
-    This function computes cosine similarity between a simple mean
-    of the projection weight vectors of the given words and
-    the vectors for each word in the model.
-    The function corresponds to the `word-analogy` and `distance`
-    scripts in the original word2vec implementation.
-
-    Based on Gensim implementation.
+def _calc_most_similar_query(model, positive, negative):
+    """Calculate the query vector of `most_similar` and its input words.
 
-    :param model: Word embedding model of ``gensim.model.KeyedVectors``.
-    :param list positive: List of words that contribute positively.
-    :param list negative: List of words that contribute negatively.
-    :param int topn: Number of top-N similar words to return.
-    :param int restrict_vocab: Optional integer which limits the
-                               range of vectors
-                               which are searched for most-similar values.
-                               For example, restrict_vocab=10000 would
-                               only check the first 10000 word vectors
-                               in the vocabulary order. (This may be
-                               meaningful if you've sorted the vocabulary
-                               by descending frequency.)
-    :param bool unrestricted: Whether to restricted the most
-                              similar words to be not from
-                              the positive or negative word list.
-    :return: Sequence of (word, similarity).
+    :return: Tuple of the normalized weighted mean vector of the words,
+             and the set of the vocabulary indices of the input words.
     """
-    if topn is not None and topn < 1:
-        return []
 
     if positive is None:
         positive = []
     if negative is None:
         negative = []
 
-    model.init_sims()
-
     if (isinstance(positive, string_types)
             and not negative):
         # allow calls like most_similar('dog'),
@@ -207,8 +427,67 @@ def most_similar(model, positive=None, negative=None,
     mean = gensim.matutils.unitvec(np.array(mean)
                                    .mean(axis=0)).astype(float)
 
+    return mean, all_words
+
+
+def most_similar(model, positive=None, negative=None,
+                 topn=10, restrict_vocab=None, indexer=None,
+                 unrestricted=True):
+    """
+    Find the top-N most similar words.
+
+    Positive words contribute positively towards the similarity,
+    negative words negatively.
+
+    This function computes cosine similarity between a simple mean
+    of the projection weight vectors of the given words and
+    the vectors for each word in the model.
+    The function corresponds to the `word-analogy` and `distance`
+    scripts in the original word2vec implementation.
+
+    Based on Gensim implementation.
+
+    :param model: Word embedding model of ``gensim.model.KeyedVectors``.
+    :param list positive: List of words that contribute positively.
+    :param list negative: List of words that contribute negatively.
+    :param int topn: Number of top-N similar words to return.
+    :param int restrict_vocab: Optional integer which limits the
+                               range of vectors
+                               which are searched for most-similar values.
+                               For example, restrict_vocab=10000 would
+                               only check the first 10000 word vectors
+                               in the vocabulary order. (This may be
+                               meaningful if you've sorted the vocabulary
+                               by descending frequency.)
+    :param indexer: Optional approximate nearest-neighbours index,
+                    such as :class:`~responsibly.we.indexer.IVFIndexer`.
+                    It cannot be used with ``topn=None``.
+    :param bool unrestricted: Whether to restricted the most
+                              similar words to be not from
+                              the positive or negative word list.
+    :return: Sequence of (word, similarity).
+    """
+    if indexer is not None and topn is None:
+        raise ValueError('topn cannot be None together with an indexer.')
+
+    if topn is not None and topn < 1:
+        return []
+
+    model.init_sims()
+
+    mean, all_words = _calc_most_similar_query(model, positive, negative)
+
     if indexer is not None:
-        return indexer.most_similar(mean, topn)
+        neighbors = indexer.most_similar(mean, topn + len(all_words),
+                                         restrict_vocab=restrict_vocab)
+
+        # if not unrestricted, then ignore (don't return)
+        # words from the input
+        result = [(word, similarity)
+                  for word, similarity in neighbors
+                  if unrestricted or model.vocab[word].index not in all_words]
+
+        return result[:topn]
 
     limited = (model.vectors_norm if restrict_vocab is None
                else model.vectors_norm[:restrict_vocab])
@@ -230,6 +509,99 @@ def most_similar(model, positive=None, negative=None,
     return result[:topn]
 
 
+def most_similar_batch(model, queries, topn=10, restrict_vocab=None,
+                       unrestricted=True,
+                       chunk_size=MOST_SIMILAR_CHUNK_SIZE):
+    """
+    Find the top-N most similar words for multiple queries at once.
+
+    Same as :func:`~responsibly.we.utils.most_similar`,
+    but the query vectors are stacked into one matrix,
+    which is multiplied by the normalized vectors of the model
+    chunk by chunk, and the top-N of each query is kept
+    along the way with ``argpartition``.
+
+    :param model: Word embedding model of ``gensim.model.KeyedVectors``.
+    :param list queries: List of queries, each of them is a tuple of
+                         the ``positive`` and ``negative``
+                         arguments of :func:`most_similar`.
+    :param int topn: Number of top-N similar words to return.
+    :param int restrict_vocab: Optional integer which limits the
+                               range of vectors
+                               which are searched for most-similar values.
+    :param bool unrestricted: Whether to restricted the most
+                              similar words to be not from
+                              the positive or negative word list.
+    :param int chunk_size: Number of vocabulary vectors to multiply
+                           by the queries at once.
+    :return: List of sequences of (word, similarity), one per query,
+             or the matrix of all the similarities if ``topn`` is None.
+    """
+    # pylint: disable=too-many-locals
+
+    if not queries or (topn is not None and topn < 1):
+        return [[] for _ in queries]
+
+    model.init_sims()
+
+    means, all_words = [], []
+    for positive, negative in queries:
+        mean, query_words = _calc_most_similar_query(model,
+                                                     positive, negative)
+        means.append(mean)
+        all_words.append(query_words)
+
+    means = np.array(means)
+
+    limited = (model.vectors_norm if restrict_vocab is None
+               else model.vectors_norm[:restrict_vocab])
+
+    if topn is None:
+        dists = np.empty((len(means), len(limited)),
+                         dtype=np.result_type(means, limited))
+        for start in range(0, len(limited), chunk_size):
+            chunk = slice(start, start + chunk_size)
+            dists[:, chunk] = means @ limited[chunk].T
+        return dists
+
+    n_best = min(topn + max((len(words) for words in all_words), default=0),
+                 len(limited))
+
+    best_indices = np.empty((len(means), 0), dtype=np.int64)
+    best_dists = np.empty((len(means), 0))
+
+    for start in range(0, len(limited), chunk_size):
+        chunk = limited[start:start + chunk_size]
+        chunk_dists = means @ chunk.T
+        chunk_indices = np.broadcast_to(start + np.arange(len(chunk)),
+                                        chunk_dists.shape)
+
+        best_dists = np.concatenate([best_dists, chunk_dists], axis=1)
+        best_indices = np.concatenate([best_indices, chunk_indices], axis=1)
+
+        if best_dists.shape[1] > n_best:
+            top = np.argpartition(-best_dists, n_best - 1, axis=1)[:, :n_best]
+            best_dists = np.take_along_axis(best_dists, top, axis=1)
+            best_indices = np.take_along_axis(best_indices, top, axis=1)
+
+    order = np.argsort(-best_dists, axis=1)
+    best_dists = np.take_along_axis(best_dists, order, axis=1)
+    best_indices = np.take_along_axis(best_indices, order, axis=1)
+
+    results = []
+    for query_indices, query_dists, query_words in zip(best_indices,
+                                                       best_dists,
+                                                       all_words):
+        # if not unrestricted, then ignore (don't return)
+        # words from the input
+        result = [(model.index2word[sim], float(dist))
+                  for sim, dist in zip(query_indices, query_dists)
+                  if unrestricted or sim not in query_words]
+        results.append(result[:topn])
+
+    return results
+
+
 def get_seed_vector(seed, bias_word_embedding):
 
     if seed == 'direction':
@@ -253,6 +625,9 @@ def get_seed_vector(seed, bias_word_embedding):
 
 def plot_clustering_as_classification(X, y_true, random_state=1, ax=None):
 
+    # pylint: disable=import-outside-toplevel
+    import matplotlib.pylab as plt
+
     if ax is None:
         _, ax = plt.subplots(figsize=(10, 5))
 
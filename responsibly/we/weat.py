@@ -55,62 +55,81 @@ Stimulus and original finding from:
 import copy
 import random
 import warnings
+from functools import partial
 
 import numpy as np
 import pandas as pd
 from mlxtend.evaluate import permutation_test
+from scipy.stats import beta
 
 from responsibly.consts import RANDOM_STATE
 from responsibly.utils import _warning_setup
-from responsibly.we.data import WEAT_DATA
+from responsibly.we.data import get_weat_data
 from responsibly.we.utils import (
-    assert_gensim_keyed_vectors, cosine_similarities_by_words,
+    _run_tasks, assert_gensim_keyed_vectors, get_word_indices,
 )
 
 
 FILTER_BY_OPTIONS = ['model', 'data']
 RESULTS_DF_COLUMNS = ['Target words', 'Attrib. words',
                       'Nt', 'Na', 's', 'd', 'p']
-PVALUE_METHODS = ['exact', 'approximate']
+PVALUE_METHODS = ['exact', 'approximate', 'subset_sum']
 PVALUE_DEFUALT_METHOD = 'exact'
 ORIGINAL_DF_COLUMNS = ['original_' + key for key in ['N', 'd', 'p']]
 WEAT_WORD_SETS = ['first_target', 'second_target',
                   'first_attribute', 'second_attribute']
 PVALUE_EXACT_WARNING_LEN = 10
-
+PVALUE_DEFAULT_N_PERMUTATIONS = 1000
+PVALUE_DEFAULT_CONFIDENCE_LEVEL = 0.99
+PVALUE_PERMUTATIONS_BATCH_SIZE = 1000
+PVALUE_DEFAULT_SUBSET_SUM_TOLERANCE = 1e-3
+PVALUE_SUBSET_SUM_INITIAL_N_LEVELS = 2 ** 8
+PVALUE_SUBSET_SUM_MAX_N_LEVELS = 2 ** 14
 _warning_setup()
 
 
-def _calc_association_target_attributes(model, target_word,
-                                        first_attribute_words,
-                                        second_attribute_words):
-    # pylint: disable=line-too-long
+def _calc_normalized_vectors(model, words):
+    vectors = model.vectors[get_word_indices(model, words)].astype(float)
+    return vectors / np.linalg.norm(vectors, axis=1)[:, None]
+
+
+def _calc_associations(model, target_words,
+                       first_attribute_words, second_attribute_words):
+    """Calc s(w, A, B) of all the target words at once.
+
+    The cosine similarities between the targets and the attributes
+    are computed as a single matrix product,
+    and the associations are the differences of its row means.
+    """
 
     assert_gensim_keyed_vectors(model)
 
-    with warnings.catch_warnings():
-        warnings.simplefilter('ignore', FutureWarning)
+    target_vectors = _calc_normalized_vectors(model, target_words)
+    attribute_vectors = _calc_normalized_vectors(model,
+                                                 list(first_attribute_words)
+                                                 + list(second_attribute_words))
 
-        first_mean = (cosine_similarities_by_words(model,
-                                                   target_word,
-                                                   first_attribute_words)
-                      .mean())
+    similarities = target_vectors @ attribute_vectors.T
 
-        second_mean = (cosine_similarities_by_words(model,
-                                                    target_word,
-                                                    second_attribute_words)
-                       .mean())
+    n_first_attribute = len(first_attribute_words)
+    return (similarities[:, :n_first_attribute].mean(axis=1)
+            - similarities[:, n_first_attribute:].mean(axis=1))
 
-    return first_mean - second_mean
+
+def _calc_association_target_attributes(model, target_word,
+                                        first_attribute_words,
+                                        second_attribute_words):
+    return _calc_associations(model, [target_word],
+                              first_attribute_words,
+                              second_attribute_words)[0]
 
 
 def _calc_association_all_targets_attributes(model, target_words,
                                              first_attribute_words,
                                              second_attribute_words):
-    return [_calc_association_target_attributes(model, target_word,
-                                                first_attribute_words,
-                                                second_attribute_words)
-            for target_word in target_words]
+    return _calc_associations(model, target_words,
+                              first_attribute_words,
+                              second_attribute_words).tolist()
 
 
 def _calc_weat_score(model,
@@ -127,17 +146,173 @@ def _calc_weat_score(model,
     return sum(first_associations) - sum(second_associations)
 
 
+def _calc_clopper_pearson_interval(n_successes, n_trials, confidence_level):
+    alpha = 1 - confidence_level
+
+    lower = (beta.ppf(alpha / 2, n_successes, n_trials - n_successes + 1)
+             if n_successes > 0 else 0.)
+    upper = (beta.ppf(1 - alpha / 2, n_successes + 1, n_trials - n_successes)
+             if n_successes < n_trials else 1.)
+
+    return lower, upper
+
+
+def _calc_approximate_weat_pvalue(first_associations, second_associations,
+                                  n_permutations=PVALUE_DEFAULT_N_PERMUTATIONS,
+                                  tolerance=None,
+                                  confidence_level=PVALUE_DEFAULT_CONFIDENCE_LEVEL,
+                                  batch_size=PVALUE_PERMUTATIONS_BATCH_SIZE,
+                                  seed=RANDOM_STATE):
+    """Calc the WEAT p-value with a Monte-Carlo permutation test.
+
+    Each batch of permutations is represented as a 0/1 matrix
+    that selects the associations of the first target words,
+    so all the permuted WEAT scores of a batch
+    are computed with a single matrix-vector product.
+
+    If ``tolerance`` is given, the test stops as soon as
+    the Clopper-Pearson confidence interval of the p-value
+    is narrower than it.
+    """
+    # pylint: disable=too-many-arguments,too-many-locals
+
+    associations = np.concatenate([first_associations,
+                                   second_associations]).astype(float)
+    n_first = len(first_associations)
+
+    total = associations.sum()
+    reference_score = 2 * associations[:n_first].sum() - total
+
+    rng = np.random.RandomState(seed)  # pylint: disable=no-member
+
+    n_more_extreme, n_done = 0, 0
+    while n_done < n_permutations:
+        n_batch = min(batch_size, n_permutations - n_done)
+
+        first_positions = (rng.rand(n_batch, len(associations))
+                           .argsort(axis=1)[:, :n_first])
+        selections = np.zeros((n_batch, len(associations)))
+        np.put_along_axis(selections, first_positions, 1, axis=1)
+
+        scores = 2 * (selections @ associations) - total
+
+        # a permuted score that is equal to the reference one
+        # up to floating-point error is not more extreme
+        n_more_extreme += np.count_nonzero(
+            (scores > reference_score)
+            & ~np.isclose(scores, reference_score))
+        n_done += n_batch
+
+        if tolerance is not None:
+            lower, upper = _calc_clopper_pearson_interval(n_more_extreme,
+                                                          n_done,
+                                                          confidence_level)
+            if upper - lower <= tolerance:
+                break
+
+    return n_more_extreme / n_done
+
+
+def _count_subset_sums(values, subset_size):
+    """Count the subsets of a given size by their sum.
+
+    The values are non-negative integers,
+    and the counts are computed with dynamic programming.
+    """
+
+    max_sum = subset_size * values.max()
+
+    # counts[k, s] - number of subsets of size k with sum s
+    counts = np.zeros((subset_size + 1, max_sum + 1))
+    counts[0, 0] = 1
+
+    for value in values:
+        previous_counts = counts[:-1, :max_sum + 1 - value].copy()
+        counts[1:, value:] += previous_counts
+
+    return counts[subset_size]
+
+
+def _calc_subset_sum_weat_pvalue(first_associations, second_associations,
+                                 tolerance=PVALUE_DEFAULT_SUBSET_SUM_TOLERANCE,
+                                 max_n_levels=PVALUE_SUBSET_SUM_MAX_N_LEVELS):
+    """Calc the exact WEAT p-value from the distribution of subset sums.
+
+    The WEAT score of a split of the target words is determined
+    by the sum of the associations that are assigned to the first target.
+    Therefore, the exact permutation test amounts to counting
+    the subsets, of the size of the first target,
+    whose sum is bigger than the reference one.
+
+    The associations are quantized into levels, and the subsets
+    are counted by their quantized sum.
+    The quantization error of a subset sum is at most half a level
+    per association, which bounds the error of the p-value.
+    The number of levels is doubled until the bounds
+    are narrower than ``tolerance``.
+    """
+
+    associations = np.concatenate([first_associations,
+                                   second_associations]).astype(float)
+    n_first = len(first_associations)
+
+    value_range = associations.max() - associations.min()
+    if value_range == 0:
+        return 0.
+
+    n_levels = PVALUE_SUBSET_SUM_INITIAL_N_LEVELS
+    while True:
+        levels = np.rint((associations - associations.min())
+                         / value_range * (n_levels - 1)).astype(int)
+
+        sum_counts = _count_subset_sums(levels, n_first)
+        n_subsets = sum_counts.sum()
+        reference_sum = levels[:n_first].sum()
+
+        pvalue = sum_counts[reference_sum + 1:].sum() / n_subsets
+
+        # the quantization error of the difference between
+        # a subset sum and the reference sum is at most `n_first` levels
+        lower_pvalue = (sum_counts[reference_sum + n_first + 1:].sum()
+                        / n_subsets)
+        upper_pvalue = (sum_counts[max(reference_sum - n_first, 0):].sum()
+                        / n_subsets)
+
+        if upper_pvalue - lower_pvalue <= tolerance:
+            break
+
+        if n_levels >= max_n_levels:
+            warnings.warn('The error bound of the subset-sum p-value'
+                          ' is {:.1e}, bigger than the tolerance {:.1e}.'
+                          ' Consider increasing max_n_levels.'
+                          .format(upper_pvalue - lower_pvalue, tolerance))
+            break
+
+        n_levels *= 2
+
+    return pvalue
+
+
 def _calc_weat_pvalue(first_associations, second_associations,
-                      method=PVALUE_DEFUALT_METHOD):
+                      method=PVALUE_DEFUALT_METHOD, **kwargs):
 
     if method not in PVALUE_METHODS:
         raise ValueError('method should be one of {}, {} was given'.format(
             PVALUE_METHODS, method))
 
+    if method == 'approximate':
+        return _calc_approximate_weat_pvalue(first_associations,
+                                             second_associations,
+                                             **kwargs)
+
+    if method == 'subset_sum':
+        return _calc_subset_sum_weat_pvalue(first_associations,
+                                            second_associations,
+                                            **kwargs)
+
     pvalue = permutation_test(first_associations, second_associations,
                               func=lambda x, y: sum(x) - sum(y),
-                              method=method,
-                              seed=RANDOM_STATE)  # if exact - no meaning
+                              method=method)
     return pvalue
 
 
@@ -148,17 +323,18 @@ def _calc_weat_associations(model,
     assert len(first_target_words) == len(second_target_words)
     assert len(first_attribute_words) == len(second_attribute_words)
 
-    first_associations = _calc_association_all_targets_attributes(model,
-                                                                  first_target_words,
-                                                                  first_attribute_words,
-                                                                  second_attribute_words)
+    if not first_target_words:
+        return [], []
 
-    second_associations = _calc_association_all_targets_attributes(model,
-                                                                   second_target_words,
-                                                                   first_attribute_words,
-                                                                   second_attribute_words)
+    associations = _calc_associations(model,
+                                      list(first_target_words)
+                                      + list(second_target_words),
+                                      first_attribute_words,
+                                      second_attribute_words)
 
-    return first_associations, second_associations
+    n_first_target = len(first_target_words)
+    return (associations[:n_first_target].tolist(),
+            associations[n_first_target:].tolist())
 
 
 def _filter_by_data_weat_stimuli(stimuli):
@@ -242,6 +418,18 @@ def calc_single_weat(model,
     :param dict second_attribute: Second attribute words list and its name
     :param bool with_pvalue: Whether to calculate the p-value of the
                              WEAT score (might be computationally expensive)
+    :param dict pvalue_kwargs: Keyword arguments of the p-value computation.
+                               The `method` is `'exact'` (default),
+                               `'approximate'` or `'subset_sum'`.
+                               The `'approximate'` method
+                               accepts `n_permutations`, `seed`,
+                               `batch_size`, and `tolerance`
+                               with `confidence_level` for early stopping
+                               by the confidence interval of the p-value.
+                               The `'subset_sum'` method computes
+                               the exact p-value up to an error bound
+                               of `tolerance`, and is feasible
+                               for big word sets.
     :return: WEAT result (score, size effect, Nt, Na and p-value)
     """
 
@@ -280,6 +468,32 @@ def calc_single_weat(model,
             'Na': '{}x2'.format(len(first_attribute['words']))}
 
 
+def _calc_weat_task(models, task, with_pvalue, pvalue_kwargs):
+    model_index, stimuli = task
+    return calc_single_weat(models[model_index],
+                            stimuli['first_target'],
+                            stimuli['second_target'],
+                            stimuli['first_attribute'],
+                            stimuli['second_attribute'],
+                            with_pvalue, pvalue_kwargs)
+
+
+def _calc_weat_tasks(models, tasks, with_pvalue, pvalue_kwargs,
+                     n_jobs=None, executor='thread'):
+    """Calc the WEAT results of (model index, stimuli) tasks.
+
+    The results are in the order of the tasks.
+    The models are shared by the workers without copying them,
+    see :func:`~responsibly.we.utils._run_tasks`.
+    """
+    # pylint: disable=too-many-arguments
+
+    return _run_tasks(partial(_calc_weat_task,
+                              with_pvalue=with_pvalue,
+                              pvalue_kwargs=pvalue_kwargs),
+                      models, tasks, n_jobs, executor)
+
+
 def calc_weat_pleasant_unpleasant_attribute(model,
                                             first_target, second_target,
                                             with_pvalue=True, pvalue_kwargs=None):
@@ -294,8 +508,8 @@ def calc_weat_pleasant_unpleasant_attribute(model,
     :return: WEAT result (score, size effect, Nt, Na and p-value)
     """
 
-    weat_data = {'first_attribute': copy.deepcopy(WEAT_DATA[0]['first_attribute']),
-                 'second_attribute': copy.deepcopy(WEAT_DATA[0]['second_attribute']),
+    weat_data = {'first_attribute': copy.deepcopy(get_weat_data()[0]['first_attribute']),
+                 'second_attribute': copy.deepcopy(get_weat_data()[0]['second_attribute']),
                  'first_target': first_target,
                  'second_target': second_target}
 
@@ -309,54 +523,32 @@ def calc_weat_pleasant_unpleasant_attribute(model,
                             with_pvalue=with_pvalue, pvalue_kwargs=pvalue_kwargs)
 
 
-def calc_all_weat(model, weat_data='caliskan', filter_by='model',
-                  with_original_finding=False,
-                  with_pvalue=True, pvalue_kwargs=None):
-    """
-    Calc the WEAT results of a word embedding on multiple cases.
-
-    Note that for the effect size and pvalue in the WEAT have
-    entirely different meaning from those reported in IATs (original finding).
-    Refer to the paper for more details.
-
-    :param model: Word embedding model of ``gensim.model.KeyedVectors``
-    :param dict weat_data: WEAT cases data.
-                           - If `'caliskan'` (default) then all
-                              the experiments from the original will be used.
-                           - If an interger, then the specific experiment by index
-                             from the original paper will be used.
-                           - If a interger, then tje specific experiments by indices
-                             from the original paper will be used.
-
-    :param bool filter_by: Whether to filter the word lists
-                           by the `model` (`'model'`)
-                           or by the `remove` key in `weat_data` (`'data'`).
-    :param bool with_original_finding: Show the origina
-    :param bool with_pvalue: Whether to calculate the p-value of the
-                             WEAT results (might be computationally expensive)
-    :return: :class:`pandas.DataFrame` of WEAT results
-             (score, size effect, Nt, Na and p-value)
-    """
-
+def _resolve_weat_data(weat_data):
     if weat_data == 'caliskan':
-        weat_data = WEAT_DATA
+        weat_data = get_weat_data()
     elif isinstance(weat_data, int):
         index = weat_data
-        weat_data = WEAT_DATA[index:index + 1]
+        weat_data = get_weat_data()[index:index + 1]
     elif isinstance(weat_data, tuple):
-        weat_data = [WEAT_DATA[index] for index in weat_data]
+        weat_data = [get_weat_data()[index] for index in weat_data]
+    return weat_data
 
+
+def _warn_exact_pvalue(weat_data, pvalue_kwargs):
     if (not pvalue_kwargs
-            or pvalue_kwargs['method'] == PVALUE_DEFUALT_METHOD):
+            or pvalue_kwargs.get('method',
+                                 PVALUE_DEFUALT_METHOD) == 'exact'):
         max_word_set_len = max(len(stimuli[ws]['words'])
                                for stimuli in weat_data
                                for ws in WEAT_WORD_SETS)
         if max_word_set_len > PVALUE_EXACT_WARNING_LEN:
             warnings.warn('At least one stimuli has a word set bigger'
                           ' than {}, and the computation might take a while.'
-                          ' Consider using \'exact\' as method'
-                          ' for pvalue_kwargs.'.format(PVALUE_EXACT_WARNING_LEN))
+                          ' Consider using \'subset_sum\' or \'approximate\''
+                          ' as method for pvalue_kwargs.'.format(PVALUE_EXACT_WARNING_LEN))
+
 
+def _filter_model_weat_data(weat_data, model, filter_by):
     actual_weat_data = copy.deepcopy(weat_data)
 
     _filter_weat_data(actual_weat_data,
@@ -367,15 +559,13 @@ def calc_all_weat(model, weat_data='caliskan', filter_by='model',
         warnings.warn('Given weat_data was filterd by {}.'
                       .format(filter_by))
 
-    results = []
-    for stimuli in actual_weat_data:
-        result = calc_single_weat(model,
-                                  stimuli['first_target'],
-                                  stimuli['second_target'],
-                                  stimuli['first_attribute'],
-                                  stimuli['second_attribute'],
-                                  with_pvalue, pvalue_kwargs)
+    return actual_weat_data
 
+
+def _build_weat_results_df(actual_weat_data, single_results,
+                           with_original_finding, with_pvalue):
+    results = []
+    for stimuli, result in zip(actual_weat_data, single_results):
         # TODO: refactor - check before if one group is without words
         # because of the filtering
         if not all(group['words'] for group in stimuli.values()
@@ -409,3 +599,110 @@ def calc_all_weat(model, weat_data='caliskan', filter_by='model',
     results_df = results_df.round(4)
 
     return results_df
+
+
+def calc_all_weat(model, weat_data='caliskan', filter_by='model',
+                  with_original_finding=False,
+                  with_pvalue=True, pvalue_kwargs=None,
+                  n_jobs=None, executor='thread'):
+    """
+    Calc the WEAT results of a word embedding on multiple cases.
+
+    Note that for the effect size and pvalue in the WEAT have
+    entirely different meaning from those reported in IATs (original finding).
+    Refer to the paper for more details.
+
+    :param model: Word embedding model of ``gensim.model.KeyedVectors``
+    :param dict weat_data: WEAT cases data.
+                           - If `'caliskan'` (default) then all
+                              the experiments from the original will be used.
+                           - If an interger, then the specific experiment by index
+                             from the original paper will be used.
+                           - If a interger, then tje specific experiments by indices
+                             from the original paper will be used.
+
+    :param bool filter_by: Whether to filter the word lists
+                           by the `model` (`'model'`)
+                           or by the `remove` key in `weat_data` (`'data'`).
+    :param bool with_original_finding: Show the origina
+    :param bool with_pvalue: Whether to calculate the p-value of the
+                             WEAT results (might be computationally expensive)
+    :param int n_jobs: Number of stimuli to calculate in parallel.
+                       If `-1`, then the number of CPUs is used.
+                       By default, the calculation is serial.
+    :param str executor: Parallelize with threads (`'thread'`)
+                         or with forked processes (`'process'`),
+                         which share the model without copying it.
+    :return: :class:`pandas.DataFrame` of WEAT results
+             (score, size effect, Nt, Na and p-value)
+    """
+    # pylint: disable=too-many-arguments
+
+    return calc_all_weat_models([model], weat_data, filter_by,
+                                with_original_finding,
+                                with_pvalue, pvalue_kwargs,
+                                n_jobs, executor)[0]
+
+
+def calc_all_weat_models(models, weat_data='caliskan', filter_by='model',
+                         with_original_finding=False,
+                         with_pvalue=True, pvalue_kwargs=None,
+                         n_jobs=None, executor='thread'):
+    """
+    Calc the WEAT results of multiple word embeddings on multiple cases.
+
+    The same as :func:`calc_all_weat` for each model,
+    but all the (model, stimuli) pairs are calculated
+    together, so they are spread across the parallel workers.
+
+    :param list models: Word embedding models of
+                        ``gensim.model.KeyedVectors``
+    :param dict weat_data: WEAT cases data, see :func:`calc_all_weat`.
+    :param bool filter_by: Whether to filter the word lists
+                           by the `model` (`'model'`)
+                           or by the `remove` key in `weat_data` (`'data'`).
+    :param bool with_original_finding: Show the origina
+    :param bool with_pvalue: Whether to calculate the p-value of the
+                             WEAT results (might be computationally expensive)
+    :param int n_jobs: Number of (model, stimuli) pairs
+                       to calculate in parallel.
+                       If `-1`, then the number of CPUs is used.
+                       By default, the calculation is serial.
+    :param str executor: Parallelize with threads (`'thread'`)
+                         or with forked processes (`'process'`),
+                         which share the models without copying them.
+    :return: List of :class:`pandas.DataFrame` of WEAT results
+             (score, size effect, Nt, Na and p-value),
+             in the order of the models
+    """
+    # pylint: disable=too-many-arguments
+
+    weat_data = _resolve_weat_data(weat_data)
+
+    _warn_exact_pvalue(weat_data, pvalue_kwargs)
+
+    actual_weat_data_by_model = [_filter_model_weat_data(weat_data,
+                                                         model,
+                                                         filter_by)
+                                 for model in models]
+
+    tasks = [(model_index, stimuli)
+             for model_index, actual_weat_data
+             in enumerate(actual_weat_data_by_model)
+             for stimuli in actual_weat_data]
+
+    single_results = _calc_weat_tasks(models, tasks,
+                                      with_pvalue, pvalue_kwargs,
+                                      n_jobs, executor)
+
+    results_dfs = []
+    start = 0
+    for actual_weat_data in actual_weat_data_by_model:
+        end = start + len(actual_weat_data)
+        results_dfs.append(_build_weat_results_df(actual_weat_data,
+                                                  single_results[start:end],
+                                                  with_original_finding,
+                                                  with_pvalue))
+        start = end
+
+    return results_dfs
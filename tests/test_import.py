@@ -0,0 +1,79 @@
+"""Import-time regression tests of the package."""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+
+PACKAGE_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEAVY_MODULES = ['gensim', 'matplotlib', 'seaborn', 'sklearn',
+                 'mlxtend', 'pandas', 'scipy']
+PLOTTING_MODULES = ['matplotlib', 'seaborn']
+
+
+LAZY_IMPORT_REQUIRED = pytest.mark.skipif(
+    sys.version_info < (3, 7),
+    reason='-X importtime and PEP 562 are supported only since Python 3.7')
+
+
+def _run_python(statement, *options):
+    """Run a statement in a fresh interpreter, and return its stderr."""
+
+    # the package root is prepended to the existing path
+    python_path = os.pathsep.join(filter(None,
+                                         [PACKAGE_ROOT,
+                                          os.environ.get('PYTHONPATH')]))
+    env = dict(os.environ, PYTHONPATH=python_path)
+    result = subprocess.run([sys.executable] + list(options)
+                            + ['-c', statement],
+                            cwd=PACKAGE_ROOT, env=env,
+                            stderr=subprocess.PIPE,
+                            universal_newlines=True,
+                            check=True)
+    return result.stderr
+
+
+def _import_modules(statement):
+    """Run an import in a fresh interpreter with ``-X importtime``.
+
+    Return the top-level names of all the imported modules.
+    """
+
+    stderr = _run_python(statement, '-X', 'importtime')
+
+    # lines are formatted as:
+    # import time: self [us] | cumulative | imported package
+    return {line.rsplit('|', 1)[1].strip().split('.')[0]
+            for line in stderr.splitlines()
+            if line.startswith('import time:') and '|' in line}
+
+
+@LAZY_IMPORT_REQUIRED
+def test_import_responsibly_is_lazy():
+    imported_modules = _import_modules('import responsibly')
+
+    for module in HEAVY_MODULES:
+        assert module not in imported_modules
+
+
+@LAZY_IMPORT_REQUIRED
+@pytest.mark.parametrize('statement', ['import responsibly.fairness.metrics',
+                                       'import responsibly.we'])
+def test_import_without_plotting(statement):
+    imported_modules = _import_modules(statement)
+
+    for module in PLOTTING_MODULES:
+        assert module not in imported_modules
+
+
+@pytest.mark.skipif(sys.version_info >= (3, 7),
+                    reason='the subpackages are imported lazily')
+def test_import_responsibly_is_eager():
+    """Test the subpackages are imported up front before Python 3.7."""
+    _run_python('import sys, responsibly\n'
+                'assert "responsibly.fairness" in sys.modules\n'
+                'assert "responsibly.we" in sys.modules\n'
+                'assert responsibly.we.BiasWordEmbedding')